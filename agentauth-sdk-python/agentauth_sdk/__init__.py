@@ -17,16 +17,49 @@ Example usage:
     ... )
 """
 
-__version__ = "0.7.0"
+__version__ = "0.8.0"
 
 from .client import AgentAuthClient
-from .permissions import Permissions, Permission
+from .bundles import (
+    BundleExport,
+    BundleImportReport,
+    BundleImportResult,
+    bundle_signature,
+    read_bundle,
+    verify_bundle,
+)
+from .cache import CacheBackend, CacheEntry, MemoryCache, SQLiteCache
+from .commitments import (
+    CommitmentManager,
+    CommitmentStore,
+    FileCommitmentStore,
+    InMemoryCommitmentStore,
+    StoredCommitment,
+)
+from .directory import AgentDirectory
+from .drift import MetricRingBuffer, SpikeDetector, calculate_drift_score
+from .monitor import DriftMonitor
+from .groth16 import Groth16Verifier
+from .hedge import HedgePolicy, HedgeStats
+from .offload import OffloadStats, Offloader
+from .permissions import Permissions, Permission, permission_covers, covering_permissions
+from .permission_bits import PermissionRegistry, PermissionMatrix
+from .persona import diff_personas, render_prompt
+from .shared_cache import SharedClaimsCache
+from .signing import PingSigner, canonical_json, sign_persona
+from .spool import PingSpool
+from .tokens import AuthenticatedAgent, TokenVerifier
+from .webhooks import WebhookDeliverySync, WebhookReceiver, WebhookVerifier
+from .zkp import VerificationCache, compute_preimage_hash
 from .types import (
     Agent,
     RegisterAgentRequest,
     VerifyAgentRequest,
     RefreshTokenRequest,
     Webhook,
+    WebhookEvent,
+    WebhookDelivery,
+    WebhookDeliveriesResponse,
     ActivityLog,
     # Persona types
     Persona,
@@ -34,6 +67,7 @@ from .types import (
     PersonaConstraints,
     PersonaGuardrails,
     PersonaResponse,
+    PersonaChange,
     PersonaVerifyResponse,
     PersonaHistoryEntry,
     PersonaHistoryResponse,
@@ -51,21 +85,73 @@ from .types import (
     DriftHistoryEntry,
     DriftHistoryResponse,
     DriftConfig,
+    DriftStatusChange,
+    # Session types
+    AgentSession,
     # Custom errors
     PersonaValidationError,
     DriftThresholdError,
     ZKPVerificationError,
+    BundleSignatureError,
+    SpoolFullError,
+    TokenVerificationError,
 )
 
 __all__ = [
     "AgentAuthClient",
+    "BundleExport",
+    "BundleImportReport",
+    "BundleImportResult",
+    "bundle_signature",
+    "read_bundle",
+    "verify_bundle",
+    "CacheBackend",
+    "CacheEntry",
+    "MemoryCache",
+    "SQLiteCache",
+    "CommitmentManager",
+    "CommitmentStore",
+    "FileCommitmentStore",
+    "InMemoryCommitmentStore",
+    "StoredCommitment",
+    "AgentDirectory",
+    "MetricRingBuffer",
+    "SpikeDetector",
+    "calculate_drift_score",
+    "DriftMonitor",
+    "Groth16Verifier",
+    "HedgePolicy",
+    "HedgeStats",
+    "Offloader",
+    "OffloadStats",
     "Permissions",
     "Permission",
+    "permission_covers",
+    "covering_permissions",
+    "PermissionRegistry",
+    "PermissionMatrix",
+    "diff_personas",
+    "render_prompt",
+    "SharedClaimsCache",
+    "PingSigner",
+    "PingSpool",
+    "AuthenticatedAgent",
+    "TokenVerifier",
+    "canonical_json",
+    "sign_persona",
+    "WebhookDeliverySync",
+    "WebhookReceiver",
+    "WebhookVerifier",
+    "VerificationCache",
+    "compute_preimage_hash",
     "Agent",
     "RegisterAgentRequest",
     "VerifyAgentRequest",
     "RefreshTokenRequest",
     "Webhook",
+    "WebhookEvent",
+    "WebhookDelivery",
+    "WebhookDeliveriesResponse",
     "ActivityLog",
     # Persona
     "Persona",
@@ -73,6 +159,7 @@ __all__ = [
     "PersonaConstraints",
     "PersonaGuardrails",
     "PersonaResponse",
+    "PersonaChange",
     "PersonaVerifyResponse",
     "PersonaHistoryEntry",
     "PersonaHistoryResponse",
@@ -90,8 +177,14 @@ __all__ = [
     "DriftHistoryEntry",
     "DriftHistoryResponse",
     "DriftConfig",
+    "DriftStatusChange",
+    # Session
+    "AgentSession",
     # Errors
     "PersonaValidationError",
     "DriftThresholdError",
     "ZKPVerificationError",
+    "BundleSignatureError",
+    "SpoolFullError",
+    "TokenVerificationError",
 ]
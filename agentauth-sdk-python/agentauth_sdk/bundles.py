@@ -0,0 +1,234 @@
+"""Persona bundle export and import helpers for AgentAuth SDK"""
+
+import hashlib
+import hmac
+import io
+import json
+import mmap
+import os
+import re
+import zipfile
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, List, Optional, Protocol, Union
+
+from .signing import canonical_json
+from .types import BundleSignatureError
+
+# Bytes read from the network or disk at a time
+BUNDLE_CHUNK_SIZE = 64 * 1024
+
+# Members of a bundle ZIP written by the server's exportPersona
+BUNDLE_MEMBER = "persona.json"
+SIGNATURE_MEMBER = "signature.txt"
+
+# Largest persona.json (uncompressed) read from a bundle
+MAX_BUNDLE_SIZE = 64 * 1024 * 1024
+
+_SIGNATURE = re.compile(r"[0-9a-f]{64}")
+
+BundleSource = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+class _Readable(Protocol):
+    """Seekable binary reader, as accepted by ``zipfile.ZipFile``"""
+
+    def read(self, size: int = -1) -> bytes: ...
+
+    def seek(self, offset: int, whence: int = ...) -> int: ...
+
+    def tell(self) -> int: ...
+
+
+@dataclass
+class BundleExport:
+    """Result of a streamed persona export"""
+
+    agent_id: str
+    signature: Optional[str]
+    bytes_written: int
+    sha256: str
+    path: Optional[str] = None
+    resumed: int = 0
+    verified: bool = False
+
+
+@dataclass
+class BundleImportResult:
+    """Outcome of importing one bundle file"""
+
+    path: str
+    agent_id: Optional[str] = None
+    persona_version: Optional[str] = None
+    persona_hash: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the bundle was imported"""
+        return self.error is None
+
+
+@dataclass
+class BundleImportReport:
+    """Per-bundle results of a directory import, in file name order"""
+
+    results: List[BundleImportResult] = field(default_factory=list)
+
+    @property
+    def imported(self) -> int:
+        """Number of bundles imported"""
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def failed(self) -> List[BundleImportResult]:
+        """Results of bundles that were not imported"""
+        return [result for result in self.results if not result.ok]
+
+
+def bundle_signature(bundle: Dict[str, Any]) -> str:
+    """
+    Compute a bundle signature exactly as the server's ``exportPersona``
+
+    Args:
+        bundle: Bundle contents (a ``signature`` key, if present, is excluded)
+
+    Returns:
+        Hex SHA-256 of the canonical bundle JSON
+    """
+    if "signature" in bundle:
+        bundle = {key: value for key, value in bundle.items() if key != "signature"}
+    return hashlib.sha256(canonical_json(bundle).encode("utf-8")).hexdigest()
+
+
+def verify_bundle(bundle: Dict[str, Any], signature: Optional[str] = None) -> str:
+    """
+    Check a bundle against its signature
+
+    Args:
+        bundle: Bundle contents
+        signature: Expected signature (default: ``bundle["signature"]``)
+
+    Returns:
+        The verified signature
+
+    Raises:
+        BundleSignatureError: If the signature is missing or does not match
+    """
+    expected = signature if signature is not None else bundle.get("signature")
+    if not expected:
+        raise BundleSignatureError("Bundle has no signature")
+    actual = bundle_signature(bundle)
+    if not hmac.compare_digest(actual, str(expected)):
+        raise BundleSignatureError(
+            "Bundle signature verification failed — possible tampering",
+            expected=str(expected),
+            actual=actual,
+        )
+    return actual
+
+
+class _MappedFile(io.RawIOBase):
+    """Read-only file view of an mmap (``mmap`` lacks ``seekable`` before 3.13)"""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._mapped.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._mapped.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._mapped.tell()
+        elif whence == io.SEEK_END:
+            offset += len(self._mapped)
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+        try:
+            self._mapped.seek(offset)
+        except ValueError as e:  # real files raise OSError, which zipfile handles
+            raise OSError(str(e)) from e
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
+
+def read_bundle(
+    source: BundleSource,
+    verify: bool = True,
+    max_size: int = MAX_BUNDLE_SIZE,
+) -> Dict[str, Any]:
+    """
+    Read a bundle ZIP exported by ``export_persona``
+
+    Paths are memory-mapped rather than read into memory. The ZIP directory and
+    ``signature.txt`` are validated first (members present, ``persona.json``
+    within ``max_size``, well-formed signature), so a wrong or oversized file is
+    rejected before ``persona.json`` is decompressed and parsed.
+
+    Args:
+        source: ZIP file path or readable, seekable binary file
+        verify: Check the bundle against ``signature.txt``
+        max_size: Largest uncompressed ``persona.json`` accepted, in bytes
+
+    Returns:
+        Bundle dict with ``signature`` set, ready for ``import_persona``
+
+    Raises:
+        BundleSignatureError: If ``verify`` and the signature does not match
+        ValueError: If the file is not a persona bundle or is too large
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise ValueError(f"Not a persona bundle: {e}") from e
+            with mapped:
+                return _read_bundle(_MappedFile(mapped), verify, max_size)
+    return _read_bundle(source, verify, max_size)
+
+
+def _read_bundle(source: _Readable, verify: bool, max_size: int) -> Dict[str, Any]:
+    try:
+        with zipfile.ZipFile(source) as archive:
+            try:
+                info = archive.getinfo(BUNDLE_MEMBER)
+                signature_info = archive.getinfo(SIGNATURE_MEMBER)
+            except KeyError:
+                raise ValueError(
+                    f"Not a persona bundle: expected {BUNDLE_MEMBER} and {SIGNATURE_MEMBER}"
+                ) from None
+            if info.file_size > max_size:
+                raise ValueError(
+                    f"{BUNDLE_MEMBER} is {info.file_size} bytes, over the {max_size} byte limit"
+                )
+            if signature_info.file_size > 256:
+                raise ValueError(f"Not a persona bundle: {SIGNATURE_MEMBER} is too large")
+
+            signature = archive.read(signature_info).decode("ascii", "replace").strip()
+            if not _SIGNATURE.fullmatch(signature):
+                raise ValueError(f"Not a persona bundle: malformed {SIGNATURE_MEMBER}")
+
+            with archive.open(info) as member:
+                bundle = json.load(io.TextIOWrapper(member, encoding="utf-8"))
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Not a persona bundle: {e}") from e
+
+    if not isinstance(bundle, dict):
+        raise ValueError(f"Not a persona bundle: {BUNDLE_MEMBER} is not an object")
+    if verify:
+        verify_bundle(bundle, signature)
+    bundle["signature"] = signature
+    return bundle
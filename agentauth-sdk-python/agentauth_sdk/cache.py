@@ -0,0 +1,229 @@
+"""Response caching for AgentAuth SDK"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class CacheEntry:
+    """Cached API payload with expiry and optional ETag"""
+
+    value: Any
+    expires_at: float
+    etag: Optional[str] = None
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the entry is still within its TTL"""
+        return (time.time() if now is None else now) < self.expires_at
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface for client-side caches.
+
+    Values are plain JSON-compatible payloads (the decoded API response), so any
+    backend can persist them. ``get`` also returns expired entries; callers check
+    :meth:`CacheEntry.fresh` and may revalidate stale entries with their ETag.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry, fresh or stale"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float, etag: Optional[str] = None) -> None:
+        """Store a payload for ``ttl`` seconds"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove an entry, returning whether it existed"""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove all entries whose key starts with ``prefix``"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries"""
+
+    def get_fresh(self, key: str) -> Optional[Any]:
+        """Get a payload only if it has not expired"""
+        entry = self.get(key)
+        if entry is not None and entry.fresh():
+            return entry.value
+        return None
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache.
+
+    Example:
+        >>> cache = MemoryCache(max_entries=10_000)
+        >>> cache.set("drift_config:agt_abc123", {...}, ttl=300)
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: Any, ttl: float, etag: Optional[str] = None) -> None:
+        self._entries[key] = CacheEntry(value=value, expires_at=time.time() + ttl, etag=etag)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache in a SQLite database, for warm starts.
+
+    Entries keep their ETag and expiry across restarts, so a new worker serves
+    personas, agents and drift configs from disk immediately and revalidates
+    stale entries with conditional requests instead of refetching everything.
+    Entries are read on demand rather than loaded up front. Several processes
+    may share one database file (WAL mode).
+
+    Like every cache backend, its methods are synchronous and run on the
+    event loop. Lookups and writes are single indexed statements, but every
+    ``EVICT_EVERY`` sets a ``COUNT(*)`` and ``DELETE`` enforce
+    ``max_entries``, which scans the table; keep ``max_entries`` moderate
+    (the default 100000 takes a few milliseconds) or use the in-memory cache
+    where loop latency matters more than warm starts.
+
+    Example:
+        >>> cache = SQLiteCache("/var/cache/myservice/agentauth.db")
+        >>> client = AgentAuthClient(base_url, cache=cache, stale_while_revalidate=3600)
+    """
+
+    # Sets between checks of the entry cap
+    EVICT_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int = 100000, timeout: float = 5.0):
+        """
+        Initialize the cache; the database is opened on first use
+
+        Args:
+            path: Database file path (created if missing)
+            max_entries: Entries kept before those expiring soonest are evicted
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, etag TEXT)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_expires_at ON cache_entries (expires_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._db().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0])
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = (
+                self._db()
+                .execute("SELECT value, expires_at, etag FROM cache_entries WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return CacheEntry(value=json.loads(row[0]), expires_at=row[1], etag=row[2])
+
+    def set(self, key: str, value: Any, ttl: float, etag: Optional[str] = None) -> None:
+        text = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, etag) "
+                "VALUES (?, ?, ?, ?)",
+                (key, text, time.time() + ttl, etag),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                count = db.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+                excess = count - self.max_entries
+                if excess > 0:
+                    db.execute(
+                        "DELETE FROM cache_entries WHERE key IN "
+                        "(SELECT key FROM cache_entries ORDER BY expires_at LIMIT ?)",
+                        (excess,),
+                    )
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            cursor = self._db().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return cursor.rowcount > 0
+
+    def delete_prefix(self, prefix: str) -> int:
+        # Range scan on the primary key instead of LIKE, which would need escaping
+        with self._lock:
+            return int(
+                self._db()
+                .execute(
+                    "DELETE FROM cache_entries WHERE key >= ? AND key < ?",
+                    (prefix, prefix + "\U0010ffff"),
+                )
+                .rowcount
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db().execute("DELETE FROM cache_entries")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
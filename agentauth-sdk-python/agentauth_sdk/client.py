@@ -1,10 +1,20 @@
 """AgentAuth SDK Client"""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import IO, Awaitable, Callable, List, Mapping, Optional, Dict, Any, Tuple, Union, cast
 import httpx
 
 from .types import (
     Agent,
+    AgentSession,
     RegisterAgentRequest,
     RegisterAgentResponse,
     VerifyAgentRequest,
@@ -12,12 +22,17 @@ from .types import (
     RefreshTokenRequest,
     RefreshTokenResponse,
     GetActivityResponse,
+    Token,
     RegisterWebhookRequest,
     Webhook,
+    WebhookDelivery,
+    WebhookDeliveriesResponse,
+    WebhookEvent,
     HealthCheckResponse,
     AgentTier,
     Persona,
     PersonaResponse,
+    PersonaChange,
     PersonaVerifyResponse,
     PersonaHistoryResponse,
     PersonaHistoryEntry,
@@ -31,11 +46,50 @@ from .types import (
     DriftHistoryResponse,
     DriftHistoryEntry,
     DriftConfig,
+    DriftThresholdError,
+    BundleSignatureError,
     AnomalyNote,
     DriftTrend,
 )
+from .bundles import (
+    BUNDLE_CHUNK_SIZE,
+    MAX_BUNDLE_SIZE,
+    BundleExport,
+    BundleImportReport,
+    BundleImportResult,
+    read_bundle,
+)
+from .cache import CacheBackend, MemoryCache
+from .drift import SpikeDetector, calculate_drift_score
+from .hedge import HedgePolicy
+from .offload import Offloader, sign_ping_batch
 from .permissions import Permission
-from .utils import retry_with_backoff, validate_base_url, AgentAuthError
+from .records import agent_record, drift_history_records, persona_history_records
+from .persona import diff_personas, effective_persona, persona_unchanged, render_prompt, version_gt
+from .signing import PingSigner
+from .spool import PingSpool
+from .webhooks import webhook_event_from_dict
+from .zkp import (
+    MAX_BATCH_VERIFICATIONS,
+    MAX_BATCH_ZKP_VERIFICATIONS,
+    VerificationCache,
+    verification_digest,
+)
+from .utils import (
+    retry_with_backoff,
+    validate_base_url,
+    dataclass_from_dict,
+    AgentAuthError,
+    is_retryable_failure,
+)
+
+logger = logging.getLogger("agentauth_sdk")
+
+# Rendered persona prompts kept per client, keyed by persona_hash
+PROMPT_CACHE_SIZE = 1024
+
+# Agent change events outside the ``agent.*`` namespace
+_AGENT_CHANGE_EVENTS = ("tier.upgraded", "tier.downgraded", "permissions.updated")
 
 
 class AgentAuthClient:
@@ -58,6 +112,18 @@ class AgentAuthClient:
         access_token: Optional[str] = None,
         max_retries: int = 3,
         timeout: float = 10.0,
+        spike_detector: Optional[SpikeDetector] = None,
+        cache: Optional[CacheBackend] = None,
+        drift_config_ttl: float = 300.0,
+        drift_precheck: Optional[str] = None,
+        verification_cache: Optional[VerificationCache] = None,
+        sign_pings: bool = False,
+        persona_cache_ttl: float = 300.0,
+        ping_spool: Optional[PingSpool] = None,
+        stale_while_revalidate: float = 0.0,
+        agent_cache_ttl: float = 0.0,
+        offloader: Optional[Offloader] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
     ):
         """
         Initialize AgentAuth client
@@ -68,13 +134,61 @@ class AgentAuthClient:
             access_token: Optional JWT access token
             max_retries: Maximum retry attempts (default: 3)
             timeout: Request timeout in seconds (default: 10.0)
-        """
+            spike_detector: Optional local spike detector; when set, health
+                pings are checked before submission and anomaly notes are
+                attached to the ping metadata (unless the caller signed it)
+            cache: Optional cache backend for read responses
+                (default: in-memory LRU)
+            drift_config_ttl: Seconds a fetched DriftConfig is cached (default: 300)
+            drift_precheck: Optional local threshold check before each health
+                ping: "raise" raises DriftThresholdError, "warn" emits a
+                RuntimeWarning, when the projected score would auto-revoke
+            verification_cache: Optional cache of verify_anonymous results,
+                bounded by commitment expiry and invalidated on revocation
+            sign_pings: Sign health pings with the API key (HMAC-SHA256 over the
+                canonical body, as verified by the server)
+            persona_cache_ttl: Seconds a fetched or written persona is cached for
+                ``update_persona``'s unchanged check (default: 300)
+            ping_spool: Optional durable spool; health pings that fail with a
+                network error, 5xx or 429 (or arrive while older pings are
+                still spooled) are written to it for later replay
+            stale_while_revalidate: Seconds past expiry a cached persona, agent
+                or drift config is still served while it is refreshed in the
+                background (default: 0, stale entries are refetched first)
+            agent_cache_ttl: Seconds ``get_agent`` results are cached
+                (default: 0, not cached)
+            offloader: Optional process/thread pool for CPU-heavy work: large
+                response bodies are decoded and large ping batches signed
+                off the event loop
+            hedge_policy: Optional request hedging for idempotent reads
+                (persona, drift score, drift config, agent): a slow request
+                is duplicated and the first response wins
+        """
+        if drift_precheck not in (None, "raise", "warn"):
+            raise ValueError("drift_precheck must be None, 'raise' or 'warn'")
+        if sign_pings and not api_key:
+            raise ValueError("sign_pings requires an api_key")
         validate_base_url(base_url)
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.access_token = access_token
         self.max_retries = max_retries
         self.timeout = timeout
+        self.spike_detector = spike_detector
+        self.cache: CacheBackend = cache if cache is not None else MemoryCache()
+        self.drift_config_ttl = drift_config_ttl
+        self.drift_precheck = drift_precheck
+        self.verification_cache = verification_cache
+        self.sign_pings = sign_pings
+        self.persona_cache_ttl = persona_cache_ttl
+        self.ping_spool = ping_spool
+        self.stale_while_revalidate = stale_while_revalidate
+        self.agent_cache_ttl = agent_cache_ttl
+        self.offloader = offloader
+        self.hedge_policy = hedge_policy
+        self._revalidating: Dict[str, "asyncio.Task[Any]"] = {}
+        self._prompts: "OrderedDict[str, str]" = OrderedDict()
+        self._ping_signer: Optional[PingSigner] = None
         self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
@@ -100,6 +214,15 @@ class AgentAuthClient:
     def set_api_key(self, api_key: str) -> None:
         """Set API key for authentication"""
         self.api_key = api_key
+        self._ping_signer = None
+
+    def _signer(self) -> PingSigner:
+        """HMAC signer keyed with the current API key, built once"""
+        if self._ping_signer is None:
+            if not self.api_key:
+                raise ValueError("Signing requires an api_key")
+            self._ping_signer = PingSigner(self.api_key)
+        return self._ping_signer
 
     async def _request(
         self,
@@ -108,6 +231,8 @@ class AgentAuthClient:
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         requires_auth: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        route: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Make HTTP request with retry logic
@@ -118,6 +243,9 @@ class AgentAuthClient:
             json: Request body (for POST/PUT)
             params: Query parameters
             requires_auth: Whether request requires authentication
+            headers: Extra request headers
+            route: Route template of an idempotent GET; when set, each
+                attempt goes through ``hedge_policy``
 
         Returns:
             Response JSON
@@ -126,13 +254,15 @@ class AgentAuthClient:
             AgentAuthError: On request failure
         """
 
-        async def make_request():
+        async def make_request() -> Dict[str, Any]:
             client = self._get_client()
             url = f"{self.base_url}{path}"
-            headers = {"Content-Type": "application/json"}
+            request_headers = {"Content-Type": "application/json"}
 
             if requires_auth and self.access_token:
-                headers["Authorization"] = f"Bearer {self.access_token}"
+                request_headers["Authorization"] = f"Bearer {self.access_token}"
+            if headers:
+                request_headers.update(headers)
 
             try:
                 response = await client.request(
@@ -140,10 +270,16 @@ class AgentAuthClient:
                     url=url,
                     json=json,
                     params=params,
-                    headers=headers,
+                    headers=request_headers,
                 )
                 response.raise_for_status()
-                return response.json()
+                offloader = self.offloader
+                data: Dict[str, Any]
+                if offloader is not None and offloader.should_offload(nbytes=len(response.content)):
+                    data = await offloader.decode(response.content)
+                else:
+                    data = response.json()
+                return data
             except httpx.HTTPStatusError as e:
                 error_body = {}
                 try:
@@ -157,11 +293,46 @@ class AgentAuthClient:
                     details=error_body,
                 )
 
+        async def send_request() -> Dict[str, Any]:
+            policy = self.hedge_policy
+            if policy is not None and route is not None and method == "GET":
+                return await policy.run(route, make_request)
+            return await make_request()
+
         return await retry_with_backoff(
-            make_request,
+            send_request,
             max_retries=self.max_retries,
         )
 
+    def _cached(self, key: str, revalidate: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        """
+        Cached payload for ``key``, or None on a miss
+
+        A stale entry less than ``stale_while_revalidate`` seconds past its
+        expiry is returned as-is while ``revalidate`` refreshes it in the
+        background (once per key at a time).
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        now = time.time()
+        if entry.fresh(now):
+            return entry.value
+        if now >= entry.expires_at + self.stale_while_revalidate:
+            return None
+
+        if key not in self._revalidating:
+            task = asyncio.ensure_future(revalidate())
+            self._revalidating[key] = task
+
+            def done(task: "asyncio.Task[Any]") -> None:
+                self._revalidating.pop(key, None)
+                if not task.cancelled() and task.exception() is not None:
+                    logger.warning("Revalidating %s failed: %s", key, task.exception())
+
+            task.add_done_callback(done)
+        return entry.value
+
     # ============================================
     # Agent Management
     # ============================================
@@ -214,13 +385,102 @@ class AgentAuthClient:
             "/agents/verify",
             json={"agent_id": agent_id, "api_key": api_key},
         )
-        response = VerifyAgentResponse(**data)
+        # The API answers {"verified": true, "agent": {...}, "token": {...}}
+        response = VerifyAgentResponse(
+            success=data.get("success", data.get("verified", False)),
+            message=data.get("message", ""),
+            agent=data.get("agent"),  # type: ignore[arg-type]
+            token=dataclass_from_dict(Token, data["token"]),
+        )
 
         # Auto-update access token
         self.set_access_token(response.token.access_token)
 
         return response
 
+    async def start_session(
+        self,
+        agent_id: str,
+        api_key: str,
+        include_prompt: bool = False,
+        return_exceptions: bool = False,
+    ) -> AgentSession:
+        """
+        Verify agent credentials, then warm the agent's reads (see ``warm``)
+
+        Args:
+            agent_id: Agent ID
+            api_key: API key
+            include_prompt: Whether to render the persona prompt
+            return_exceptions: Record failed reads in ``session.errors``
+                instead of raising
+
+        Returns:
+            AgentSession with the access token and the agent's reads
+        """
+        verified = await self.verify_agent(agent_id, api_key)
+        session = await self.warm(agent_id, include_prompt, return_exceptions)
+        session.token = verified.token
+        return session
+
+    async def warm(
+        self,
+        agent_id: str,
+        include_prompt: bool = False,
+        return_exceptions: bool = False,
+    ) -> AgentSession:
+        """
+        Fetch an agent, its persona, drift config and the permission catalog
+        concurrently, filling the client's caches.
+
+        Startup takes as long as the slowest read rather than the sum of all
+        four. The agent is only cached when ``agent_cache_ttl`` is set.
+
+        Args:
+            agent_id: Agent ID
+            include_prompt: Whether to render the persona prompt
+            return_exceptions: Record failed reads in ``session.errors``
+                instead of raising
+
+        Returns:
+            AgentSession (``persona`` is None if none is registered)
+
+        Raises:
+            AgentAuthError: The first failed read, once all reads have
+                finished, unless ``return_exceptions`` is True
+        """
+        started = time.perf_counter()
+        reads: Dict[str, Awaitable[Any]] = {
+            "agent": self.get_agent(agent_id),
+            "persona": self._warm_persona(agent_id, include_prompt),
+            "drift_config": self.get_drift_config(agent_id),
+            "permissions": self.list_permissions(),
+        }
+        results = await asyncio.gather(*reads.values(), return_exceptions=True)
+
+        session = AgentSession(agent_id=agent_id)
+        for name, result in zip(reads, results):
+            if isinstance(result, Exception):
+                session.errors[name] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                setattr(session, name, result)
+        session.elapsed = time.perf_counter() - started
+
+        if session.errors and not return_exceptions:
+            raise next(iter(session.errors.values()))
+        return session
+
+    async def _warm_persona(self, agent_id: str, include_prompt: bool) -> Optional[PersonaResponse]:
+        """Persona for ``warm``; None if the agent has none"""
+        try:
+            return await self.get_persona(agent_id, include_prompt=include_prompt)
+        except AgentAuthError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
     async def refresh_token(
         self,
         refresh_token: str,
@@ -259,15 +519,43 @@ class AgentAuthClient:
             requires_auth=True,
         )
 
-    async def list_agents(self) -> List[Agent]:
+    async def list_agents(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        status: Optional[str] = None,
+        updated_since: Optional[str] = None,
+    ) -> List[Agent]:
         """
         List all agents (admin only)
 
+        Args:
+            limit: Optional page size (server default: 50)
+            offset: Optional offset for pagination
+            status: Optional status filter
+            updated_since: Optional ISO timestamp; only agents updated after it
+                are returned, oldest change first
+
         Returns:
             List of agents
         """
-        data = await self._request("GET", "/agents", requires_auth=True)
-        return [Agent(**agent) for agent in data["agents"]]
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if status is not None:
+            params["status"] = status
+        if updated_since is not None:
+            params["updated_since"] = updated_since
+
+        data = await self._request(
+            "GET",
+            "/agents",
+            params=params if params else None,
+            requires_auth=True,
+        )
+        return [agent_record(agent) for agent in data["agents"]]
 
     async def get_agent(self, agent_id: str) -> Agent:
         """
@@ -279,12 +567,25 @@ class AgentAuthClient:
         Returns:
             Agent details
         """
+        if self.agent_cache_ttl > 0:
+            cached = self._cached(f"agent:{agent_id}", lambda: self._fetch_agent(agent_id))
+            if cached is not None:
+                return agent_record(cached)
+        return agent_record(await self._fetch_agent(agent_id))
+
+    async def _fetch_agent(self, agent_id: str) -> Dict[str, Any]:
+        """Fetch an agent, caching it when ``agent_cache_ttl`` is set"""
         data = await self._request(
             "GET",
             f"/agents/{agent_id}",
             requires_auth=True,
+            route="GET /agents/{id}",
         )
-        return Agent(**data["agent"])
+        # GET /agents/:id returns the agent itself; older servers wrapped it
+        agent = data["agent"] if "agent" in data else data
+        if self.agent_cache_ttl > 0:
+            self.cache.set(f"agent:{agent_id}", agent, ttl=self.agent_cache_ttl)
+        return agent
 
     async def revoke_agent(self, agent_id: str) -> Dict[str, Any]:
         """
@@ -296,6 +597,7 @@ class AgentAuthClient:
         Returns:
             Success response
         """
+        self.cache.delete(f"agent:{agent_id}")
         return await self._request(
             "POST",
             f"/agents/{agent_id}/revoke",
@@ -342,6 +644,7 @@ class AgentAuthClient:
         Returns:
             Updated agent
         """
+        self.cache.delete(f"agent:{agent_id}")
         data = await self._request(
             "PUT",
             f"/agents/{agent_id}/tier",
@@ -420,6 +723,119 @@ class AgentAuthClient:
         )
         return Webhook(**data["webhook"])
 
+    async def toggle_webhook(self, webhook_id: str, is_active: bool) -> Dict[str, Any]:
+        """
+        Activate or deactivate a webhook
+
+        Args:
+            webhook_id: Webhook ID
+            is_active: Whether deliveries should be sent
+
+        Returns:
+            Updated webhook
+        """
+        return await self._request(
+            "POST",
+            f"/webhooks/{webhook_id}/toggle",
+            json={"is_active": is_active},
+            requires_auth=True,
+        )
+
+    async def get_webhook_deliveries(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        since: Optional[str] = None,
+        order: str = "desc",
+    ) -> WebhookDeliveriesResponse:
+        """
+        Get webhook delivery history
+
+        Args:
+            webhook_id: Webhook ID
+            limit: Number of deliveries to return
+            offset: Offset for pagination
+            since: Only deliveries recorded after this ISO timestamp
+            order: Sort by delivered_at ('asc' or 'desc')
+
+        Returns:
+            WebhookDeliveriesResponse with a page of deliveries
+        """
+        params: Dict[str, Any] = {"limit": limit, "offset": offset, "order": order}
+        if since:
+            params["since"] = since
+        data = await self._request(
+            "GET",
+            f"/webhooks/{webhook_id}/deliveries",
+            params=params,
+            requires_auth=True,
+        )
+        deliveries = [dataclass_from_dict(WebhookDelivery, d) for d in data.get("deliveries") or []]
+        return WebhookDeliveriesResponse(
+            deliveries=deliveries,
+            total=data.get("total"),
+            limit=data.get("limit", limit),
+            offset=data.get("offset", offset),
+            since=data.get("since"),
+        )
+
+    def handle_webhook_event(self, event: Union[WebhookEvent, Dict[str, Any]]) -> bool:
+        """
+        Update or invalidate cached entries from a webhook event.
+
+        ``persona.created``/``persona.updated`` carry the new persona, so the
+        persona cache is updated in place (older versions arriving late are
+        ignored); ``agent.*``, ``tier.upgraded``/``tier.downgraded`` and
+        ``permissions.updated`` drop the cached agent, and ``agent.deleted``
+        also its persona and drift config. Lets these caches use long TTLs. Can
+        be registered directly on a WebhookReceiver.
+
+        Example:
+            >>> receiver.on()(client.handle_webhook_event)
+
+        Args:
+            event: Received event, or the decoded delivery body
+
+        Returns:
+            True if a cache entry was updated or removed
+        """
+        if isinstance(event, dict):
+            event = webhook_event_from_dict(event)
+        agent_id = event.agent_id or event.data.get("agent_id")
+        if not agent_id:
+            return False
+
+        if event.event in ("persona.created", "persona.updated"):
+            key = f"persona:{agent_id}"
+            persona = event.data.get("persona")
+            persona_hash = event.data.get("persona_hash")
+            if not isinstance(persona, dict) or not persona_hash:
+                return self.cache.delete(key)
+
+            version = event.data.get("version") or persona.get("version")
+            cached = self.cache.get(key)
+            if cached is not None and version_gt(cached.value.get("persona_version"), version):
+                return False  # a newer version is already cached
+            self._cache_persona(
+                agent_id,
+                {
+                    "agent_id": agent_id,
+                    "persona": persona,
+                    "persona_hash": persona_hash,
+                    "persona_version": version,
+                },
+            )
+            return True
+
+        if not event.event.startswith("agent.") and event.event not in _AGENT_CHANGE_EVENTS:
+            return False
+        removed = self.cache.delete(f"agent:{agent_id}")
+        if event.event == "agent.deleted":
+            removed = self.cache.delete(f"persona:{agent_id}") or removed
+            removed = self.cache.delete(f"drift_config:{agent_id}") or removed
+        return removed
+
     # ============================================
     # Utilities
     # ============================================
@@ -447,6 +863,23 @@ class AgentAuthClient:
     # Persona ("Soul Layer")
     # ============================================
 
+    def _persona_headers(self, api_key: Optional[str] = None) -> Dict[str, str]:
+        """X-Api-Key header required by persona writes"""
+        api_key = api_key or self.api_key
+        return {"X-Api-Key": api_key} if api_key else {}
+
+    def _cache_persona(self, agent_id: str, data: Dict[str, Any]) -> None:
+        """Cache the server's current persona for unchanged checks"""
+        cached = {
+            key: data.get(key) for key in ("agent_id", "persona", "persona_hash", "persona_version")
+        }
+        self.cache.set(
+            f"persona:{agent_id}",
+            cached,
+            ttl=self.persona_cache_ttl,
+            etag=data.get("persona_hash"),
+        )
+
     async def register_persona(
         self,
         agent_id: str,
@@ -462,45 +895,144 @@ class AgentAuthClient:
         Returns:
             PersonaResponse with hash and version
         """
-        headers: Dict[str, str] = {}
-        if self.api_key:
-            headers["X-Api-Key"] = self.api_key
-
         data = await self._request(
             "POST",
             f"/agents/{agent_id}/persona",
-            json=persona,
+            json={"persona": persona},
             requires_auth=True,
+            headers=self._persona_headers(),
         )
-        return PersonaResponse(**data)
+        self._cache_persona(agent_id, data)
+        return dataclass_from_dict(PersonaResponse, data)
 
     async def get_persona(
         self,
         agent_id: str,
         include_prompt: bool = False,
         etag: Optional[str] = None,
+        use_cache: bool = False,
     ) -> Optional[PersonaResponse]:
         """
         Get persona for an agent. Supports ETag-based caching.
 
+        Always asks the API unless ``use_cache`` is set; the request carries the
+        cached ETag in ``If-None-Match``, so an unchanged persona costs a 304
+        instead of a full response. The prompt is rendered locally.
+
         Args:
             agent_id: Agent ID
             include_prompt: Whether to include generated prompt
-            etag: Optional ETag for conditional request
+            etag: Optional ETag for a conditional request managed by the caller
+            use_cache: Whether a persona cached within ``persona_cache_ttl``
+                may be returned without revalidation (default: False)
 
         Returns:
-            PersonaResponse or None if not modified (304)
+            PersonaResponse, or None if ``etag`` is given and still current (304)
+
+        Raises:
+            AgentAuthError: If the agent has no persona (404)
         """
-        params: Dict[str, Any] = {}
+        if etag is not None:
+            quoted = etag if etag.startswith('"') else f'"{etag}"'
+            try:
+                data = await self._request(
+                    "GET",
+                    f"/agents/{agent_id}/persona",
+                    headers={"If-None-Match": quoted},
+                    route="GET /agents/{id}/persona",
+                )
+            except AgentAuthError as e:
+                if e.status_code == 304:
+                    return None
+                raise
+            self._cache_persona(agent_id, data)
+        else:
+            if use_cache:
+                current = await self._current_persona(agent_id)
+            else:
+                current = await self._fetch_persona(agent_id)
+            if current is None:
+                raise AgentAuthError("No persona registered for this agent", 404)
+            data = dict(current)
+
+        data["etag"] = data.get("persona_hash")
         if include_prompt:
-            params["includePrompt"] = "true"
+            data["prompt"] = self._prompt_for(data)
+        return dataclass_from_dict(PersonaResponse, data)
 
-        data = await self._request(
-            "GET",
-            f"/agents/{agent_id}/persona",
-            params=params if params else None,
-        )
-        return PersonaResponse(**data)
+    async def get_persona_prompt(self, agent_id: str) -> str:
+        """
+        Get the agent's system prompt, rendered locally.
+
+        The prompt is identical to ``get_persona(include_prompt=True).prompt``
+        and memoized by ``persona_hash``; the persona itself comes from the
+        persona cache, so repeated calls make no requests.
+
+        Args:
+            agent_id: Agent ID
+
+        Returns:
+            System prompt text
+
+        Raises:
+            AgentAuthError: If the agent has no persona (404)
+        """
+        current = await self._current_persona(agent_id)
+        if current is None:
+            raise AgentAuthError("No persona registered for this agent", 404)
+        return self._prompt_for(current)
+
+    def _prompt_for(self, current: Dict[str, Any]) -> str:
+        """Memoized prompt for a cached persona response"""
+        persona_hash = current.get("persona_hash")
+        if not persona_hash or not isinstance(persona_hash, str):
+            return render_prompt(current.get("persona") or {})
+
+        prompt = self._prompts.get(persona_hash)
+        if prompt is not None:
+            self._prompts.move_to_end(persona_hash)
+            return prompt
+
+        prompt = render_prompt(current.get("persona") or {})
+        self._remember_prompt(persona_hash, prompt)
+        return prompt
+
+    def _remember_prompt(self, persona_hash: str, prompt: str) -> None:
+        """Memoize a rendered prompt (LRU, bounded)"""
+        self._prompts[persona_hash] = prompt
+        self._prompts.move_to_end(persona_hash)
+        while len(self._prompts) > PROMPT_CACHE_SIZE:
+            self._prompts.popitem(last=False)
+
+    async def _current_persona(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Cached persona response, fetched if missing; None if none is registered"""
+        cached = self._cached(f"persona:{agent_id}", lambda: self._fetch_persona(agent_id))
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+        return await self._fetch_persona(agent_id)
+
+    async def _fetch_persona(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch and cache the persona, revalidating a cached one by ETag"""
+        key = f"persona:{agent_id}"
+        entry = self.cache.get(key)
+        headers = {"If-None-Match": f'"{entry.etag}"'} if entry is not None and entry.etag else None
+        try:
+            data = await self._request(
+                "GET",
+                f"/agents/{agent_id}/persona",
+                headers=headers,
+                route="GET /agents/{id}/persona",
+            )
+        except AgentAuthError as e:
+            if e.status_code == 304 and entry is not None:
+                self.cache.set(key, entry.value, ttl=self.persona_cache_ttl, etag=entry.etag)
+                return entry.value  # type: ignore[no-any-return]
+            if e.status_code == 404:
+                self.cache.delete(key)
+                return None
+            raise
+        self._cache_persona(agent_id, data)
+        return data
 
     async def get_persona_history(
         self,
@@ -528,29 +1060,86 @@ class AgentAuthClient:
             f"/agents/{agent_id}/persona/history",
             params={"limit": limit, "offset": offset, "sort": sort, "format": format},
         )
-        return PersonaHistoryResponse(**data)
+        return PersonaHistoryResponse(
+            history=persona_history_records(data["history"] or []),
+            total=data["total"],
+            limit=data["limit"],
+            offset=data["offset"],
+        )
+
+    async def diff_persona(
+        self,
+        agent_id: str,
+        persona: Dict[str, Any],
+    ) -> List[PersonaChange]:
+        """
+        Diff a persona against the agent's current persona without writing it.
+
+        Uses the cached persona when fresh. The version bump ``update_persona``
+        would apply is left out, so an unchanged persona gives an empty list.
+
+        Args:
+            agent_id: Agent ID
+            persona: Candidate persona definition
+
+        Returns:
+            Changes in the format of the server's ``changes`` (empty if unchanged)
+        """
+        current = await self._current_persona(agent_id)
+        current = current or {}
+        stored = current.get("persona") or {}
+        candidate = effective_persona(persona, current.get("persona_version"), "version" in stored)
+        return diff_personas(stored, candidate if candidate is not None else persona)
 
     async def update_persona(
         self,
         agent_id: str,
         persona: Dict[str, Any],
+        skip_unchanged: bool = True,
     ) -> Dict[str, Any]:
         """
         Update persona for an agent. Auto-bumps minor version.
 
+        With ``skip_unchanged``, the persona hash is computed locally and compared
+        with the current ``persona_hash`` (cached for ``persona_cache_ttl``
+        seconds), and an unchanged persona is not sent: no version bump, history
+        entry or ``persona.updated`` webhook. Writes made by other clients
+        within the cache TTL are not seen; pass ``skip_unchanged=False`` to
+        always write.
+
         Args:
             agent_id: Agent ID
             persona: Updated persona definition
+            skip_unchanged: Skip the request if nothing would change (default: True)
 
         Returns:
-            Updated persona with version info and diff
-        """
-        return await self._request(
+            Updated persona with version info and diff; skipped updates return
+            the current persona with empty ``changes`` and ``skipped=True``
+        """
+        if skip_unchanged:
+            current = await self._current_persona(agent_id)
+            if current is not None and persona_unchanged(current, persona, self.api_key):
+                return {
+                    "agent_id": agent_id,
+                    "persona": current.get("persona"),
+                    "persona_hash": current.get("persona_hash"),
+                    "persona_version": current.get("persona_version"),
+                    "previous_version": current.get("persona_version"),
+                    "changes": [],
+                    "skipped": True,
+                }
+
+        key = f"persona:{agent_id}"
+        self.cache.delete(key)
+        data = await self._request(
             "PUT",
             f"/agents/{agent_id}/persona",
-            json=persona,
+            json={"persona": persona},
             requires_auth=True,
+            headers=self._persona_headers(),
         )
+        self._cache_persona(agent_id, data)
+        return data
 
     async def verify_persona(self, agent_id: str) -> PersonaVerifyResponse:
         """
@@ -573,22 +1162,172 @@ class AgentAuthClient:
         """
         Export persona as a signed ZIP bundle.
 
+        The whole bundle is held in memory; use ``export_persona_to`` to stream
+        large bundles to disk.
+
         Args:
             agent_id: Agent ID
 
         Returns:
             ZIP file bytes
         """
-        client = self._get_client()
+        buffer = io.BytesIO()
+        await self.export_persona_to(agent_id, buffer, verify=False)
+        return buffer.getvalue()
+
+    async def export_persona_to(
+        self,
+        agent_id: str,
+        sink: Union[str, "os.PathLike[str]", IO[bytes]],
+        verify: bool = True,
+        chunk_size: int = BUNDLE_CHUNK_SIZE,
+    ) -> BundleExport:
+        """
+        Stream a persona export bundle to a file or binary file-like sink.
+
+        The ZIP is written in ``chunk_size`` pieces with the client's auth and
+        retry policy. If the server advertises ``Accept-Ranges`` and a validator
+        (ETag or Last-Modified), a retry after a dropped connection resumes with a
+        ``Range`` request; otherwise the sink is rewound and the download restarts.
+        Paths are written to ``<path>.part`` and renamed into place once complete
+        and verified.
+
+        With ``verify``, ``persona.json`` is checked against both
+        ``signature.txt`` and the ``X-Bundle-Signature`` header. The signature
+        covers the canonical bundle JSON rather than the ZIP bytes, so the check
+        runs on the written file once the transfer completes, reading the member
+        straight from disk.
+
+        Args:
+            agent_id: Agent ID
+            sink: Destination path, or a binary file opened for writing
+                (readable and seekable if ``verify``)
+            verify: Verify the bundle signature (default: True)
+            chunk_size: Bytes per read and write
+
+        Returns:
+            BundleExport with the signature, size and SHA-256 of the ZIP
+
+        Raises:
+            AgentAuthError: On request failure
+            BundleSignatureError: If ``verify`` and the bundle does not match its signature
+        """
+        path = os.fspath(sink) if isinstance(sink, (str, os.PathLike)) else None
+        if path is None:
+            out = cast(IO[bytes], sink)
+            seekable = out.seekable()
+            if verify and not (seekable and out.readable()):
+                raise ValueError("verify=True needs a path or a readable, seekable sink")
+        else:
+            out = open(path + ".part", "w+b")
+            seekable = True
+        start = out.tell() if seekable else 0
+
         url = f"{self.base_url}/agents/{agent_id}/persona/export"
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.content
+        state: Dict[str, Any] = {
+            "written": 0,
+            "digest": hashlib.sha256(),
+            "signature": None,
+            "validator": None,
+            "resumed": 0,
+        }
+
+        async def download() -> None:
+            headers: Dict[str, str] = {}
+            if self.access_token:
+                headers["Authorization"] = f"Bearer {self.access_token}"
+            ranged = bool(state["written"] and state["validator"])
+            if ranged:
+                headers["Range"] = f"bytes={state['written']}-"
+                headers["If-Range"] = state["validator"]
+
+            async with self._get_client().stream("GET", url, headers=headers) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    if response.status_code >= 500 or response.status_code == 429:
+                        response.raise_for_status()  # retried by retry_with_backoff
+                    raise self._error_from_response(response)
+
+                content_range = response.headers.get("Content-Range", "")
+                if (
+                    ranged
+                    and response.status_code == 206
+                    and content_range.startswith(f"bytes {state['written']}-")
+                ):
+                    state["resumed"] += 1
+                else:
+                    if state["written"]:
+                        if not seekable:
+                            raise AgentAuthError("Export restarted but the sink cannot be rewound")
+                        out.seek(start)
+                        out.truncate()
+                        state["written"] = 0
+                        state["digest"] = hashlib.sha256()
+                    state["signature"] = response.headers.get("X-Bundle-Signature")
+                    validator = response.headers.get("ETag")
+                    if not validator:
+                        validator = response.headers.get("Last-Modified")
+                    accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+                    state["validator"] = validator if accepts_ranges else None
+
+                async for chunk in response.aiter_bytes(chunk_size):
+                    out.write(chunk)
+                    state["digest"].update(chunk)
+                    state["written"] += len(chunk)
+
+        try:
+            try:
+                await retry_with_backoff(download, max_retries=self.max_retries)
+            except httpx.HTTPStatusError as e:
+                raise self._error_from_response(e.response) from e
+            out.flush()
+
+            if verify:
+                out.seek(start)
+                bundle = read_bundle(out)
+                if state["signature"] and state["signature"] != bundle["signature"]:
+                    raise BundleSignatureError(
+                        "Bundle signature does not match X-Bundle-Signature",
+                        expected=state["signature"],
+                        actual=bundle["signature"],
+                    )
+        except BaseException:
+            if path is not None:
+                out.close()
+                os.unlink(path + ".part")
+            raise
+
+        if path is not None:
+            out.close()
+            os.replace(path + ".part", path)
+        return BundleExport(
+            agent_id=agent_id,
+            signature=state["signature"],
+            bytes_written=state["written"],
+            sha256=state["digest"].hexdigest(),
+            path=path,
+            resumed=state["resumed"],
+            verified=verify,
+        )
+
+    def _error_from_response(self, response: httpx.Response) -> AgentAuthError:
+        """Map an error response to AgentAuthError, as ``_request`` does"""
+        error_body: Dict[str, Any] = {}
+        try:
+            error_body = response.json()
+        except Exception:
+            pass
+        return AgentAuthError(
+            message=error_body.get("error", f"HTTP {response.status_code}"),
+            status_code=response.status_code,
+            details=error_body,
+        )
 
     async def import_persona(
         self,
         agent_id: str,
         bundle: Dict[str, Any],
+        api_key: Optional[str] = None,
     ) -> PersonaResponse:
         """
         Import a signed persona bundle.
@@ -596,17 +1335,114 @@ class AgentAuthClient:
         Args:
             agent_id: Agent ID
             bundle: Bundle with persona, persona_hash, and signature
+            api_key: The agent's API key (default: the client's)
 
         Returns:
             PersonaResponse for the imported persona
         """
+        self.cache.delete(f"persona:{agent_id}")
         data = await self._request(
             "POST",
             f"/agents/{agent_id}/persona/import",
-            json=bundle,
+            json={"bundle": bundle},
             requires_auth=True,
+            headers=self._persona_headers(api_key),
         )
-        return PersonaResponse(**data)
+        self._cache_persona(agent_id, data)
+        return dataclass_from_dict(PersonaResponse, data)
+
+    async def import_persona_file(
+        self,
+        agent_id: str,
+        path: Union[str, "os.PathLike[str]"],
+        api_key: Optional[str] = None,
+        verify: bool = True,
+        max_size: int = MAX_BUNDLE_SIZE,
+    ) -> PersonaResponse:
+        """
+        Import a bundle ZIP written by ``export_persona_to``.
+
+        The file is memory-mapped and its ZIP directory and signature are
+        validated before ``persona.json`` is parsed (off the event loop), so
+        corrupt or tampered bundles fail without a request.
+
+        Args:
+            agent_id: Agent ID to import into
+            path: Bundle ZIP path
+            api_key: The agent's API key (default: the client's)
+            verify: Check the bundle signature locally first (default: True)
+            max_size: Largest uncompressed ``persona.json`` accepted, in bytes
+
+        Returns:
+            PersonaResponse for the imported persona
+
+        Raises:
+            BundleSignatureError: If the bundle does not match its signature
+            ValueError: If the file is not a persona bundle
+            AgentAuthError: On request failure
+        """
+        loop = asyncio.get_running_loop()
+        bundle = await loop.run_in_executor(None, read_bundle, path, verify, max_size)
+        return await self.import_persona(agent_id, bundle, api_key=api_key)
+
+    async def import_persona_dir(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        api_keys: Optional[Mapping[str, str]] = None,
+        agent_ids: Optional[Mapping[str, str]] = None,
+        concurrency: int = 8,
+        verify: bool = True,
+        max_size: int = MAX_BUNDLE_SIZE,
+    ) -> BundleImportReport:
+        """
+        Import every ``*.zip`` bundle in a directory, ``concurrency`` at a time.
+
+        Each bundle is imported into the agent it was exported from, or
+        ``agent_ids[<exported agent_id>]`` when given. Failures are reported
+        per bundle rather than raised.
+
+        Args:
+            directory: Directory containing bundle ZIPs
+            api_keys: API key per target agent ID (default: the client's key)
+            agent_ids: Optional mapping of exported agent ID to target agent ID
+            concurrency: Maximum bundles read or imported at once
+            verify: Check each bundle signature locally first (default: True)
+            max_size: Largest uncompressed ``persona.json`` accepted, in bytes
+
+        Returns:
+            BundleImportReport with one result per file, in file name order
+        """
+        paths = sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(".zip") and os.path.isfile(os.path.join(directory, name))
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def import_one(path: str) -> BundleImportResult:
+            result = BundleImportResult(path=path)
+            async with semaphore:
+                try:
+                    bundle = await loop.run_in_executor(None, read_bundle, path, verify, max_size)
+                    source_id = bundle.get("agent_id")
+                    target_id = source_id
+                    if agent_ids and isinstance(source_id, str):
+                        target_id = agent_ids.get(source_id, source_id)
+                    if not target_id or not isinstance(target_id, str):
+                        raise ValueError("Bundle has no agent_id; pass agent_ids")
+                    result.agent_id = target_id
+                    response = await self.import_persona(
+                        target_id, bundle, api_key=(api_keys or {}).get(target_id)
+                    )
+                    result.persona_version = response.persona_version
+                    result.persona_hash = response.persona_hash
+                except (AgentAuthError, BundleSignatureError, ValueError, OSError) as e:
+                    result.error = str(e)
+            return result
+
+        results = await asyncio.gather(*(import_one(path) for path in paths))
+        return BundleImportReport(results=list(results))
 
     # ============================================
     # ZKP Anonymous Verification
@@ -638,7 +1474,10 @@ class AgentAuthClient:
             "/zkp/register-commitment",
             json=body,
         )
-        return RegisterCommitmentResponse(**data)
+        result = RegisterCommitmentResponse(**data)
+        if self.verification_cache is not None:
+            self.verification_cache.set_expiry(result.commitment, result.expires_at)
+        return result
 
     async def verify_anonymous(
         self,
@@ -660,7 +1499,25 @@ class AgentAuthClient:
 
         Returns:
             VerifyAnonymousResponse with validity and permissions
-        """
+
+        Raises:
+            AgentAuthError: 401 when the commitment or proof is invalid
+                (also raised from a cached negative result)
+        """
+        cache = self.verification_cache
+        digest = ""
+        if cache is not None:
+            digest = verification_digest(mode, proof, public_signals, preimage_hash)
+            cached = cache.get(commitment, digest)
+            if cached is not None:
+                if not cached.valid:
+                    raise AgentAuthError(
+                        message=cached.reason,
+                        status_code=401,
+                        details={"valid": False, "reason": cached.reason},
+                    )
+                return cached
+
         body: Dict[str, Any] = {"commitment": commitment, "mode": mode}
         if proof is not None:
             body["proof"] = proof
@@ -669,12 +1526,135 @@ class AgentAuthClient:
         if preimage_hash is not None:
             body["preimage_hash"] = preimage_hash
 
-        data = await self._request(
-            "POST",
-            "/zkp/verify-anonymous",
-            json=body,
-        )
-        return VerifyAnonymousResponse(**data)
+        try:
+            data = await self._request(
+                "POST",
+                "/zkp/verify-anonymous",
+                json=body,
+            )
+        except AgentAuthError as e:
+            # The server answers invalid proofs with 401 and the verification result
+            if cache is not None and e.status_code == 401 and e.details.get("valid") is False:
+                result = dataclass_from_dict(VerifyAnonymousResponse, e.details)
+                cache.put(commitment, digest, result)
+            raise
+
+        result = dataclass_from_dict(VerifyAnonymousResponse, data)
+        if cache is not None:
+            cache.put(commitment, digest, result)
+        return result
+
+    async def verify_anonymous_many(
+        self,
+        items: List[VerifyAnonymousRequest],
+    ) -> List[VerifyAnonymousResponse]:
+        """
+        Verify many commitments, batching requests to the server.
+
+        Items may mix hash and ZKP mode. Cached results are served locally and
+        only misses are sent, in batches of up to 100 (at most 10 of them in
+        ZKP mode). Invalid items don't raise; they come back with
+        ``valid=False``.
+
+        Args:
+            items: Verification requests (mode defaults to 'zkp')
+
+        Returns:
+            One VerifyAnonymousResponse per item, in order
+
+        Raises:
+            AgentAuthError: If a batch response doesn't have one result per item
+        """
+        cache = self.verification_cache
+        results: List[Optional[VerifyAnonymousResponse]] = [None] * len(items)
+        digests: List[str] = [""] * len(items)
+        pending: List[int] = []
+
+        for index, item in enumerate(items):
+            mode = item.mode or "zkp"
+            if cache is not None:
+                digests[index] = verification_digest(
+                    mode, item.proof, item.public_signals, item.preimage_hash
+                )
+                cached = cache.get(item.commitment, digests[index])
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            pending.append(index)
+
+        # Split misses into batches within both server limits
+        chunks: List[List[int]] = []
+        chunk: List[int] = []
+        zkp_items = 0
+        for index in pending:
+            is_zkp = (items[index].mode or "zkp") == "zkp"
+            if len(chunk) == MAX_BATCH_VERIFICATIONS or (
+                is_zkp and zkp_items == MAX_BATCH_ZKP_VERIFICATIONS
+            ):
+                chunks.append(chunk)
+                chunk, zkp_items = [], 0
+            chunk.append(index)
+            zkp_items += is_zkp
+        if chunk:
+            chunks.append(chunk)
+
+        for chunk in chunks:
+            body_items: List[Dict[str, Any]] = []
+            for index in chunk:
+                item = items[index]
+                body_item: Dict[str, Any] = {
+                    "commitment": item.commitment,
+                    "mode": item.mode or "zkp",
+                }
+                if item.proof is not None:
+                    body_item["proof"] = item.proof
+                if item.public_signals is not None:
+                    body_item["publicSignals"] = item.public_signals
+                if item.preimage_hash is not None:
+                    body_item["preimage_hash"] = item.preimage_hash
+                body_items.append(body_item)
+
+            data = await self._request(
+                "POST",
+                "/zkp/verify-anonymous/batch",
+                json={"items": body_items},
+            )
+            if len(data["results"]) != len(chunk):
+                raise AgentAuthError(
+                    f"Batch verification returned {len(data['results'])} results "
+                    f"for {len(chunk)} items",
+                    details=data,
+                )
+            for index, result_data in zip(chunk, data["results"]):
+                result = dataclass_from_dict(VerifyAnonymousResponse, result_data)
+                results[index] = result
+                if cache is not None:
+                    cache.put(items[index].commitment, digests[index], result)
+
+        return cast(List[VerifyAnonymousResponse], results)
+
+    async def revoke_commitment(self, commitment: str) -> Dict[str, Any]:
+        """
+        Revoke a ZKP commitment
+
+        Cached verification results for the commitment are dropped, even if
+        the request fails.
+
+        Args:
+            commitment: The commitment hash
+
+        Returns:
+            Revocation confirmation
+        """
+        try:
+            return await self._request(
+                "DELETE",
+                f"/zkp/commitment/{commitment}",
+            )
+        finally:
+            # Drop cached results even on 404 (already revoked) or failure
+            if self.verification_cache is not None:
+                self.verification_cache.invalidate(commitment)
 
     # ============================================
     # Anti-Drift Vault
@@ -688,21 +1668,76 @@ class AgentAuthClient:
         period_start: Optional[str] = None,
         period_end: Optional[str] = None,
         signature: Optional[str] = None,
-    ) -> HealthPingResponse:
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[HealthPingResponse]:
         """
         Submit a health ping with metrics.
 
+        If the client has a ``spike_detector``, metrics are checked against the
+        local per-agent history first and any anomaly notes are attached to
+        ``metadata["anomaly_notes"]``. Notes are not attached to a ping carrying
+        a caller-supplied ``signature``, since changing the body would
+        invalidate it. The sample joins the history once the server accepts it.
+
+        If the client has a ``ping_spool``, a ping that cannot be delivered
+        (network error, 5xx or 429 after retries) is spooled instead of
+        raising, as is every ping submitted while the spool holds a backlog,
+        so pings still reach the server in order.
+
         Args:
             agent_id: Agent ID
             metrics: Dict of metric name to value
             request_count: Optional request count for the period
             period_start: Optional ISO date for period start
             period_end: Optional ISO date for period end
-            signature: Optional HMAC signature of the ping data
+            signature: Optional HMAC signature of the ping data; computed
+                automatically when the client has ``sign_pings`` enabled
+            metadata: Optional client metadata sent with the ping
 
         Returns:
-            HealthPingResponse with drift score and status
+            HealthPingResponse with drift score and status, or None if the
+            ping was spooled
+        """
+        body = await self._health_ping_body(
+            agent_id,
+            metrics,
+            request_count,
+            period_start,
+            period_end,
+            metadata,
+            annotate=signature is None,
+        )
+        if signature is None and self.sign_pings:
+            signature = self._signer().sign(body)
+        if signature is not None:
+            body["signature"] = signature
+        return await self._deliver_health_ping(agent_id, body)
+
+    async def _health_ping_body(
+        self,
+        agent_id: str,
+        metrics: Dict[str, float],
+        request_count: Optional[int] = None,
+        period_start: Optional[str] = None,
+        period_end: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        annotate: bool = True,
+    ) -> Dict[str, Any]:
         """
+        Run the drift precheck and spike detection and build the unsigned body
+
+        ``annotate=False`` leaves the metadata untouched, for pings the caller
+        already signed.
+        """
+        if self.drift_precheck is not None:
+            await self._precheck_drift(agent_id, metrics)
+
+        if annotate and self.spike_detector is not None:
+            notes = self.spike_detector.check(agent_id, metrics)
+            if notes:
+                metadata = dict(metadata or {})
+                metadata["anomaly_notes"] = [asdict(note) for note in notes]
+
         body: Dict[str, Any] = {"metrics": metrics}
         if request_count is not None:
             body["request_count"] = request_count
@@ -710,22 +1745,64 @@ class AgentAuthClient:
             body["period_start"] = period_start
         if period_end is not None:
             body["period_end"] = period_end
-        if signature is not None:
-            body["signature"] = signature
+        if metadata is not None:
+            body["metadata"] = metadata
+        return body
+
+    async def _deliver_health_ping(
+        self, agent_id: str, body: Dict[str, Any]
+    ) -> Optional[HealthPingResponse]:
+        """Post a signed body, or spool it when a spool is configured and needed"""
+        spool = self.ping_spool
+        if spool is None:
+            return await self.post_health_ping(agent_id, body)
+        if len(spool):
+            spool.append(agent_id, body)
+            return None
+        try:
+            return await self.post_health_ping(agent_id, body)
+        except Exception as e:
+            if not is_retryable_failure(e):
+                raise
+            logger.warning("Spooling health ping for %s: %s", agent_id, e)
+            spool.append(agent_id, body)
+            return None
+
+    async def post_health_ping(self, agent_id: str, body: Dict[str, Any]) -> HealthPingResponse:
+        """
+        Submit an already-built health ping body as-is.
+
+        No precheck, spike detection or signing is applied; used to replay
+        spooled pings. Once the server accepts the ping, its metrics are
+        recorded in the ``spike_detector`` history.
+
+        Args:
+            agent_id: Agent ID
+            body: Request body (metrics, optional signature, ...)
+
+        Returns:
+            HealthPingResponse with drift score and status
+        """
+        headers: Dict[str, str] = {}
+        if self.api_key:
+            headers["X-Api-Key"] = self.api_key
 
         data = await self._request(
             "POST",
             f"/drift/{agent_id}/health-ping",
             json=body,
             requires_auth=True,
+            headers=headers,
         )
+        if self.spike_detector is not None:
+            self.spike_detector.observe(agent_id, body["metrics"])
         return HealthPingResponse(**data)
 
     async def batch_submit_health_pings(
         self,
         agent_id: str,
         pings: List[Dict[str, Any]],
-    ) -> List[HealthPingResponse]:
+    ) -> List[Optional[HealthPingResponse]]:
         """
         Submit a batch of health pings.
 
@@ -734,21 +1811,75 @@ class AgentAuthClient:
             pings: List of ping data dicts (each with metrics, etc.)
 
         Returns:
-            List of HealthPingResponse for each ping
+            List of HealthPingResponse for each ping (None for spooled pings)
         """
-        results = []
+        bodies = []
         for ping in pings:
-            result = await self.submit_health_ping(
-                agent_id=agent_id,
-                metrics=ping["metrics"],
+            body = await self._health_ping_body(
+                agent_id,
+                ping["metrics"],
                 request_count=ping.get("request_count"),
                 period_start=ping.get("period_start"),
                 period_end=ping.get("period_end"),
-                signature=ping.get("signature"),
+                metadata=ping.get("metadata"),
+                annotate=ping.get("signature") is None,
             )
-            results.append(result)
+            if ping.get("signature") is not None:
+                body["signature"] = ping["signature"]
+            bodies.append(body)
+
+        if self.sign_pings:
+            unsigned = [body for body in bodies if "signature" not in body]
+            # Large batches are canonicalized and signed off the event loop
+            if self.offloader is not None and self.offloader.should_offload(items=len(unsigned)):
+                signatures = await self.offloader.run(
+                    sign_ping_batch, cast(str, self.api_key), unsigned, items=len(unsigned)
+                )
+            else:
+                signatures = self._signer().sign_many(unsigned)
+            for body, signature in zip(unsigned, signatures):
+                body["signature"] = signature
+
+        results = []
+        for body in bodies:
+            results.append(await self._deliver_health_ping(agent_id, body))
         return results
 
+    async def project_drift_score(
+        self,
+        agent_id: str,
+        metrics: Dict[str, float],
+    ) -> Tuple[float, DriftConfig]:
+        """
+        Compute locally the drift score a health ping would receive.
+
+        Uses the cached drift config, so repeated calls make no requests.
+
+        Args:
+            agent_id: Agent ID
+            metrics: Metrics about to be submitted
+
+        Returns:
+            Tuple of (projected drift score, drift config used)
+        """
+        config = await self.get_drift_config(agent_id)
+        score = calculate_drift_score(metrics, config.baseline_metrics, config.metric_weights)
+        return score, config
+
+    async def _precheck_drift(self, agent_id: str, metrics: Dict[str, float]) -> None:
+        """Raise or warn if a ping would push the agent over its auto-revoke threshold"""
+        score, config = await self.project_drift_score(agent_id, metrics)
+        if not config.auto_revoke or score < config.drift_threshold:
+            return
+
+        message = (
+            f"Health ping for {agent_id} would reach drift score {score} "
+            f"(threshold {config.drift_threshold}) and auto-revoke the agent"
+        )
+        if self.drift_precheck == "raise":
+            raise DriftThresholdError(message, drift_score=score, threshold=config.drift_threshold)
+        warnings.warn(message, RuntimeWarning, stacklevel=3)
+
     async def get_drift_score(self, agent_id: str) -> DriftScoreResponse:
         """
         Get current drift score, thresholds, trend, and spike warnings.
@@ -762,6 +1893,7 @@ class AgentAuthClient:
         data = await self._request(
             "GET",
             f"/drift/{agent_id}/drift-score",
+            route="GET /drift/{id}/drift-score",
         )
         return DriftScoreResponse(**data)
 
@@ -810,7 +1942,12 @@ class AgentAuthClient:
             f"/drift/{agent_id}/drift-history",
             params=params,
         )
-        return DriftHistoryResponse(**data)
+        return DriftHistoryResponse(
+            history=drift_history_records(data["history"] or []),
+            total=data["total"],
+            limit=data["limit"],
+            offset=data["offset"],
+        )
 
     async def configure_drift(
         self,
@@ -827,29 +1964,68 @@ class AgentAuthClient:
         Returns:
             DriftConfig with updated configuration
         """
+        key = f"drift_config:{agent_id}"
+        self.cache.delete(key)
+
         data = await self._request(
             "PUT",
             f"/drift/{agent_id}/drift-config",
             json=config,
             requires_auth=True,
         )
-        return DriftConfig(**data)
+        self.cache.set(key, data, ttl=self.drift_config_ttl)
+        return self._drift_config_from(agent_id, data)
 
-    async def get_drift_config(self, agent_id: str) -> DriftConfig:
+    async def get_drift_config(self, agent_id: str, use_cache: bool = True) -> DriftConfig:
         """
         Get drift configuration for an agent.
 
+        Results are cached for ``drift_config_ttl`` seconds and invalidated by
+        ``configure_drift``. Agents without a config get the server defaults.
+
         Args:
             agent_id: Agent ID
+            use_cache: Whether a cached config may be returned (default: True)
 
         Returns:
             DriftConfig for the agent
         """
-        data = await self._request(
-            "GET",
-            f"/drift/{agent_id}/drift-config",
-        )
-        return DriftConfig(**data)
+        if use_cache:
+            cached = self._cached(
+                f"drift_config:{agent_id}", lambda: self._fetch_drift_config(agent_id)
+            )
+            if cached is not None:
+                return self._drift_config_from(agent_id, cached)
+        return self._drift_config_from(agent_id, await self._fetch_drift_config(agent_id))
+
+    async def _fetch_drift_config(self, agent_id: str) -> Dict[str, Any]:
+        """Fetch and cache an agent's drift config payload"""
+        try:
+            data = await self._request(
+                "GET",
+                f"/drift/{agent_id}/drift-config",
+                route="GET /drift/{id}/drift-config",
+            )
+        except AgentAuthError as e:
+            if e.status_code != 404:
+                raise
+            # No config row yet: the server applies its defaults
+            data = {"agent_id": agent_id}
+
+        self.cache.set(f"drift_config:{agent_id}", data, ttl=self.drift_config_ttl)
+        return data
+
+    def _drift_config_from(self, agent_id: str, data: Dict[str, Any]) -> DriftConfig:
+        """Build a DriftConfig and keep the spike detector's sensitivity in sync"""
+        config = dataclass_from_dict(DriftConfig, {"agent_id": agent_id, **data})
+        # Columns left NULL in the database fall back to server defaults
+        defaults = DriftConfig(agent_id=agent_id)
+        for name in ("drift_threshold", "warning_threshold", "auto_revoke", "spike_sensitivity"):
+            if getattr(config, name) is None:
+                setattr(config, name, getattr(defaults, name))
+        if self.spike_detector is not None:
+            self.spike_detector.set_sensitivity(agent_id, config.spike_sensitivity)
+        return config
 
     async def close(self) -> None:
         """Close the HTTP client"""
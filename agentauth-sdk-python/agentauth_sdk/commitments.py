@@ -0,0 +1,317 @@
+"""ZKP commitment lifecycle management for AgentAuth SDK"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .utils import parse_timestamp
+
+if TYPE_CHECKING:
+    from .client import AgentAuthClient
+
+logger = logging.getLogger("agentauth_sdk")
+
+
+@dataclass
+class StoredCommitment:
+    """A registered commitment with its one-time salt"""
+
+    agent_id: str
+    commitment: str
+    salt: str
+    created_at: float
+    expires_at: Optional[float] = None
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        """Whether the commitment has passed its ``expires_at``"""
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) >= self.expires_at
+
+
+class CommitmentStore(ABC):
+    """
+    Storage interface for commitments and their salts.
+
+    The salt is shown once by the server and is the secret behind hash-mode and
+    ZKP verification, so production stores should be backed by a secrets
+    manager or an encrypted keyring.
+    """
+
+    @abstractmethod
+    def load(self, agent_id: str) -> Optional[StoredCommitment]:
+        """Get the stored commitment for an agent"""
+
+    @abstractmethod
+    def save(self, record: StoredCommitment) -> None:
+        """Store the current commitment for an agent, replacing any previous one"""
+
+    @abstractmethod
+    def delete(self, agent_id: str) -> None:
+        """Forget an agent's commitment"""
+
+
+class InMemoryCommitmentStore(CommitmentStore):
+    """Process-local store; commitments are lost on restart"""
+
+    def __init__(self) -> None:
+        self._records: Dict[str, StoredCommitment] = {}
+
+    def load(self, agent_id: str) -> Optional[StoredCommitment]:
+        return self._records.get(agent_id)
+
+    def save(self, record: StoredCommitment) -> None:
+        self._records[record.agent_id] = record
+
+    def delete(self, agent_id: str) -> None:
+        self._records.pop(agent_id, None)
+
+
+class FileCommitmentStore(CommitmentStore):
+    """
+    JSON file store readable only by the owner (mode 0600).
+
+    Writes go to a temporary file that is renamed into place, so a crash never
+    leaves a half-written file.
+
+    Example:
+        >>> store = FileCommitmentStore("/var/lib/myservice/commitments.json")
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store
+
+        Args:
+            path: JSON file path (created on first save)
+        """
+        self.path = path
+
+    def _read(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)  # type: ignore[no-any-return]
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, records: Dict[str, Dict[str, object]]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".commitments-")
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(records, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, agent_id: str) -> Optional[StoredCommitment]:
+        data = self._read().get(agent_id)
+        return StoredCommitment(**data) if data else None  # type: ignore[arg-type]
+
+    def save(self, record: StoredCommitment) -> None:
+        records = self._read()
+        records[record.agent_id] = asdict(record)
+        self._write(records)
+
+    def delete(self, agent_id: str) -> None:
+        records = self._read()
+        if records.pop(agent_id, None) is not None:
+            self._write(records)
+
+
+class CommitmentManager:
+    """
+    Keeps a valid ZKP commitment for one agent, renewing it in the background.
+
+    The commitment and its one-time salt are persisted in a
+    :class:`CommitmentStore`. A background task registers a replacement once
+    ``renew_before`` of the commitment's lifetime remains (with jitter, so a
+    fleet doesn't renew in lockstep), and :meth:`current` hands out the latest
+    commitment without a network call. Failed renewals are retried with
+    backoff while the previous commitment is still valid.
+
+    Example:
+        >>> manager = CommitmentManager(client, agent_id, api_key, expires_in=3600)
+        >>> await manager.start()
+        >>> record = manager.current()  # no network call
+        >>> await client.verify_anonymous(record.commitment, mode="hash",
+        ...                               preimage_hash=record.commitment)
+        >>> await manager.stop()
+    """
+
+    def __init__(
+        self,
+        client: "AgentAuthClient",
+        agent_id: str,
+        api_key: str,
+        store: Optional[CommitmentStore] = None,
+        expires_in: Optional[int] = 3600,
+        renew_before: float = 0.2,
+        jitter: float = 0.05,
+        retry_interval: float = 30.0,
+        revoke_previous: bool = False,
+    ):
+        """
+        Initialize the manager
+
+        Args:
+            client: AgentAuth client
+            agent_id: Agent ID
+            api_key: Agent API key (used to register commitments)
+            store: Commitment store (default: in-memory)
+            expires_in: Lifetime of each commitment in seconds, or None for
+                commitments that never expire (no renewal)
+            renew_before: Fraction of the lifetime left when renewal starts
+            jitter: Random spread of the renewal time, as a fraction of the lifetime
+            retry_interval: Initial delay between failed renewal attempts
+            revoke_previous: Revoke the old commitment after a renewal instead of
+                letting it expire (in-flight verifications of it will fail)
+        """
+        self.client = client
+        self.agent_id = agent_id
+        self.api_key = api_key
+        self.store: CommitmentStore = store if store is not None else InMemoryCommitmentStore()
+        self.expires_in = expires_in
+        self.renew_before = renew_before
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.revoke_previous = revoke_previous
+
+        self._current: Optional[StoredCommitment] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    # ============================================
+    # Hot path
+    # ============================================
+
+    def current(self) -> StoredCommitment:
+        """
+        Get the current commitment without a network call
+
+        Returns:
+            StoredCommitment with commitment and salt
+
+        Raises:
+            RuntimeError: If the manager has no unexpired commitment
+                (not started, or renewals have been failing)
+        """
+        record = self._current
+        if record is None or record.expired():
+            raise RuntimeError(f"No valid commitment for agent {self.agent_id}")
+        return record
+
+    # ============================================
+    # Lifecycle
+    # ============================================
+
+    async def start(self) -> StoredCommitment:
+        """
+        Load the stored commitment (renewing it if due) and start background renewal
+
+        Returns:
+            The current commitment
+        """
+        loop = asyncio.get_running_loop()
+        # File-backed stores fsync; keep their I/O off the event loop
+        record = await loop.run_in_executor(None, self.store.load, self.agent_id)
+        if record is None or self._renew_at(record) <= time.time():
+            record = await self.renew()
+        else:
+            self._current = record
+            if self.client.verification_cache is not None:
+                self.client.verification_cache.set_expiry(record.commitment, record.expires_at)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._renew_loop())
+        return record
+
+    async def stop(self) -> None:
+        """Stop background renewal"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def renew(self) -> StoredCommitment:
+        """
+        Register a new commitment now and persist it
+
+        Returns:
+            The new commitment
+        """
+        async with self._lock:
+            previous = self._current
+            response = await self.client.register_commitment(
+                self.agent_id, self.api_key, expires_in=self.expires_in
+            )
+            record = StoredCommitment(
+                agent_id=self.agent_id,
+                commitment=response.commitment,
+                salt=response.salt,
+                created_at=time.time(),
+                expires_at=parse_timestamp(response.expires_at),
+            )
+            await asyncio.get_running_loop().run_in_executor(None, self.store.save, record)
+            self._current = record
+
+        if self.revoke_previous and previous is not None and not previous.expired():
+            try:
+                await self.client.revoke_commitment(previous.commitment)
+            except Exception as e:
+                logger.warning("Revoking previous commitment for %s failed: %s", self.agent_id, e)
+        return record
+
+    def _renew_at(self, record: StoredCommitment) -> float:
+        """When the background task should replace ``record``"""
+        if record.expires_at is None:
+            return float("inf")
+        lifetime = max(0.0, record.expires_at - record.created_at)
+        spread = lifetime * self.jitter
+        return record.expires_at - lifetime * self.renew_before + random.uniform(-spread, spread)
+
+    async def _renew_loop(self) -> None:
+        failures = 0
+        while True:
+            record = self._current
+            if failures:
+                # Retry with backoff, but don't sleep past an expiry still ahead;
+                # once the commitment has expired, keep backing off
+                delay = min(self.retry_interval * 2 ** (failures - 1), 600.0)
+                if record is not None and record.expires_at is not None:
+                    remaining = record.expires_at - time.time()
+                    if remaining > 0:
+                        delay = min(delay, max(1.0, remaining))
+            elif record is None:
+                delay = 0.0
+            else:
+                renew_at = self._renew_at(record)
+                if renew_at == float("inf"):
+                    return
+                delay = max(0.0, renew_at - time.time())
+
+            await asyncio.sleep(delay)
+            try:
+                await self.renew()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                logger.warning(
+                    "Commitment renewal for %s failed (attempt %d): %s", self.agent_id, failures, e
+                )
@@ -0,0 +1,295 @@
+"""Indexed local replica of the agent directory for AgentAuth SDK"""
+
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from .permissions import covering_permissions
+from .types import Agent, WebhookEvent
+
+if TYPE_CHECKING:
+    from .client import AgentAuthClient
+
+# Watermark used for the initial load: every agent is "updated since" the epoch
+_EPOCH = "1970-01-01T00:00:00.000Z"
+
+
+class AgentDirectory:
+    """
+    In-memory replica of ``list_agents`` with hash indexes.
+
+    The directory is loaded once and then refreshed incrementally: each refresh
+    asks the API only for agents whose ``updated_at`` is newer than the last one
+    seen, so refresh cost scales with churn rather than fleet size. Lookups by
+    agent ID, owner email, status, tier and permission are dictionary hits.
+
+    Example:
+        >>> directory = AgentDirectory(client)
+        >>> await directory.load()
+        >>> agent = directory.get("agt_abc123")
+        >>> writers = directory.with_permission("slack:messages:write")
+        >>> changed = await directory.refresh()
+    """
+
+    def __init__(self, client: "AgentAuthClient", page_size: int = 100):
+        """
+        Initialize the directory
+
+        Args:
+            client: Authenticated AgentAuth client (admin token)
+            page_size: Agents requested per page (server maximum: 100)
+        """
+        self.client = client
+        self.page_size = page_size
+        self.watermark: Optional[str] = None
+        self._agents: Dict[str, Agent] = {}
+        self._by_owner: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_tier: Dict[str, Set[str]] = {}
+        self._by_permission: Dict[str, Set[str]] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    # ============================================
+    # Loading
+    # ============================================
+
+    async def load(self) -> int:
+        """
+        Load the full directory, discarding any previous state
+
+        Returns:
+            Number of agents loaded
+        """
+        async with self._lock:
+            self._clear()
+            return await self._sync(_EPOCH)
+
+    async def refresh(self) -> int:
+        """
+        Fetch agents changed since the last load or refresh
+
+        Returns:
+            Number of agents added or updated
+        """
+        async with self._lock:
+            return await self._sync(self.watermark or _EPOCH)
+
+    async def _sync(self, since: str) -> int:
+        """Page through agents updated after ``since`` and apply them"""
+        changed: Set[str] = set()
+        offset = 0
+        newest = self.watermark
+
+        while True:
+            page = await self.client.list_agents(
+                limit=self.page_size,
+                offset=offset or None,
+                updated_since=since,
+            )
+            for agent in page:
+                self.upsert(agent)
+                changed.add(agent.agent_id)
+                if agent.updated_at and (newest is None or agent.updated_at > newest):
+                    newest = agent.updated_at
+
+            if len(page) < self.page_size:
+                break
+
+            # Keyset pagination on updated_at. Resume from the newest timestamp
+            # strictly older than the page's last one, so agents sharing that
+            # last timestamp are re-read instead of skipped at the boundary.
+            last = page[-1].updated_at
+            earlier = [a.updated_at for a in page if a.updated_at and a.updated_at < last]
+            if earlier:
+                since = max(earlier)
+                offset = 0
+            else:
+                # Whole page shares one timestamp; fall back to offsets
+                offset += self.page_size
+
+        self.watermark = newest
+        return len(changed)
+
+    def start(self, interval: float = 30.0) -> None:
+        """
+        Refresh the directory in the background every ``interval`` seconds
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._refresh_loop(interval))
+
+    async def stop(self) -> None:
+        """Stop background refreshing"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception:
+                # Keep serving the last good replica; the next tick retries
+                pass
+
+    # ============================================
+    # Index maintenance
+    # ============================================
+
+    def upsert(self, agent: Agent) -> None:
+        """
+        Insert or replace an agent and update all indexes
+
+        Args:
+            agent: Agent to store
+        """
+        self.remove(agent.agent_id)
+        self._agents[agent.agent_id] = agent
+        self._by_owner.setdefault(agent.owner_email, set()).add(agent.agent_id)
+        self._by_status.setdefault(agent.status, set()).add(agent.agent_id)
+        self._by_tier.setdefault(agent.tier, set()).add(agent.agent_id)
+        for permission in agent.permissions or []:
+            self._by_permission.setdefault(permission, set()).add(agent.agent_id)
+
+    def remove(self, agent_id: str) -> Optional[Agent]:
+        """
+        Drop an agent from the replica (e.g. after ``agent.deleted``)
+
+        Args:
+            agent_id: Agent ID
+
+        Returns:
+            The removed agent, or None if it was not present
+        """
+        agent = self._agents.pop(agent_id, None)
+        if agent is None:
+            return None
+        _discard(self._by_owner, agent.owner_email, agent_id)
+        _discard(self._by_status, agent.status, agent_id)
+        _discard(self._by_tier, agent.tier, agent_id)
+        for permission in agent.permissions or []:
+            _discard(self._by_permission, permission, agent_id)
+        return agent
+
+    def handle_webhook_event(self, event: WebhookEvent) -> bool:
+        """
+        Apply an agent webhook to the replica without waiting for a refresh
+
+        Handles the agent events webhooks can subscribe to: ``agent.updated``
+        (status, tier and permissions), ``tier.upgraded``/``tier.downgraded``,
+        ``permissions.updated``, ``agent.deleted`` and auto-revoking
+        ``agent.drift.revoked``. Fields are read from ``data`` or, if present,
+        ``data["agent"]``. Events for agents not in the replica are ignored;
+        the next refresh picks them up. Can be registered on a WebhookReceiver.
+
+        Args:
+            event: Received webhook event
+
+        Returns:
+            True if the replica changed
+        """
+        agent_id = event.agent_id or event.data.get("agent_id")
+        if not agent_id:
+            return False
+        if event.event == "agent.deleted":
+            return self.remove(agent_id) is not None
+
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            return False
+
+        data = event.data.get("agent")
+        if not isinstance(data, dict):
+            data = event.data
+        changes: Dict[str, Any] = {}
+        if event.event in ("agent.updated", "tier.upgraded", "tier.downgraded"):
+            if isinstance(data.get("tier"), str):
+                changes["tier"] = data["tier"]
+        if event.event == "agent.updated" and isinstance(data.get("status"), str):
+            changes["status"] = data["status"]
+        if event.event in ("agent.updated", "permissions.updated"):
+            if isinstance(data.get("permissions"), list):
+                changes["permissions"] = list(data["permissions"])
+        if event.event == "agent.drift.revoked" and event.data.get("auto_revoked"):
+            changes["status"] = "revoked"
+        if not changes:
+            return False
+
+        updated = replace(agent, **changes)
+
+        if updated == agent:
+            return False
+        self.upsert(updated)
+        return True
+
+    def _clear(self) -> None:
+        self._agents.clear()
+        self._by_owner.clear()
+        self._by_status.clear()
+        self._by_tier.clear()
+        self._by_permission.clear()
+        self.watermark = None
+
+    # ============================================
+    # Lookups
+    # ============================================
+
+    def get(self, agent_id: str) -> Optional[Agent]:
+        """Get an agent by ID"""
+        return self._agents.get(agent_id)
+
+    def by_owner(self, owner_email: str) -> List[Agent]:
+        """List agents owned by ``owner_email``"""
+        return self._resolve(self._by_owner.get(owner_email, ()))
+
+    def by_status(self, status: str) -> List[Agent]:
+        """List agents with the given status"""
+        return self._resolve(self._by_status.get(status, ()))
+
+    def by_tier(self, tier: str) -> List[Agent]:
+        """List agents on the given tier"""
+        return self._resolve(self._by_tier.get(tier, ()))
+
+    def with_permission(self, permission: str) -> List[Agent]:
+        """
+        List agents granted ``permission``, directly or through a wildcard
+
+        Args:
+            permission: Required permission, e.g. ``"slack:messages:write"``
+
+        Returns:
+            Matching agents
+        """
+        ids: Set[str] = set()
+        for candidate in covering_permissions(permission):
+            ids.update(self._by_permission.get(candidate, ()))
+        return self._resolve(ids)
+
+    def _resolve(self, ids: Iterable[str]) -> List[Agent]:
+        return [self._agents[agent_id] for agent_id in ids]
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._agents
+
+    def __iter__(self) -> Iterator[Agent]:
+        return iter(list(self._agents.values()))
+
+
+def _discard(index: Dict[str, Set[str]], key: str, agent_id: str) -> None:
+    """Remove ``agent_id`` from ``index[key]``, dropping empty buckets"""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.discard(agent_id)
+        if not bucket:
+            del index[key]
@@ -0,0 +1,311 @@
+"""Client-side drift helpers for AgentAuth SDK"""
+
+import math
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .types import AnomalyNote
+
+
+def _round(value: float, digits: int) -> float:
+    """Round half up like JavaScript's ``Math.round(x * 10**d) / 10**d``"""
+    scale = 10.0**digits
+    return math.floor(value * scale + 0.5) / scale
+
+
+def calculate_drift_score(
+    current_metrics: Optional[Dict[str, float]],
+    baseline_metrics: Optional[Dict[str, float]],
+    weights: Optional[Dict[str, float]] = None,
+) -> float:
+    """
+    Compute the drift score exactly as the server's ``calculateDriftScore``
+
+    Each weighted metric contributes ``min(|current - baseline| / |baseline|, 1)``
+    (or ``|current|`` when the baseline is 0); the score is the weighted mean,
+    rounded to 10 decimal places. Without weights all current metrics count equally.
+
+    Args:
+        current_metrics: Metric values being submitted
+        baseline_metrics: Baseline from the agent's drift config
+        weights: Optional metric weights from the drift config
+
+    Returns:
+        Drift score between 0 and 1
+    """
+    if not baseline_metrics or not current_metrics:
+        return 0.0
+
+    effective_weights = weights or {key: 1 / len(current_metrics) for key in current_metrics}
+
+    weighted_sum = 0.0
+    weight_sum = 0.0
+    for metric, weight in effective_weights.items():
+        current = current_metrics.get(metric)
+        baseline = baseline_metrics.get(metric)
+        if current is None or baseline is None:
+            continue
+        if baseline == 0:
+            delta = abs(current)
+        else:
+            delta = abs(current - baseline) / abs(baseline)
+        weighted_sum += min(delta, 1.0) * weight
+        weight_sum += weight
+
+    if weight_sum == 0:
+        return 0.0
+
+    return _round(weighted_sum / weight_sum, 10)
+
+
+class MetricRingBuffer:
+    """
+    Fixed-capacity ring buffer of metric samples with running statistics.
+
+    Samples live in a preallocated ``array('d')``; pushing overwrites the oldest
+    slot, and mean/variance are maintained with Welford's update (plus the
+    matching downdate for the evicted sample), so every operation is O(1) and
+    allocation-free.
+
+    Example:
+        >>> buf = MetricRingBuffer(capacity=10)
+        >>> for v in (0.1, 0.12, 0.11):
+        ...     buf.push(v)
+        >>> round(buf.mean, 2)
+        0.11
+    """
+
+    __slots__ = ("capacity", "_values", "_head", "_count", "_mean", "_m2")
+
+    def __init__(self, capacity: int = 10):
+        """
+        Initialize the buffer
+
+        Args:
+            capacity: Number of samples kept (server keeps the last 10 pings)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, value: float) -> None:
+        """
+        Append a sample, evicting the oldest one when full
+
+        Args:
+            value: Metric value
+        """
+        if self._count == self.capacity:
+            self._remove(self._values[self._head])
+
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+
+        # Welford update
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, value: float) -> None:
+        """Welford downdate for an evicted sample"""
+        if self._count <= 1:
+            self._count = 0
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        old_mean = self._mean
+        self._count -= 1
+        self._mean = (old_mean * (self._count + 1) - value) / self._count
+        # Clamp rounding error so variance never goes negative
+        self._m2 = max(0.0, self._m2 - (value - old_mean) * (value - self._mean))
+
+    @property
+    def mean(self) -> float:
+        """Mean of buffered samples"""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Population variance of buffered samples (matches the server's stddev)"""
+        return self._m2 / self._count if self._count >= 2 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Population standard deviation of buffered samples"""
+        return math.sqrt(self.variance)
+
+    def values(self) -> List[float]:
+        """Buffered samples, oldest first"""
+        start = (self._head - self._count) % self.capacity
+        return [self._values[(start + i) % self.capacity] for i in range(self._count)]
+
+    def clear(self) -> None:
+        """Drop all samples"""
+        self._head = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+
+class SpikeDetector:
+    """
+    Local std-dev spike detection mirroring the server's ``detectSpikes``.
+
+    Keeps one :class:`MetricRingBuffer` per agent and metric. A metric is flagged
+    when ``|value - mean| / stddev`` exceeds the sensitivity, once at least
+    ``min_samples`` previous values exist. Unlike the server's 500-agent LRU,
+    history here survives server restarts and cache eviction; it is bounded by
+    its own LRU of ``max_agents`` agents.
+
+    Example:
+        >>> detector = SpikeDetector()
+        >>> notes = detector.process("agt_abc123", {"toxicity_score": 0.9})
+    """
+
+    def __init__(
+        self,
+        window: int = 10,
+        sensitivity: float = 2.0,
+        min_samples: int = 3,
+        max_agents: int = 10000,
+    ):
+        """
+        Initialize the detector
+
+        Args:
+            window: Samples kept per agent and metric (default: 10, as on the server)
+            sensitivity: Default spike threshold in standard deviations
+            min_samples: Samples required before spikes are reported
+            max_agents: Agents whose history is kept; the least recently
+                observed agent is dropped beyond that
+        """
+        self.window = window
+        self.sensitivity = sensitivity
+        self.min_samples = min_samples
+        self.max_agents = max_agents
+        self._buffers: "OrderedDict[str, Dict[str, MetricRingBuffer]]" = OrderedDict()
+        self._sensitivity: Dict[str, float] = {}
+
+    def set_sensitivity(self, agent_id: str, sensitivity: Optional[float]) -> None:
+        """
+        Override the spike threshold for one agent (``DriftConfig.spike_sensitivity``)
+
+        Args:
+            agent_id: Agent ID
+            sensitivity: Threshold in standard deviations, or None for the default
+        """
+        if sensitivity is None:
+            self._sensitivity.pop(agent_id, None)
+        else:
+            self._sensitivity[agent_id] = sensitivity
+
+    def _agent_buffers(self, agent_id: str) -> Dict[str, MetricRingBuffer]:
+        buffers = self._buffers.get(agent_id)
+        if buffers is None:
+            buffers = self._buffers[agent_id] = {}
+            while len(self._buffers) > self.max_agents:
+                self._buffers.popitem(last=False)
+        else:
+            self._buffers.move_to_end(agent_id)
+        return buffers
+
+    def check(
+        self,
+        agent_id: str,
+        metrics: Dict[str, float],
+        sensitivity: Optional[float] = None,
+    ) -> List[AnomalyNote]:
+        """
+        Compare metrics against buffered history without recording them
+
+        Args:
+            agent_id: Agent ID
+            metrics: Metric name to value
+            sensitivity: Optional threshold override for this call
+
+        Returns:
+            Anomaly notes, rounded like the server's
+        """
+        threshold = sensitivity or self._sensitivity.get(agent_id) or self.sensitivity
+        notes: List[AnomalyNote] = []
+        buffers = self._buffers.get(agent_id, {})
+
+        for metric, value in metrics.items():
+            buf = buffers.get(metric)
+            if buf is None or len(buf) < self.min_samples:
+                continue
+            sd = buf.stddev
+            if sd == 0:
+                continue
+            delta = abs(value - buf.mean) / sd
+            if delta > threshold:
+                notes.append(
+                    AnomalyNote(
+                        metric=metric,
+                        delta=_round(delta, 2),
+                        threshold=threshold,
+                        mean=_round(buf.mean, 6),
+                        stddev=_round(sd, 6),
+                        current_value=value,
+                    )
+                )
+
+        return notes
+
+    def observe(self, agent_id: str, metrics: Dict[str, float]) -> None:
+        """
+        Record metrics into the agent's history
+
+        Args:
+            agent_id: Agent ID
+            metrics: Metric name to value
+        """
+        buffers = self._agent_buffers(agent_id)
+        for metric, value in metrics.items():
+            buf = buffers.get(metric)
+            if buf is None:
+                buf = buffers[metric] = MetricRingBuffer(self.window)
+            buf.push(value)
+
+    def process(
+        self,
+        agent_id: str,
+        metrics: Dict[str, float],
+        sensitivity: Optional[float] = None,
+    ) -> List[AnomalyNote]:
+        """
+        Check metrics against history, then record them (server order)
+
+        Args:
+            agent_id: Agent ID
+            metrics: Metric name to value
+            sensitivity: Optional threshold override for this call
+
+        Returns:
+            Anomaly notes for this sample
+        """
+        notes = self.check(agent_id, metrics, sensitivity)
+        self.observe(agent_id, metrics)
+        return notes
+
+    def reset(self, agent_id: Optional[str] = None) -> None:
+        """
+        Drop history for one agent, or for all agents
+
+        Args:
+            agent_id: Agent ID, or None to reset everything
+        """
+        if agent_id is None:
+            self._buffers.clear()
+        else:
+            self._buffers.pop(agent_id, None)
@@ -0,0 +1,347 @@
+"""Offline Groth16 proof verification for AgentAuth SDK"""
+
+import asyncio
+import json
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # Optional: pure-Python BN254 pairing
+    from py_ecc.fields import optimized_bn128_FQ as FQ
+    from py_ecc.fields import optimized_bn128_FQ2 as FQ2
+    from py_ecc.fields import optimized_bn128_FQ12 as FQ12
+    from py_ecc.optimized_bn128.optimized_curve import (
+        Z1,
+        add,
+        b,
+        b2,
+        curve_order,
+        is_inf,
+        is_on_curve,
+        multiply,
+        neg,
+    )
+    from py_ecc.optimized_bn128.optimized_pairing import final_exponentiate, pairing
+except ImportError:  # pragma: no cover - exercised only without py_ecc
+    pairing = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .offload import Offloader
+
+# (proof, public_signals) as produced by snarkjs
+ProofItem = Tuple[Dict[str, Any], List[str]]
+
+# Bits of the random scalars in a batch check (soundness error ~2^-128)
+BATCH_SCALAR_BITS = 128
+
+
+def _require_py_ecc() -> None:
+    if pairing is None:
+        raise ImportError(
+            "Groth16Verifier requires py_ecc. "
+            "Install it with: pip install umytbaynazarow-agentauth-sdk[zkp]"
+        )
+
+
+def _scalar(value: Any) -> int:
+    """Parse a snarkjs field element (decimal or 0x-hex string)"""
+    text = str(value)
+    return int(text, 16) if text.lower().startswith("0x") else int(text)
+
+
+def _g1(coords: Sequence[Any]) -> Any:
+    """Parse a snarkjs G1 point ``[x, y, z]``"""
+    x, y = _scalar(coords[0]), _scalar(coords[1])
+    z = _scalar(coords[2]) if len(coords) > 2 else 1
+    if z == 0:
+        return Z1
+    point = (FQ(x), FQ(y), FQ(z))
+    if not is_on_curve(point, b):
+        raise ValueError("G1 point is not on the curve")
+    return point
+
+
+def _g2(coords: Sequence[Sequence[Any]]) -> Any:
+    """Parse a snarkjs G2 point ``[[x0, x1], [y0, y1], [z0, z1]]``"""
+    x = FQ2([_scalar(c) for c in coords[0]])
+    y = FQ2([_scalar(c) for c in coords[1]])
+    z = FQ2([_scalar(c) for c in coords[2]]) if len(coords) > 2 else FQ2.one()
+    if z == FQ2.zero():
+        return (FQ2.one(), FQ2.one(), FQ2.zero())
+    point = (x, y, z)
+    if not is_on_curve(point, b2):
+        raise ValueError("G2 point is not on the curve")
+    # G2 has a cofactor, so also check the point is in the prime-order subgroup
+    if not is_inf(multiply(point, curve_order)):
+        raise ValueError("G2 point is not in the prime-order subgroup")
+    return point
+
+
+def _miller(g1_point: Any, g2_point: Any) -> Any:
+    """Miller loop without the final exponentiation"""
+    return pairing(g2_point, g1_point, final_exponentiate=False)
+
+
+class Groth16Verifier:
+    """
+    Verifies snarkjs Groth16 proofs locally against ``verification_key.json``.
+
+    Pure Python on BN254 via the optional ``py_ecc`` dependency. Several proofs
+    can be checked with one randomized pairing product (``verify_batch``), and
+    ``verify_many`` spreads batches over a process pool. Results match
+    ``snarkjs.groth16.verify``; commitment revocation and expiry are still only
+    known to the server.
+
+    Example:
+        >>> verifier = Groth16Verifier.from_file("agentauth/zkp/verification_key.json")
+        >>> verifier.verify(proof, public_signals, commitment=commitment)
+        True
+        >>> verifier.verify_many([(proof, public_signals), ...])
+        [True, ...]
+    """
+
+    def __init__(self, verification_key: Dict[str, Any]):
+        """
+        Initialize the verifier
+
+        Args:
+            verification_key: snarkjs verification key (parsed JSON)
+
+        Raises:
+            ImportError: If py_ecc is not installed
+            ValueError: If the key is a placeholder or malformed
+        """
+        _require_py_ecc()
+        if verification_key.get("protocol", "groth16") != "groth16":
+            raise ValueError("Only groth16 verification keys are supported")
+        if verification_key.get("curve", "bn128") not in ("bn128", "bn254"):
+            raise ValueError("Only bn128 verification keys are supported")
+        if not verification_key.get("IC") or not verification_key.get("vk_alpha_1"):
+            raise ValueError(
+                "Verification key is empty; export it from your trusted setup "
+                "(see agentauth/zkp/README.md)"
+            )
+
+        self.verification_key = verification_key
+        self.alpha = _g1(verification_key["vk_alpha_1"])
+        self.beta = _g2(verification_key["vk_beta_2"])
+        self.gamma = _g2(verification_key["vk_gamma_2"])
+        self.delta = _g2(verification_key["vk_delta_2"])
+        self.ic = [_g1(point) for point in verification_key["IC"]]
+        self.n_public = len(self.ic) - 1
+        # e(alpha, beta) is the same for every proof
+        self._alpha_beta = _miller(self.alpha, self.beta)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Groth16Verifier":
+        """
+        Load a verification key exported by ``snarkjs zkey export verificationkey``
+
+        Args:
+            path: Path to verification_key.json
+
+        Returns:
+            Groth16Verifier
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    # ============================================
+    # Parsing
+    # ============================================
+
+    def _parse(
+        self, proof: Dict[str, Any], public_signals: Sequence[Any]
+    ) -> Optional[Tuple[Any, Any, Any, List[int]]]:
+        """Parse a proof into curve points, or None if it is malformed"""
+        try:
+            if proof.get("protocol", "groth16") != "groth16":
+                return None
+            signals = [_scalar(signal) for signal in public_signals]
+            if len(signals) != self.n_public or any(s >= curve_order for s in signals):
+                return None
+            return _g1(proof["pi_a"]), _g2(proof["pi_b"]), _g1(proof["pi_c"]), signals
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+
+    def _linear_combination(self, signals: Sequence[int]) -> Any:
+        """``IC[0] + sum(signals[i] * IC[i + 1])``"""
+        acc = self.ic[0]
+        for signal, point in zip(signals, self.ic[1:]):
+            if signal:
+                acc = add(acc, multiply(point, signal))
+        return acc
+
+    # ============================================
+    # Verification
+    # ============================================
+
+    def verify(
+        self,
+        proof: Dict[str, Any],
+        public_signals: Sequence[Any],
+        commitment: Optional[str] = None,
+    ) -> bool:
+        """
+        Verify one proof
+
+        Args:
+            proof: snarkjs proof object (pi_a, pi_b, pi_c)
+            public_signals: Public signals
+            commitment: Optional commitment that must equal ``public_signals[0]``,
+                as checked by the server
+
+        Returns:
+            True if the proof is valid
+        """
+        if commitment is not None and (not public_signals or public_signals[0] != commitment):
+            return False
+        parsed = self._parse(proof, public_signals)
+        if parsed is None:
+            return False
+        a, b_point, c, signals = parsed
+
+        # e(-A, B) * e(alpha, beta) * e(vk_x, gamma) * e(C, delta) == 1
+        f = (
+            _miller(neg(a), b_point)
+            * self._alpha_beta
+            * _miller(self._linear_combination(signals), self.gamma)
+            * _miller(c, self.delta)
+        )
+        return bool(final_exponentiate(f) == FQ12.one())
+
+    def verify_batch(self, items: Sequence[ProofItem]) -> bool:
+        """
+        Verify several proofs with one randomized pairing product
+
+        Each proof is weighted by a random scalar, so the combined check costs
+        ``len(items) + 3`` Miller loops and one final exponentiation instead of
+        four pairings per proof. Returns False if any proof is invalid, without
+        saying which; use ``verify_many`` for per-proof results.
+
+        Args:
+            items: (proof, public_signals) pairs
+
+        Returns:
+            True if every proof is valid
+        """
+        if not items:
+            return True
+        if len(items) == 1:
+            return self.verify(*items[0])
+
+        f = FQ12.one()
+        alpha_scalar = 0
+        ic_scalars = [0] * len(self.ic)
+        c_acc = Z1
+
+        for proof, public_signals in items:
+            parsed = self._parse(proof, public_signals)
+            if parsed is None:
+                return False
+            a, b_point, c, signals = parsed
+            r = secrets.randbits(BATCH_SCALAR_BITS) | 1
+
+            f = f * _miller(neg(multiply(a, r)), b_point)
+            alpha_scalar += r
+            ic_scalars[0] += r
+            for index, signal in enumerate(signals, start=1):
+                ic_scalars[index] += r * signal
+            c_acc = add(c_acc, multiply(c, r))
+
+        vk_acc = Z1
+        for scalar, point in zip(ic_scalars, self.ic):
+            scalar %= curve_order
+            if scalar:
+                vk_acc = add(vk_acc, multiply(point, scalar))
+
+        f = (
+            f
+            * _miller(multiply(self.alpha, alpha_scalar % curve_order), self.beta)
+            * _miller(vk_acc, self.gamma)
+            * _miller(c_acc, self.delta)
+        )
+        return bool(final_exponentiate(f) == FQ12.one())
+
+    def verify_many(
+        self,
+        items: Sequence[ProofItem],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 8,
+    ) -> List[bool]:
+        """
+        Verify many proofs in parallel, returning one result per proof
+
+        Proofs are split into chunks of ``chunk_size``; each worker process runs a
+        batch check per chunk and only falls back to individual checks for chunks
+        that fail.
+
+        Args:
+            items: (proof, public_signals) pairs
+            max_workers: Worker processes (default: CPU count)
+            chunk_size: Proofs per batch check
+
+        Returns:
+            Validity of each proof, in order
+        """
+        if not items:
+            return []
+        chunks = [list(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)]
+        if len(chunks) == 1 or max_workers == 1:
+            return [ok for chunk in chunks for ok in _verify_chunk(self, chunk)]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _verify_chunk_with_key, [self.verification_key] * len(chunks), chunks
+            )
+            return [ok for chunk_results in results for ok in chunk_results]
+
+    async def verify_many_async(
+        self,
+        items: Sequence[ProofItem],
+        offloader: "Offloader",
+        chunk_size: int = 8,
+    ) -> List[bool]:
+        """
+        Like ``verify_many``, but awaitable and run in an Offloader's pool
+
+        Pairings are CPU-bound, so every chunk goes to the pool and the event
+        loop stays responsive; the pool is reused across calls.
+
+        Args:
+            items: (proof, public_signals) pairs
+            offloader: Offloader whose pool runs the checks
+            chunk_size: Proofs per batch check
+
+        Returns:
+            Validity of each proof, in order
+        """
+        chunks = [list(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)]
+        results = await asyncio.gather(
+            *(
+                offloader.submit(_verify_chunk_with_key, self.verification_key, chunk)
+                for chunk in chunks
+            )
+        )
+        return [ok for chunk_results in results for ok in chunk_results]
+
+
+def _verify_chunk(verifier: Groth16Verifier, chunk: Sequence[ProofItem]) -> List[bool]:
+    """Batch-check a chunk, falling back to per-proof checks if it fails"""
+    if verifier.verify_batch(chunk):
+        return [True] * len(chunk)
+    return [verifier.verify(proof, signals) for proof, signals in chunk]
+
+
+# Verifier per worker process, so the key is parsed once per process
+_worker_verifiers: Dict[str, Groth16Verifier] = {}
+
+
+def _verify_chunk_with_key(
+    verification_key: Dict[str, Any], chunk: Sequence[ProofItem]
+) -> List[bool]:
+    key = json.dumps(verification_key, sort_keys=True)
+    verifier = _worker_verifiers.get(key)
+    if verifier is None:
+        verifier = _worker_verifiers[key] = Groth16Verifier(verification_key)
+    return _verify_chunk(verifier, chunk)
@@ -0,0 +1,226 @@
+"""Hedged requests for AgentAuth SDK"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, TypeVar
+
+from .utils import is_retryable_failure
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """Per-route hedging counters, as returned by :meth:`HedgePolicy.stats`"""
+
+    route: str
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+    delay: Optional[float] = None
+
+    @property
+    def hedge_rate(self) -> float:
+        """Share of requests that sent a second copy"""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Share of hedges whose second copy answered first"""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class _Route:
+    """Recent latencies of one route and its current hedge delay"""
+
+    __slots__ = ("stats", "samples", "delay", "stale")
+
+    def __init__(self, route: str, window: int):
+        self.stats = HedgeStats(route=route)
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.delay: Optional[float] = None
+        self.stale = 0
+
+
+class HedgePolicy:
+    """
+    Hedges idempotent GET requests to cut tail latency.
+
+    If a request hasn't answered after the route's hedge delay (by default
+    its observed ``percentile`` latency), a second copy is sent; the first
+    successful response wins and the other request is cancelled. A token
+    bucket caps the extra load: every request earns ``budget`` hedges, so
+    ``budget=0.05`` allows at most about 5% more requests over time.
+
+    Only reads marked as hedgeable by the client use the policy (persona,
+    drift score, drift config and agent lookups).
+
+    Example:
+        >>> hedging = HedgePolicy(percentile=0.95, budget=0.05)
+        >>> client = AgentAuthClient(base_url, hedge_policy=hedging)
+        >>> stats = hedging.stats()["GET /agents/{id}/persona"]
+        >>> print(stats.hedge_rate, stats.win_rate)
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        max_delay: float = 2.0,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        window: int = 500,
+        min_samples: int = 20,
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            delay: Fixed hedge delay in seconds (default: derived per route
+                from observed latency)
+            percentile: Observed latency percentile used as the delay
+            min_delay: Lower bound of a derived delay in seconds
+            max_delay: Upper bound of a derived delay in seconds
+            budget: Hedges earned per request (0.05 = at most ~5% extra load)
+            burst: Hedges that can be saved up for a burst of slow responses
+            window: Recent latencies kept per route
+            min_samples: Latencies a route needs before a derived delay is used
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.fixed_delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self._tokens = burst
+        self._routes: Dict[str, _Route] = {}
+
+    def _route(self, route: str) -> _Route:
+        state = self._routes.get(route)
+        if state is None:
+            state = self._routes[route] = _Route(route, self.window)
+        return state
+
+    # ============================================
+    # Delay and budget
+    # ============================================
+
+    def delay_for(self, route: str) -> Optional[float]:
+        """Current hedge delay of a route, or None while it has too few samples"""
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        state = self._routes.get(route)
+        return state.delay if state is not None else None
+
+    def _observe(self, state: _Route, latency: float) -> None:
+        state.samples.append(latency)
+        state.stale += 1
+        # Re-sorting the window on every response would cost more than it tells us
+        if len(state.samples) >= self.min_samples and (state.delay is None or state.stale >= 16):
+            ordered = sorted(state.samples)
+            value = ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+            state.delay = min(self.max_delay, max(self.min_delay, value))
+            state.stale = 0
+        state.stats.delay = self.delay_for(state.stats.route)
+
+    def _take_token(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    # ============================================
+    # Execution
+    # ============================================
+
+    async def run(self, route: str, send: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call ``send``, hedging it with a second call if it is slow
+
+        Args:
+            route: Route template used for latency tracking and stats
+                (e.g. "GET /agents/{id}/persona")
+            send: Issues one request; must be safe to call twice
+
+        Returns:
+            The first successful result
+
+        Raises:
+            Exception: A non-retryable error as soon as either request returns
+                it, otherwise the primary request's error once both failed
+        """
+        state = self._route(route)
+        stats = state.stats
+        stats.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+
+        delay = self.delay_for(route)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(send())
+        pending: Set["asyncio.Future[T]"] = {primary}
+        hedge: Optional["asyncio.Future[T]"] = None
+        hedge_started = 0.0
+        first_error: Optional[BaseException] = None
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    if self._take_token():
+                        stats.hedged += 1
+                        hedge_started = time.perf_counter()
+                        hedge = asyncio.ensure_future(send())
+                        pending.add(hedge)
+                    else:
+                        stats.budget_denied += 1
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        now = time.perf_counter()
+                        if task is hedge:
+                            stats.hedge_wins += 1
+                            self._observe(state, now - hedge_started)
+                            if primary in pending:
+                                # The losing primary took at least this long; sampling only
+                                # winners would skew the delay toward fast responses
+                                self._observe(state, now - started)
+                        else:
+                            self._observe(state, now - started)
+                        return task.result()
+                    if first_error is None or task is primary:
+                        first_error = error
+                    if not isinstance(error, Exception) or not is_retryable_failure(error):
+                        raise error
+            assert first_error is not None
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_consume)
+
+    def stats(self) -> Dict[str, HedgeStats]:
+        """Snapshot of per-route counters"""
+        return {route: HedgeStats(**state.stats.__dict__) for route, state in self._routes.items()}
+
+    @property
+    def available_hedges(self) -> float:
+        """Hedges the budget currently allows"""
+        return self._tokens
+
+
+def _consume(task: "asyncio.Future[Any]") -> None:
+    """Retrieve a cancelled loser's outcome so asyncio doesn't log it"""
+    if not task.cancelled():
+        task.exception()
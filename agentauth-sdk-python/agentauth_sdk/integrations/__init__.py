@@ -0,0 +1 @@
+"""Web framework integrations for AgentAuth SDK"""
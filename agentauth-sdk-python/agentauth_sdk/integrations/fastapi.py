@@ -0,0 +1,172 @@
+"""FastAPI / Starlette integration for AgentAuth SDK"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+try:
+    from fastapi import HTTPException, Request
+except ImportError as e:  # pragma: no cover - exercised only without fastapi
+    raise ImportError(
+        "agentauth_sdk.integrations.fastapi requires fastapi. "
+        "Install it with: pip install umytbaynazarow-agentauth-sdk[fastapi]"
+    ) from e
+
+from ..tokens import AuthenticatedAgent, TokenVerifier
+from ..types import TokenVerificationError
+
+# ASGI scope keys set by AgentAuthMiddleware
+VERIFIER_KEY = "agentauth.verifier"
+AGENT_KEY = "agentauth.agent"
+ERROR_KEY = "agentauth.error"
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Any]]
+Send = Callable[[Any], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class AgentAuthMiddleware:
+    """
+    ASGI middleware that authenticates AgentAuth bearer tokens per request.
+
+    Tokens are verified locally by a :class:`TokenVerifier` (no call to the
+    AgentAuth API on the request path), and the result is stored in the
+    request scope, not on a shared client, so concurrent requests never see
+    each other's credentials. Routes declare what they need with
+    :func:`current_agent` and :func:`require_permissions`.
+
+    Example:
+        >>> verifier = TokenVerifier(os.environ["AGENTAUTH_JWT_SECRET"], directory=directory)
+        >>> app.add_middleware(AgentAuthMiddleware, verifier=verifier, exclude_paths=["/health"])
+        >>>
+        >>> @app.get("/tickets")
+        ... async def tickets(agent=Depends(require_permissions("zendesk:tickets:read"))):
+        ...     return {"agent_id": agent.agent_id}
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        verifier: TokenVerifier,
+        exclude_paths: Iterable[str] = (),
+    ):
+        """
+        Initialize the middleware
+
+        Args:
+            app: Wrapped ASGI application
+            verifier: Token verifier shared by all requests
+            exclude_paths: Paths whose tokens are not inspected (health checks)
+        """
+        self.app = app
+        self.verifier = verifier
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and scope.get("path") not in self.exclude_paths:
+            scope[VERIFIER_KEY] = self.verifier
+            token = _bearer_token(scope.get("headers", ()))
+            if token is not None:
+                try:
+                    scope[AGENT_KEY] = await self.verifier.authenticate(token)
+                except TokenVerificationError as e:
+                    scope[ERROR_KEY] = e
+        await self.app(scope, receive, send)
+
+
+def _bearer_token(headers: Iterable[Any]) -> Optional[str]:
+    for name, value in headers:
+        if name == b"authorization":
+            header: str = value.decode("latin-1")
+            scheme, _, token = header.partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+            return None
+    return None
+
+
+# ============================================
+# Dependencies
+# ============================================
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+
+async def optional_agent(request: Request) -> Optional[AuthenticatedAgent]:
+    """
+    Dependency returning the authenticated agent, or None for anonymous requests
+
+    Raises:
+        HTTPException: 401 if a token was sent but is invalid
+        RuntimeError: If AgentAuthMiddleware is not installed
+    """
+    scope = request.scope
+    agent = scope.get(AGENT_KEY)
+    if agent is not None:
+        return agent  # type: ignore[no-any-return]
+    if VERIFIER_KEY not in scope:
+        raise RuntimeError("AgentAuthMiddleware is not installed (or the path is excluded)")
+    error = scope.get(ERROR_KEY)
+    if error is not None:
+        raise _unauthorized(str(error))
+    return None
+
+
+async def current_agent(request: Request) -> AuthenticatedAgent:
+    """
+    Dependency returning the authenticated agent
+
+    Raises:
+        HTTPException: 401 if no valid token was sent
+        RuntimeError: If AgentAuthMiddleware is not installed
+    """
+    agent = await optional_agent(request)
+    if agent is None:
+        raise _unauthorized("No token provided")
+    return agent
+
+
+def require_permissions(*permissions: str) -> Callable[[Request], Awaitable[AuthenticatedAgent]]:
+    """
+    Dependency factory requiring the agent to hold every listed permission
+
+    Wildcard grants (``zendesk:*:*``, ``*:*:*``) are honored. The required
+    permissions are compiled to a bitmask once per verifier, so the check on
+    each request is a single AND.
+
+    Args:
+        *permissions: Required permissions (e.g. "zendesk:tickets:read")
+
+    Returns:
+        Dependency resolving to the AuthenticatedAgent
+
+    Example:
+        >>> @app.delete("/tickets/{ticket_id}")
+        ... async def delete_ticket(
+        ...     ticket_id: str,
+        ...     agent: AuthenticatedAgent = Depends(require_permissions("zendesk:tickets:write")),
+        ... ):
+        ...     ...
+    """
+    compiled: Dict[int, int] = {}
+
+    async def dependency(request: Request) -> AuthenticatedAgent:
+        agent = await current_agent(request)
+        verifier: TokenVerifier = request.scope[VERIFIER_KEY]
+        required = compiled.get(id(verifier))
+        if required is None:
+            required = compiled[id(verifier)] = verifier.required_mask(permissions)
+        if agent.agent is None:
+            raise HTTPException(status_code=403, detail="Agent permissions are unknown")
+        # Compiling ``required`` may register custom permissions, so take the
+        # agent's mask afterwards (a cached lookup unless something changed)
+        mask = verifier.mask_for(agent.agent)
+        if mask & required != required:
+            raise HTTPException(
+                status_code=403,
+                detail=f"Missing required permissions: {', '.join(permissions)}",
+            )
+        return agent
+
+    return dependency
@@ -0,0 +1,352 @@
+"""Fleet drift monitoring for AgentAuth SDK"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .types import DriftScoreResponse, DriftStatus, DriftStatusChange, WebhookEvent
+
+if TYPE_CHECKING:
+    from .client import AgentAuthClient
+
+logger = logging.getLogger("agentauth_sdk")
+
+DriftChangeCallback = Callable[[DriftStatusChange], Union[None, Awaitable[None]]]
+
+# Server defaults when an agent has no drift config
+DEFAULT_DRIFT_THRESHOLD = 0.30
+DEFAULT_WARNING_THRESHOLD = 0.24
+
+
+def classify_drift(response: DriftScoreResponse) -> DriftStatus:
+    """
+    Map a drift score response to ok / warning / critical / revoked
+
+    Uses the same threshold comparison as the server's auto-revoke check. An
+    agent past ``drift_threshold`` is "revoked" only when its config has
+    ``auto_revoke`` enabled (the server default); otherwise it stays active
+    and is reported as "critical".
+
+    Args:
+        response: Drift score response
+
+    Returns:
+        Drift status ("unknown" when no pings have been recorded)
+    """
+    if response.drift_score is None:
+        return "unknown"
+    thresholds = response.thresholds or {}
+    drift_threshold = thresholds.get("drift_threshold") or DEFAULT_DRIFT_THRESHOLD
+    warning_threshold = thresholds.get("warning_threshold") or DEFAULT_WARNING_THRESHOLD
+    if response.drift_score >= drift_threshold:
+        return "revoked" if thresholds.get("auto_revoke", True) else "critical"
+    if response.drift_score >= warning_threshold:
+        return "warning"
+    return "ok"
+
+
+class _RateLimiter:
+    """Token bucket shared by all polls"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class DriftMonitor:
+    """
+    Long-running drift poller for a fleet of agents.
+
+    Polls ``get_drift_score`` for every agent, spread evenly over the polling
+    interval with jitter, under a global concurrency limit and request rate cap.
+    Polling is adaptive: critical agents, agents in warning, near
+    ``warning_threshold`` or with spike warnings are polled every
+    ``min_interval``; healthy and revoked agents back off towards
+    ``max_interval``. Callbacks receive only status changes.
+
+    Example:
+        >>> monitor = DriftMonitor(client, agent_ids, interval=60, rate_limit=20)
+        >>> monitor.on_change(lambda change: print(change.agent_id, change.current))
+        >>> await monitor.start()
+        >>> ...
+        >>> await monitor.stop()
+    """
+
+    def __init__(
+        self,
+        client: "AgentAuthClient",
+        agent_ids: Iterable[str] = (),
+        interval: float = 60.0,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        concurrency: int = 10,
+        rate_limit: float = 20.0,
+        jitter: float = 0.1,
+        near_fraction: float = 0.8,
+        backoff: float = 1.5,
+    ):
+        """
+        Initialize the monitor
+
+        Args:
+            client: AgentAuth client
+            agent_ids: Agents to monitor
+            interval: Base polling interval in seconds
+            min_interval: Interval for agents at risk
+            max_interval: Upper bound for healthy agents
+            concurrency: Maximum in-flight polls
+            rate_limit: Maximum polls per second
+            jitter: Relative jitter applied to every interval (0.1 = ±10%)
+            near_fraction: Score as a fraction of warning_threshold that counts
+                as "near" the threshold
+            backoff: Interval multiplier after each consecutive healthy poll
+        """
+        self.client = client
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.near_fraction = near_fraction
+        self.backoff = backoff
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._limiter = _RateLimiter(rate_limit, burst=rate_limit)
+        self._callbacks: List[DriftChangeCallback] = []
+        self._agents: Set[str] = set()
+        self._status: Dict[str, DriftStatus] = {}
+        self._intervals: Dict[str, float] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, float] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._inflight: Set["asyncio.Task[None]"] = set()
+
+        for agent_id in agent_ids:
+            self._agents.add(agent_id)
+
+    # ============================================
+    # Configuration
+    # ============================================
+
+    def on_change(self, callback: DriftChangeCallback) -> None:
+        """
+        Register a callback for status changes (sync or async)
+
+        Args:
+            callback: Called with a DriftStatusChange
+        """
+        self._callbacks.append(callback)
+
+    def add_agent(self, agent_id: str) -> None:
+        """Start monitoring an agent; its first poll is jittered over one interval"""
+        if agent_id in self._agents:
+            return
+        self._agents.add(agent_id)
+        if self._task is not None:
+            self._schedule(agent_id, random.uniform(0, self.interval))
+
+    def remove_agent(self, agent_id: str) -> None:
+        """Stop monitoring an agent"""
+        self._agents.discard(agent_id)
+        self._status.pop(agent_id, None)
+        self._intervals.pop(agent_id, None)
+        self._due.pop(agent_id, None)
+
+    def status(self, agent_id: str) -> DriftStatus:
+        """Last observed status of an agent"""
+        return self._status.get(agent_id, "unknown")
+
+    @property
+    def agents(self) -> List[str]:
+        """Monitored agent IDs"""
+        return list(self._agents)
+
+    def handle_webhook_event(self, event: WebhookEvent) -> bool:
+        """
+        Poll an agent immediately when a drift webhook arrives for it
+
+        ``agent.drift.warning`` and ``agent.drift.revoked`` move the agent's
+        next poll forward, so status changes are reported without waiting out
+        a backed-off interval. Can be registered on a WebhookReceiver.
+
+        Args:
+            event: Received webhook event
+
+        Returns:
+            True if a poll was scheduled
+        """
+        if event.event not in ("agent.drift.warning", "agent.drift.revoked"):
+            return False
+        agent_id = event.agent_id or event.data.get("agent_id")
+        if agent_id not in self._agents or self._task is None or self._task.done():
+            return False
+        self._schedule(agent_id, 0.0)
+        return True
+
+    # ============================================
+    # Lifecycle
+    # ============================================
+
+    async def start(self) -> None:
+        """Start polling in the background"""
+        if self._task is not None and not self._task.done():
+            return
+        self._heap.clear()
+        self._due.clear()
+        # Spread first polls evenly over one interval instead of a burst
+        agents = list(self._agents)
+        random.shuffle(agents)
+        step = self.interval / max(1, len(agents))
+        for position, agent_id in enumerate(agents):
+            self._schedule(agent_id, position * step + random.uniform(0, step))
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and wait for in-flight polls to finish"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _schedule(self, agent_id: str, delay: float) -> None:
+        due = time.monotonic() + delay
+        pending = self._due.get(agent_id)
+        if pending is not None and pending <= due:
+            return  # an earlier poll is already scheduled
+        # Any later heap entry for the agent is now stale and skipped by _run
+        self._due[agent_id] = due
+        heapq.heappush(self._heap, (due, next(self._seq), agent_id))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            due, _, agent_id = self._heap[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            if agent_id not in self._agents or self._due.get(agent_id) != due:
+                continue
+            del self._due[agent_id]
+
+            await self._limiter.acquire()
+            await self._semaphore.acquire()
+            task = asyncio.ensure_future(self._poll(agent_id))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    # ============================================
+    # Polling
+    # ============================================
+
+    async def _poll(self, agent_id: str) -> None:
+        try:
+            response = await self.client.get_drift_score(agent_id)
+        except Exception as e:
+            logger.warning("Drift poll failed for %s: %s", agent_id, e)
+            self._reschedule(agent_id, self.interval)
+            return
+        finally:
+            self._semaphore.release()
+
+        if agent_id not in self._agents:
+            return
+
+        current = classify_drift(response)
+        previous = self._status.get(agent_id, "unknown")
+        self._status[agent_id] = current
+        self._reschedule(agent_id, self._next_interval(agent_id, response, current))
+
+        # A first "ok" is not news; anything else that changed is
+        if current != previous and not (previous == "unknown" and current == "ok"):
+            await self._emit(
+                DriftStatusChange(
+                    agent_id=agent_id,
+                    previous=previous,
+                    current=current,
+                    drift_score=response.drift_score,
+                    spike_warnings=response.spike_warnings,
+                )
+            )
+
+    def _next_interval(
+        self, agent_id: str, response: DriftScoreResponse, status: DriftStatus
+    ) -> float:
+        """Shorten the interval for agents at risk, back off for healthy ones"""
+        thresholds = response.thresholds or {}
+        warning_threshold = thresholds.get("warning_threshold") or DEFAULT_WARNING_THRESHOLD
+        near = (
+            response.drift_score is not None
+            and response.drift_score >= warning_threshold * self.near_fraction
+        )
+
+        if status == "revoked":
+            interval = self.max_interval
+        elif status in ("critical", "warning") or near or response.spike_warnings:
+            interval = self.min_interval
+        else:
+            previous = self._intervals.get(agent_id, self.interval)
+            interval = min(self.max_interval, max(self.interval, previous * self.backoff))
+
+        self._intervals[agent_id] = interval
+        return interval
+
+    def _reschedule(self, agent_id: str, interval: float) -> None:
+        if agent_id in self._agents:
+            spread = interval * self.jitter
+            self._schedule(agent_id, max(0.0, interval + random.uniform(-spread, spread)))
+
+    async def _emit(self, change: DriftStatusChange) -> None:
+        for callback in self._callbacks:
+            try:
+                result = callback(change)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("DriftMonitor callback failed for %s", change.agent_id)
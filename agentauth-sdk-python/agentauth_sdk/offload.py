@@ -0,0 +1,230 @@
+"""Off-loop execution of CPU-heavy work for AgentAuth SDK"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from .signing import PingSigner
+
+T = TypeVar("T")
+
+
+@dataclass
+class OffloadStats:
+    """Offloader counters, as returned by :meth:`Offloader.stats`"""
+
+    inline: int = 0
+    offloaded: int = 0  # completed; failed calls are only counted in ``failed``
+    failed: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    offload_seconds: float = 0.0
+    max_offload_seconds: float = 0.0
+
+    @property
+    def mean_offload_seconds(self) -> float:
+        """Average submit-to-result time of offloaded calls"""
+        return self.offload_seconds / self.offloaded if self.offloaded else 0.0
+
+
+class Offloader:
+    """
+    Runs CPU-bound SDK work in a managed process or thread pool.
+
+    Work below the size thresholds runs inline, where a pool round trip would
+    cost more than it saves; larger work is awaited from the pool so the event
+    loop keeps serving other coroutines. Process pools need picklable,
+    module-level functions and sidestep the GIL; thread pools avoid pickling
+    but only help for code that releases the GIL (hashing, zlib). The pool is
+    created on first use.
+
+    JSON decoding (:meth:`decode`) always runs in a thread, whatever ``kind``:
+    a worker process would parse the body, but the parent would then unpickle
+    the resulting object graph on the event loop, which costs about as much as
+    parsing it. ``json.loads`` holds the GIL, so a decoding thread does not add
+    throughput; it only splits one long loop stall into switch-interval slices
+    (5ms by default) during which other coroutines still run.
+
+    Example:
+        >>> offloader = Offloader(kind="process", max_workers=4)
+        >>> client = AgentAuthClient(base_url, offloader=offloader)
+        >>> stats = offloader.stats()  # queue depth, offload time
+    """
+
+    def __init__(
+        self,
+        kind: str = "process",
+        max_workers: Optional[int] = None,
+        min_bytes: int = 256 * 1024,
+        min_items: int = 64,
+    ):
+        """
+        Initialize the offloader
+
+        Args:
+            kind: "process" or "thread"
+            max_workers: Pool size (default: CPU count, at most 8)
+            min_bytes: Payload size from which work is offloaded
+                (e.g. response bodies to decode)
+            min_items: Item count from which work is offloaded
+                (e.g. pings to sign, proofs to verify)
+        """
+        if kind not in ("process", "thread"):
+            raise ValueError("kind must be 'process' or 'thread'")
+        self.kind = kind
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.min_bytes = min_bytes
+        self.min_items = min_items
+        self._executor: Optional[Executor] = None
+        self._decoder: Optional[ThreadPoolExecutor] = None
+        self._stats = OffloadStats()
+
+    @property
+    def executor(self) -> Executor:
+        """The pool, created on first use"""
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="agentauth-offload"
+                )
+        return self._executor
+
+    @property
+    def decoder(self) -> Executor:
+        """The thread JSON bodies are decoded in (``executor`` for thread pools)"""
+        if self.kind == "thread":
+            return self.executor
+        if self._decoder is None:
+            self._decoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentauth-decode")
+        return self._decoder
+
+    def should_offload(self, nbytes: Optional[int] = None, items: Optional[int] = None) -> bool:
+        """Whether work of this size goes to the pool"""
+        return (nbytes is not None and nbytes >= self.min_bytes) or (
+            items is not None and items >= self.min_items
+        )
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        nbytes: Optional[int] = None,
+        items: Optional[int] = None,
+    ) -> T:
+        """
+        Call ``func(*args)``, in the pool if the work reaches a threshold
+
+        Args:
+            func: Function to call (module-level for process pools)
+            *args: Arguments (picklable for process pools)
+            nbytes: Size of the input in bytes, if known
+            items: Number of items in the input, if known
+
+        Returns:
+            The function's result
+        """
+        if not self.should_offload(nbytes, items):
+            self._stats.inline += 1
+            return func(*args)
+        return await self.submit(func, *args)
+
+    async def submit(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Call ``func(*args)`` in the pool regardless of size
+
+        Args:
+            func: Function to call (module-level for process pools)
+            *args: Arguments (picklable for process pools)
+
+        Returns:
+            The function's result
+        """
+        return await self._submit(self.executor, func, *args)
+
+    async def decode(self, data: bytes) -> Any:
+        """
+        Decode a JSON body in the decoding thread regardless of size
+
+        Args:
+            data: Raw JSON bytes
+
+        Returns:
+            The decoded value
+        """
+        return await self._submit(self.decoder, json.loads, data)
+
+    async def _submit(self, executor: Executor, func: Callable[..., T], *args: Any) -> T:
+        """Await ``func(*args)`` in ``executor``, counting it in the stats"""
+        stats = self._stats
+        loop = asyncio.get_running_loop()
+        stats.in_flight += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, self._queue_depth())
+        started = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(executor, partial(func, *args))
+        except Exception:
+            stats.failed += 1
+            raise
+        else:
+            elapsed = time.perf_counter() - started
+            stats.offloaded += 1
+            stats.offload_seconds += elapsed
+            stats.max_offload_seconds = max(stats.max_offload_seconds, elapsed)
+            return result
+        finally:
+            stats.in_flight -= 1
+
+    def _queue_depth(self) -> int:
+        """Offloaded calls waiting for a free worker"""
+        return max(0, self._stats.in_flight - self.max_workers)
+
+    def stats(self) -> OffloadStats:
+        """Snapshot of the counters, including the current queue depth"""
+        snapshot = OffloadStats(**self._stats.__dict__)
+        snapshot.queue_depth = self._queue_depth()
+        return snapshot
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pools down; a later call creates new ones"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if self._decoder is not None:
+            self._decoder.shutdown(wait=wait)
+            self._decoder = None
+
+
+# ============================================
+# Pool workers (module-level so they pickle)
+# ============================================
+
+
+# Signer per worker process and API key, so the HMAC key schedule is built once
+_worker_signers: Dict[str, PingSigner] = {}
+
+
+def sign_ping_batch(api_key: str, pings: List[Dict[str, Any]]) -> List[str]:
+    """
+    Canonicalize and sign health ping bodies (``PingSigner.sign_many``)
+
+    Args:
+        api_key: Agent API key
+        pings: Request bodies
+
+    Returns:
+        Hex signatures, one per ping
+    """
+    signer = _worker_signers.get(api_key)
+    if signer is None:
+        if len(_worker_signers) >= 64:
+            _worker_signers.clear()
+        signer = _worker_signers[api_key] = PingSigner(api_key)
+    return signer.sign_many(pings)
@@ -0,0 +1,290 @@
+"""Compact bitset encoding of permissions for AgentAuth SDK"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, get_args
+
+from .permissions import Permission, permission_covers
+from .types import Agent
+
+try:  # Optional: vectorized fleet-wide queries
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+
+def known_permissions() -> List[str]:
+    """
+    List every permission literal declared by the ``Permission`` type
+
+    Returns:
+        Permission strings in declaration order
+    """
+    return [get_args(literal)[0] for literal in get_args(Permission)]
+
+
+class PermissionRegistry:
+    """
+    Assigns each permission string a bit position.
+
+    An agent's permissions become one Python ``int``: granting a wildcard sets
+    the wildcard's own bit plus the bit of every registered permission it covers,
+    so checks are a single bitwise AND instead of string comparisons.
+
+    Example:
+        >>> registry = PermissionRegistry()
+        >>> mask = registry.encode(["slack:*:*"])
+        >>> registry.has(mask, "slack:messages:write")
+        True
+        >>> required = registry.required_mask(["slack:messages:write", "zendesk:tickets:read"])
+        >>> registry.has_all(mask, required)
+        False
+    """
+
+    def __init__(self, permissions: Optional[Iterable[str]] = None):
+        """
+        Initialize the registry
+
+        Args:
+            permissions: Permissions to register up front
+                (default: every ``Permission`` literal)
+        """
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._grant_cache: Dict[str, int] = {}
+        for permission in known_permissions() if permissions is None else permissions:
+            self.register(permission)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, permission: object) -> bool:
+        return permission in self._bits
+
+    @property
+    def permissions(self) -> List[str]:
+        """Registered permissions ordered by bit position"""
+        return list(self._names)
+
+    def register(self, permission: str) -> int:
+        """
+        Register a permission, returning its bit position
+
+        Registering a new permission invalidates cached wildcard expansions, so
+        masks encoded earlier won't include it. Register custom permissions
+        before encoding.
+
+        Args:
+            permission: Permission string
+
+        Returns:
+            Bit position
+        """
+        position = self._bits.get(permission)
+        if position is None:
+            position = len(self._names)
+            self._bits[permission] = position
+            self._names.append(permission)
+            self._grant_cache.clear()
+        return position
+
+    def position(self, permission: str) -> Optional[int]:
+        """Bit position of a registered permission, or None (never registers)"""
+        return self._bits.get(permission)
+
+    def bit(self, permission: str) -> int:
+        """
+        Get the single-bit mask of a registered permission
+
+        Raises:
+            KeyError: If ``permission`` is not registered
+        """
+        return 1 << self._bits[permission]
+
+    def _grant(self, permission: str) -> int:
+        """Mask granted by holding ``permission`` (own bit + wildcard expansion)"""
+        mask = self._grant_cache.get(permission)
+        if mask is None:
+            mask = 1 << self.register(permission)
+            if "*" in permission:
+                for position, name in enumerate(self._names):
+                    if permission_covers(permission, name):
+                        mask |= 1 << position
+            self._grant_cache[permission] = mask
+        return mask
+
+    def encode(self, permissions: Iterable[str]) -> int:
+        """
+        Encode an agent's granted permissions as a bitmask
+
+        Args:
+            permissions: Granted permissions (wildcards allowed)
+
+        Returns:
+            Integer bitmask
+        """
+        mask = 0
+        for permission in permissions:
+            mask |= self._grant(permission)
+        return mask
+
+    def required_mask(self, permissions: Iterable[str]) -> int:
+        """
+        Compile a set of required permissions into a mask for ``has_all``
+
+        Args:
+            permissions: Required permissions
+
+        Returns:
+            Integer bitmask
+        """
+        mask = 0
+        for permission in permissions:
+            mask |= 1 << self.register(permission)
+        return mask
+
+    def has(self, mask: int, permission: str) -> bool:
+        """
+        Check whether ``mask`` grants ``permission``
+
+        Unregistered permissions are matched against the mask's grants
+        (wildcards included) without registering them.
+        """
+        position = self.position(permission)
+        if position is not None:
+            return bool(mask >> position & 1)
+        return any(permission_covers(granted, permission) for granted in self.decode(mask))
+
+    @staticmethod
+    def has_all(mask: int, required: int) -> bool:
+        """Check whether ``mask`` grants every bit of a compiled ``required`` mask"""
+        return mask & required == required
+
+    def decode(self, mask: int) -> List[str]:
+        """
+        List the permissions whose bits are set in ``mask``
+
+        Args:
+            mask: Integer bitmask
+
+        Returns:
+            Permission strings (including wildcard expansions)
+        """
+        return [name for position, name in enumerate(self._names) if mask >> position & 1]
+
+
+class PermissionMatrix:
+    """
+    Fleet-wide permission bitsets as a NumPy ``uint64`` matrix.
+
+    Row ``i`` holds the mask of ``agent_ids[i]`` split into 64-bit words, so
+    "which agents can write to Slack" is one vectorized AND over a column.
+    Requires the optional ``numpy`` dependency.
+
+    Example:
+        >>> matrix = PermissionMatrix.from_agents(registry, agents)
+        >>> matrix.agents_with("slack:messages:write")
+        ['agt_abc123', ...]
+    """
+
+    def __init__(
+        self, registry: PermissionRegistry, agent_ids: Sequence[str], masks: Sequence[int]
+    ):
+        """
+        Initialize the matrix
+
+        Args:
+            registry: Registry the masks were encoded with
+            agent_ids: Agent IDs, one per row
+            masks: Encoded permission masks aligned with ``agent_ids``
+        """
+        if np is None:
+            raise ImportError(
+                "PermissionMatrix requires numpy. "
+                "Install it with: pip install umytbaynazarow-agentauth-sdk[numpy]"
+            )
+        if len(agent_ids) != len(masks):
+            raise ValueError("agent_ids and masks must have the same length")
+
+        self.registry = registry
+        self.agent_ids = list(agent_ids)
+        self._rows = {agent_id: row for row, agent_id in enumerate(self.agent_ids)}
+        # Bits registered later are set in no row, whatever the agents hold
+        self.encoded = len(registry)
+        self.words = max(1, (self.encoded + 63) // 64)
+        self.matrix = np.zeros((len(self.agent_ids), self.words), dtype=np.uint64)
+
+        word_mask = (1 << 64) - 1
+        for row, mask in enumerate(masks):
+            for word in range(self.words):
+                chunk = (mask >> (64 * word)) & word_mask
+                if chunk:
+                    self.matrix[row, word] = chunk
+
+    @classmethod
+    def from_agents(
+        cls, registry: PermissionRegistry, agents: Iterable[Agent]
+    ) -> "PermissionMatrix":
+        """
+        Encode a fleet of agents
+
+        Args:
+            registry: Permission registry
+            agents: Agents to encode
+
+        Returns:
+            PermissionMatrix with one row per agent
+        """
+        agent_ids: List[str] = []
+        masks: List[int] = []
+        for agent in agents:
+            agent_ids.append(agent.agent_id)
+            masks.append(registry.encode(agent.permissions or []))
+        return cls(registry, agent_ids, masks)
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def _columns(self, permission: str) -> List[Tuple[int, int]]:
+        """(word, bit) columns any of which grants ``permission``"""
+        position = self.registry.position(permission)
+        if position is not None and position < self.encoded:
+            positions = [position]
+        else:
+            # Unknown when the rows were encoded: only grants that cover it
+            # (wildcards) can apply
+            positions = [
+                bit
+                for bit, granted in enumerate(self.registry.permissions[: self.encoded])
+                if permission_covers(granted, permission)
+            ]
+        return [(position // 64, 1 << (position % 64)) for position in positions]
+
+    def _selector(self, permissions: Iterable[str]):  # type: ignore[no-untyped-def]
+        """Boolean row selector for agents holding every permission"""
+        selected = np.ones(len(self.agent_ids), dtype=bool)
+        for permission in permissions:
+            granted = np.zeros(len(self.agent_ids), dtype=bool)
+            for word, bit in self._columns(permission):
+                granted |= (self.matrix[:, word] & np.uint64(bit)) != 0
+            selected &= granted
+        return selected
+
+    def agents_with(self, permission: str) -> List[str]:
+        """List agent IDs granted ``permission``"""
+        return self.agents_with_all([permission])
+
+    def agents_with_all(self, permissions: Iterable[str]) -> List[str]:
+        """List agent IDs granted every permission in ``permissions``"""
+        rows = np.nonzero(self._selector(permissions))[0]
+        return [self.agent_ids[row] for row in rows]
+
+    def count(self, permission: str) -> int:
+        """Count agents granted ``permission``"""
+        return int(np.count_nonzero(self._selector([permission])))
+
+    def mask_of(self, agent_id: str) -> int:
+        """Reassemble the integer mask for one agent"""
+        row = self.matrix[self._rows[agent_id]]
+        mask = 0
+        for word in range(self.words):
+            mask |= int(row[word]) << (64 * word)
+        return mask
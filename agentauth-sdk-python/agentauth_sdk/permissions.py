@@ -4,7 +4,7 @@ Type-safe permission system for AgentAuth SDK
 Provides constants and type hints for all service:resource:action permissions.
 """
 
-from typing import Literal, Union
+from typing import List, Literal, Union
 
 # Type definitions for permissions
 Permission = Union[
@@ -252,3 +252,45 @@ class _Permissions:
 
 # Singleton instance
 Permissions = _Permissions()
+
+
+def permission_covers(granted: str, required: str) -> bool:
+    """
+    Check whether a granted permission satisfies a required one
+
+    Each ``service:resource:action`` segment of ``granted`` must either equal the
+    matching segment of ``required`` or be the ``*`` wildcard.
+
+    Example:
+        >>> permission_covers("slack:*:*", "slack:messages:write")
+        True
+    """
+    granted_parts = granted.split(":")
+    required_parts = required.split(":")
+    if len(granted_parts) != len(required_parts):
+        return False
+    return all(g == "*" or g == r for g, r in zip(granted_parts, required_parts))
+
+
+def covering_permissions(required: str) -> List[str]:
+    """
+    List the permission strings that would grant ``required``
+
+    Used for index lookups: an agent holds ``required`` if it holds any of these.
+
+    Example:
+        >>> covering_permissions("slack:messages:write")
+        ['slack:messages:write', 'slack:messages:*', 'slack:*:*', '*:*:*']
+    """
+    parts = required.split(":")
+    if len(parts) != 3:
+        return [required]
+    service, resource, action = parts
+    candidates = [
+        required,
+        f"{service}:{resource}:*",
+        f"{service}:*:*",
+        "*:*:*",
+    ]
+    # Preserve order, drop duplicates when required already contains wildcards
+    return list(dict.fromkeys(candidates))
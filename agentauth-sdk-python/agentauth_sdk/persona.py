@@ -0,0 +1,319 @@
+"""Local persona comparison and prompt rendering for AgentAuth SDK"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .signing import _ARRAY_INDEX, _MAX_ARRAY_INDEX, _js_number, canonical_json, sign_persona
+from .types import PersonaChange
+
+PathKey = Union[str, int]
+
+# Marker for "no value" (JavaScript undefined), distinct from JSON null
+_MISSING = object()
+
+
+def _real_type(value: Any) -> str:
+    """deep-diff's ``realTypeOf`` for JSON values"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    return "object"
+
+
+def _diff(lhs: Any, rhs: Any, changes: List[PersonaChange], path: List[PathKey]) -> None:
+    if lhs is _MISSING and rhs is not _MISSING:
+        changes.append(PersonaChange(kind="N", path=path, rhs=rhs))
+    elif rhs is _MISSING and lhs is not _MISSING:
+        changes.append(PersonaChange(kind="D", path=path, lhs=lhs))
+    elif _real_type(lhs) != _real_type(rhs):
+        changes.append(PersonaChange(kind="E", path=path, lhs=lhs, rhs=rhs))
+    elif isinstance(lhs, (list, tuple)):
+        i, j = len(rhs) - 1, len(lhs) - 1
+        while i > j:
+            item = PersonaChange(kind="N", rhs=rhs[i])
+            changes.append(PersonaChange(kind="A", path=path, index=i, item=item))
+            i -= 1
+        while j > i:
+            item = PersonaChange(kind="D", lhs=lhs[j])
+            changes.append(PersonaChange(kind="A", path=path, index=j, item=item))
+            j -= 1
+        for index in range(i, -1, -1):
+            _diff(lhs[index], rhs[index], changes, path + [index])
+    elif isinstance(lhs, dict):
+        for key, value in lhs.items():
+            _diff(value, rhs.get(key, _MISSING), changes, path + [key])
+        for key, value in rhs.items():
+            if key not in lhs:
+                changes.append(PersonaChange(kind="N", path=path + [key], rhs=value))
+    elif lhs != rhs:
+        floats = isinstance(lhs, float) and isinstance(rhs, float)
+        if not (floats and math.isnan(lhs) and math.isnan(rhs)):
+            changes.append(PersonaChange(kind="E", path=path, lhs=lhs, rhs=rhs))
+
+
+def diff_personas(
+    lhs: Optional[Dict[str, Any]], rhs: Optional[Dict[str, Any]]
+) -> List[PersonaChange]:
+    """
+    Structural diff of two personas, in the same format and order as the
+    server's ``deep-diff`` output (``changes`` in update responses and webhooks)
+
+    Args:
+        lhs: Current persona (None for no persona)
+        rhs: New persona
+
+    Returns:
+        List of changes (empty if equal)
+    """
+    changes: List[PersonaChange] = []
+    _diff(lhs or {}, rhs or {}, changes, [])
+    return changes
+
+
+def change_from_dict(data: Dict[str, Any]) -> PersonaChange:
+    """Parse one server ``changes`` entry"""
+    item = data.get("item")
+    return PersonaChange(
+        kind=data["kind"],
+        path=data.get("path"),
+        lhs=data.get("lhs"),
+        rhs=data.get("rhs"),
+        index=data.get("index"),
+        item=change_from_dict(item) if item else None,
+    )
+
+
+def _parse_version(version: Any) -> Optional[Tuple[int, int, int]]:
+    if not isinstance(version, str):
+        return None
+    parts = version.lstrip("v").split(".")
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
+    return int(parts[0]), int(parts[1]), int(parts[2])
+
+
+def version_gt(a: Any, b: Any) -> bool:
+    """Whether version ``a`` is greater than ``b`` (False if either isn't x.y.z)"""
+    parsed_a, parsed_b = _parse_version(a), _parse_version(b)
+    return parsed_a is not None and parsed_b is not None and parsed_a > parsed_b
+
+
+def effective_persona(
+    persona: Dict[str, Any],
+    current_version: Optional[str],
+    versioned: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    The persona as the server would store it, minus the automatic version bump
+
+    The server keeps ``persona["version"]`` only if it is greater than the current
+    version; otherwise it bumps the minor version itself. This returns the
+    persona with the version the comparison should use, or None if it is a real
+    change (explicit version bump) or can't be compared locally (non-numeric semver).
+
+    Args:
+        persona: Persona the caller wants to deploy
+        current_version: Server's current ``persona_version``
+        versioned: Whether the stored persona has a ``version`` key (personas
+            registered without one are stored as-is)
+
+    Returns:
+        Persona to compare against the current one, or None
+    """
+    current_version = current_version or "1.0.0"
+    current = _parse_version(current_version)
+    if current is None:
+        return None
+    requested = persona.get("version")
+    if requested is not None:
+        parsed = _parse_version(requested)
+        if parsed is None or parsed > current:
+            return None
+    if versioned:
+        return {**persona, "version": current_version}
+    return {key: value for key, value in persona.items() if key != "version"}
+
+
+def persona_unchanged(
+    current: Dict[str, Any],
+    persona: Dict[str, Any],
+    api_key: Optional[str] = None,
+) -> bool:
+    """
+    Check whether deploying ``persona`` would change nothing on the server
+
+    Compares the locally computed persona hash with the server's ``persona_hash``
+    when the API key is known, and falls back to canonical JSON equality.
+
+    Args:
+        current: Server persona response (``persona``, ``persona_hash``, ``persona_version``)
+        persona: Persona the caller wants to deploy
+        api_key: Agent API key used for the server's HMAC
+
+    Returns:
+        True if an update would be a no-op apart from the version bump
+    """
+    stored = current.get("persona") or {}
+    candidate = effective_persona(persona, current.get("persona_version"), "version" in stored)
+    if candidate is None:
+        return False
+    if api_key and current.get("persona_hash"):
+        return bool(sign_persona(candidate, api_key) == current["persona_hash"])
+    return canonical_json(candidate) == canonical_json(stored)
+
+
+# ============================================
+# Prompt rendering
+# ============================================
+
+
+def _js_truthy(value: Any) -> bool:
+    """JavaScript truthiness (empty lists and dicts are truthy, NaN is not)"""
+    if value is _MISSING or value is None or value is False:
+        return False
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value == value and value != 0
+    if isinstance(value, str):
+        return value != ""
+    return True
+
+
+def _js_str(value: Any) -> str:
+    """JavaScript ``String(value)`` for JSON values"""
+    if isinstance(value, str):
+        return value
+    if value is _MISSING:
+        return "undefined"
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return _js_number(float(value))
+    if isinstance(value, (list, tuple)):
+        return ",".join("" if item is None else _js_str(item) for item in value)
+    return "[object Object]"
+
+
+def _js_entries(value: Any) -> List[Tuple[str, Any]]:
+    """JavaScript ``Object.entries(value)`` (integer-like keys first, ascending)"""
+    if isinstance(value, dict):
+        items = [(str(key), item) for key, item in value.items()]
+        index_keys = sorted(
+            (
+                item
+                for item in items
+                if _ARRAY_INDEX.fullmatch(item[0]) and int(item[0]) <= _MAX_ARRAY_INDEX
+            ),
+            key=lambda item: int(item[0]),
+        )
+        index_set = {key for key, _ in index_keys}
+        return index_keys + [item for item in items if item[0] not in index_set]
+    if isinstance(value, (list, tuple)):
+        return [(str(index), item) for index, item in enumerate(value)]
+    if isinstance(value, str):
+        # Strings enumerate UTF-16 code units
+        units = value.encode("utf-16-le", "surrogatepass")
+        return [
+            (str(index), units[i : i + 2].decode("utf-16-le", "surrogatepass"))
+            for index, i in enumerate(range(0, len(units), 2))
+        ]
+    return []
+
+
+def _get(obj: Any, key: str) -> Any:
+    return obj.get(key, _MISSING) if isinstance(obj, dict) else _MISSING
+
+
+def _non_empty_list(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) and len(value) > 0
+
+
+def escape_prompt_input(value: Any) -> str:
+    """
+    Escape a value for a prompt exactly as the server's ``escapePromptInput``
+
+    Args:
+        value: Value to embed (non-strings are converted like JavaScript ``String``)
+
+    Returns:
+        Escaped text
+    """
+    if not isinstance(value, str):
+        return _js_str(value)
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
+
+
+def render_prompt(persona: Dict[str, Any]) -> str:
+    """
+    Render the system prompt the server returns for ``include_prompt=true``
+
+    A persona's own ``promptTemplate`` is returned as-is; otherwise the prompt is
+    generated line for line like the server's ``generatePromptTemplate``.
+
+    Args:
+        persona: Stored persona (as returned by ``get_persona``)
+
+    Returns:
+        System prompt text
+    """
+    template = _get(persona, "promptTemplate")
+    if _js_truthy(template):
+        return template if isinstance(template, str) else _js_str(template)
+
+    version = escape_prompt_input(_get(persona, "version"))
+    parts = [f"You are an AI agent operating under persona version {version}."]
+
+    traits = _get(_get(persona, "personality"), "traits")
+    if _js_truthy(traits):
+        descriptions = []
+        for key, value in _js_entries(traits):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                text = _js_number(float(value))
+            else:
+                text = escape_prompt_input(_js_str(value))
+            descriptions.append(f"{escape_prompt_input(key)}: {text}")
+        parts.append(f"Personality traits: {', '.join(descriptions)}.")
+
+    constraints = _get(persona, "constraints")
+    if _js_truthy(constraints):
+        forbidden = _get(constraints, "forbidden_topics")
+        if _non_empty_list(forbidden):
+            parts.append(
+                f"You must NEVER discuss: {', '.join(map(escape_prompt_input, forbidden))}."
+            )
+        disclaimers = _get(constraints, "required_disclaimers")
+        if _non_empty_list(disclaimers):
+            parts.append(
+                "You must include these disclaimers when relevant: "
+                f"{'; '.join(map(escape_prompt_input, disclaimers))}."
+            )
+        max_length = _get(constraints, "max_response_length")
+        if _js_truthy(max_length):
+            parts.append(f"Keep responses under {_js_str(max_length)} characters.")
+        allowed = _get(constraints, "allowed_actions")
+        if _non_empty_list(allowed):
+            parts.append(f"Allowed actions: {', '.join(map(escape_prompt_input, allowed))}.")
+        blocked = _get(constraints, "blocked_actions")
+        if _non_empty_list(blocked):
+            parts.append(f"Blocked actions: {', '.join(map(escape_prompt_input, blocked))}.")
+
+    guardrails = _get(persona, "guardrails")
+    if _js_truthy(guardrails):
+        toxicity = _get(guardrails, "toxicity_threshold")
+        if toxicity is not _MISSING:
+            parts.append(f"Toxicity threshold: {_js_str(toxicity)}.")
+        tolerance = _get(guardrails, "hallucination_tolerance")
+        if _js_truthy(tolerance):
+            parts.append(f"Hallucination tolerance: {escape_prompt_input(tolerance)}.")
+        if _js_truthy(_get(guardrails, "source_citation_required")):
+            parts.append("You must cite sources for factual claims.")
+
+    return "\n".join(parts)
@@ -0,0 +1,79 @@
+"""Compact record construction for AgentAuth SDK"""
+
+import sys
+from typing import Any, Dict, Iterable, List
+
+from .types import Agent, DriftHistoryEntry, PersonaHistoryEntry
+from .utils import dataclass_from_dict
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def agent_record(data: Dict[str, Any]) -> Agent:
+    """
+    Build an Agent from an API payload
+
+    Status, tier and permission strings repeat across a fleet; they are
+    interned so a million agents share one copy of each.
+
+    Args:
+        data: Agent payload
+
+    Returns:
+        Agent
+    """
+    record = dataclass_from_dict(Agent, data)
+    record.status = _intern(record.status)
+    record.tier = _intern(record.tier)
+    if record.permissions:
+        record.permissions = [_intern(p) for p in record.permissions]
+    return record
+
+
+def drift_history_records(entries: Iterable[Dict[str, Any]]) -> List[DriftHistoryEntry]:
+    """
+    Build drift history entries from an API page
+
+    Args:
+        entries: ``history`` items of a drift history response
+
+    Returns:
+        DriftHistoryEntry list
+    """
+    records = []
+    for data in entries:
+        record = dataclass_from_dict(DriftHistoryEntry, data)
+        record.agent_id = _intern(record.agent_id)
+        if record.metrics:
+            record.metrics = {_intern(name): value for name, value in record.metrics.items()}
+        if record.metric_name is not None:
+            record.metric_name = _intern(record.metric_name)
+        records.append(record)
+    return records
+
+
+def persona_history_records(entries: Iterable[Dict[str, Any]]) -> List[PersonaHistoryEntry]:
+    """
+    Build persona history entries from an API page
+
+    Each entry keeps the persona dict as decoded from the response.
+
+    Args:
+        entries: ``history`` items of a persona history response
+
+    Returns:
+        PersonaHistoryEntry list
+    """
+    return [
+        PersonaHistoryEntry(
+            id=data["id"],
+            agent_id=_intern(data["agent_id"]),
+            persona=data["persona"],
+            persona_hash=data.get("persona_hash") or "",
+            persona_version=_intern(data.get("persona_version")),
+            changed_at=data["changed_at"],
+        )
+        for data in entries
+    ]
@@ -0,0 +1,301 @@
+"""Cross-process verified token claims cache for AgentAuth SDK"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+import zlib
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("agentauth_sdk")
+
+_MAGIC = b"AACLAIM1"
+# Table header: magic, slot count, slot size
+_TABLE = struct.Struct("<8sII")
+_TABLE_SIZE = 64
+# Slot header: sequence, expires_at, CRC-32 of the rest, claims length, token digest
+_SLOT = struct.Struct("<IdIH32s")
+_SEQ = struct.Struct("<I")
+
+# Slots inspected per lookup (linear probing)
+PROBE_LIMIT = 8
+
+
+def token_digest(token: str) -> bytes:
+    """SHA-256 of a bearer token; tokens themselves are never stored"""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class SharedClaimsCache:
+    """
+    Verified token claims shared by every worker process on a host.
+
+    A fixed-size open-addressing table in ``multiprocessing.shared_memory``
+    maps a token's SHA-256 digest to its claims and expiry, so a token verified
+    by one pre-fork worker is a cache hit in all of them. The footprint is
+    ``slots * slot_size`` bytes regardless of traffic.
+
+    Reads take no lock: each slot carries a sequence number (odd while being
+    written) and a CRC, and a read that overlaps a write is retried or treated
+    as a miss. Writes, which only happen on a miss, are serialized across
+    processes with a lock file (POSIX ``flock``).
+
+    Example:
+        >>> cache = SharedClaimsCache("myservice-claims", slots=65536)
+        >>> claims = cache.get(token)
+        >>> if claims is None:
+        ...     claims = verify(token)
+        ...     cache.put(token, claims)  # kept until claims["exp"]
+    """
+
+    def __init__(self, name: str = "agentauth-claims", slots: int = 16384, slot_size: int = 512):
+        """
+        Attach to the named table, creating it if this is the first process
+
+        Args:
+            name: Shared memory name; processes using the same name share entries
+            slots: Number of slots (fixed for the table's lifetime)
+            slot_size: Bytes per slot; claims JSON larger than
+                ``slot_size - 50`` bytes is not cached
+        """
+        if slot_size <= _SLOT.size or slot_size - _SLOT.size > 0xFFFF:
+            raise ValueError(
+                f"slot_size must be between {_SLOT.size + 1} and {_SLOT.size + 0xFFFF}"
+            )
+        self.name = name
+        self._shm = _attach(name, _TABLE_SIZE + slots * slot_size)
+        buf = self._shm.buf
+        assert buf is not None
+        self._buf: memoryview = buf
+        self._closed = False
+        self.slots, self.slot_size = self._read_table(slots, slot_size)
+        self._lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self._lock_fd: Optional[int] = None
+
+    def _read_table(self, slots: int, slot_size: int) -> Tuple[int, int]:
+        buf = self._buf
+        magic, existing_slots, existing_size = _TABLE.unpack_from(buf, 0)
+        if magic == _MAGIC:
+            if (existing_slots, existing_size) != (slots, slot_size):
+                logger.warning(
+                    "Shared claims cache %s already exists with %d slots of %d bytes; "
+                    "using it as is",
+                    self.name,
+                    existing_slots,
+                    existing_size,
+                )
+            return existing_slots, existing_size
+        # New table: the memory is zeroed, so every slot starts empty
+        _TABLE.pack_into(buf, 0, _MAGIC, slots, slot_size)
+        return slots, slot_size
+
+    # ============================================
+    # Lookups
+    # ============================================
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached claims for a token
+
+        Args:
+            token: Bearer token
+
+        Returns:
+            Claims dict, or None on a miss or after expiry
+        """
+        digest = token_digest(token)
+        now = time.time()
+        for offset in self._probe(digest):
+            claims = self._read(offset, digest, now)
+            if claims is not None:
+                return claims
+        return None
+
+    def _probe(self, digest: bytes) -> Iterator[int]:
+        start = int.from_bytes(digest[:8], "little") % self.slots
+        for i in range(min(PROBE_LIMIT, self.slots)):
+            yield _TABLE_SIZE + ((start + i) % self.slots) * self.slot_size
+
+    def _read(self, offset: int, digest: bytes, now: float) -> Optional[Dict[str, Any]]:
+        buf = self._buf
+        for _ in range(3):
+            seq, expires_at, checksum, length, key = _SLOT.unpack_from(buf, offset)
+            if key != digest:
+                return None
+            if seq & 1:
+                continue  # being written
+            start = offset + _SLOT.size
+            payload = bytes(buf[start : start + length])
+            if _SEQ.unpack_from(buf, offset)[0] != seq:
+                continue
+            if _checksum(expires_at, key, payload) != checksum:
+                return None
+            if now >= expires_at:
+                return None
+            return json.loads(payload)  # type: ignore[no-any-return]
+        return None
+
+    # ============================================
+    # Writes
+    # ============================================
+
+    def put(self, token: str, claims: Dict[str, Any], expires_at: Optional[float] = None) -> bool:
+        """
+        Cache verified claims for a token
+
+        Args:
+            token: Bearer token
+            claims: Verified claims
+            expires_at: Epoch seconds the entry is valid until
+                (default: the ``exp`` claim)
+
+        Returns:
+            True if cached; False if the claims are too large or have no expiry
+        """
+        if expires_at is None:
+            expires_at = claims.get("exp")
+        if expires_at is None:
+            return False
+        payload = json.dumps(claims, separators=(",", ":")).encode("utf-8")
+        if _SLOT.size + len(payload) > self.slot_size:
+            return False
+
+        digest = token_digest(token)
+        with self._write_lock():
+            offset = self._victim(digest)
+            self._write(offset, digest, float(expires_at), payload)
+        return True
+
+    def invalidate(self, token: str) -> bool:
+        """
+        Drop a token's cached claims (e.g. after revocation)
+
+        Args:
+            token: Bearer token
+
+        Returns:
+            True if an entry was present
+        """
+        digest = token_digest(token)
+        found = False
+        with self._write_lock():
+            for offset in self._probe(digest):
+                if _SLOT.unpack_from(self._buf, offset)[4] == digest:
+                    self._write(offset, bytes(32), 0.0, b"")
+                    found = True
+        return found
+
+    def _victim(self, digest: bytes) -> int:
+        """Slot for ``digest``: its own, else an empty or expired one, else the soonest to expire"""
+        now = time.time()
+        victim, victim_expiry = -1, float("inf")
+        for offset in self._probe(digest):
+            _, expires_at, _, _, key = _SLOT.unpack_from(self._buf, offset)
+            if key == digest:
+                return offset
+            if expires_at <= now:
+                expires_at = float("-inf")
+            if victim < 0 or expires_at < victim_expiry:
+                victim, victim_expiry = offset, expires_at
+        return victim
+
+    def _write(self, offset: int, digest: bytes, expires_at: float, payload: bytes) -> None:
+        buf = self._buf
+        seq = _SEQ.unpack_from(buf, offset)[0]
+        _SEQ.pack_into(buf, offset, (seq + 1) & 0xFFFFFFFF)  # odd: readers back off
+        start = offset + _SLOT.size
+        buf[start : start + len(payload)] = payload
+        _SLOT.pack_into(
+            buf,
+            offset,
+            (seq + 1) & 0xFFFFFFFF,
+            expires_at,
+            _checksum(expires_at, digest, payload),
+            len(payload),
+            digest,
+        )
+        _SEQ.pack_into(buf, offset, (seq + 2) & 0xFFFFFFFF)
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        if self._lock_fd is None:
+            self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    # ============================================
+    # Lifecycle
+    # ============================================
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._write_lock():
+            for slot in range(self.slots):
+                offset = _TABLE_SIZE + slot * self.slot_size
+                if _SLOT.unpack_from(self._buf, offset)[4] != bytes(32):
+                    self._write(offset, bytes(32), 0.0, b"")
+
+    def close(self) -> None:
+        """Detach this process; the table stays available to others"""
+        if self._closed:
+            return
+        self._closed = True
+        self._shm.close()  # releases the buffer; later use raises ValueError
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def unlink(self) -> None:
+        """Destroy the shared table (call once, e.g. from the master on shutdown)"""
+        if getattr(self._shm, "_untracked", False):
+            # SharedMemory.unlink unregisters the segment again; keep the tracker consistent
+            from multiprocessing import resource_tracker
+
+            resource_tracker.register(self._shm._name, "shared_memory")  # type: ignore[attr-defined]
+        self._shm.unlink()
+
+
+def _checksum(expires_at: float, digest: bytes, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(digest, zlib.crc32(struct.pack("<d", expires_at))))
+
+
+def _attach(name: str, size: int) -> shared_memory.SharedMemory:
+    """Open or create a segment that outlives the process that created it"""
+    try:
+        shm = _open(name, create=True, size=size)
+    except FileExistsError:
+        shm = _open(name, create=False, size=0)
+    return shm
+
+
+def _open(name: str, create: bool, size: int) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 every process registers the segment with the
+        # resource tracker, which unlinks it when that process exits
+        shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+            shm._untracked = True  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        return shm
@@ -0,0 +1,254 @@
+"""Canonical JSON and HMAC signing for AgentAuth SDK"""
+
+import hashlib
+import hmac
+import json
+import math
+import re
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+# C-accelerated JSON string escaping, identical to JSON.stringify for
+# well-formed strings (non-ASCII is emitted raw)
+_encode_string = (
+    getattr(json.encoder, "c_encode_basestring", None) or json.encoder.encode_basestring
+)
+
+_SURROGATE = re.compile("[\ud800-\udfff]")
+
+# Keys JavaScript treats as array indices are enumerated first, in numeric order
+_ARRAY_INDEX = re.compile(r"0|[1-9][0-9]*")
+_MAX_ARRAY_INDEX = 2**32 - 2
+
+
+def _js_round(value: float) -> float:
+    """``Math.round(value * 1e10) / 1e10`` with JavaScript semantics"""
+    scaled = value * 1e10
+    if not math.isfinite(scaled):
+        return scaled
+    floor = math.floor(scaled)
+    rounded = floor + 1 if scaled - floor >= 0.5 else floor
+    return float(rounded) / 1e10
+
+
+def _js_number(value: float) -> str:
+    """Format a number exactly like ``JSON.stringify``"""
+    if not math.isfinite(value):
+        return "null"
+    if value == 0:
+        return "0"  # also -0
+
+    text = repr(value)
+    if "e" not in text:
+        # Python and JavaScript agree on plain decimals except for the ".0" suffix
+        return text[:-2] if text.endswith(".0") else text
+
+    # Rebuild from the shortest round-trip digits using Number::toString rules
+    sign = ""
+    if text[0] == "-":
+        sign, text = "-", text[1:]
+    mantissa, _, exponent = text.partition("e")
+    int_part, _, frac_part = mantissa.partition(".")
+    digits = int_part + frac_part
+    n = len(int_part) + int(exponent)
+    stripped = digits.lstrip("0")
+    n -= len(digits) - len(stripped)
+    digits = stripped.rstrip("0")
+    k = len(digits)
+
+    if k <= n <= 21:
+        return sign + digits + "0" * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + "." + digits[n:]
+    if -6 < n <= 0:
+        return sign + "0." + "0" * -n + digits
+    exp = n - 1
+    exp_text = ("+" if exp >= 0 else "-") + str(abs(exp))
+    if k == 1:
+        return sign + digits + "e" + exp_text
+    return sign + digits[0] + "." + digits[1:] + "e" + exp_text
+
+
+def _js_string(value: str) -> str:
+    encoded = _encode_string(value)
+    if _SURROGATE.search(encoded):
+        # JSON.stringify escapes lone surrogates instead of emitting them
+        encoded = _SURROGATE.sub(lambda m: "\\u%04x" % ord(m.group(0)), encoded)
+    return encoded
+
+
+def _key_order(key: str) -> Any:
+    if _ARRAY_INDEX.fullmatch(key) and int(key) <= _MAX_ARRAY_INDEX:
+        return (0, int(key), b"")
+    # Array.prototype.sort compares UTF-16 code units
+    return (1, 0, key.encode("utf-16-be", "surrogatepass"))
+
+
+# Sorted (key, '"key":') pairs per key set; pings share a handful of shapes
+_LAYOUT_CACHE_SIZE = 1024
+_layouts: Dict[Tuple[Any, ...], List[Tuple[Any, str]]] = {}
+
+
+def _layout(obj: Dict[Any, Any]) -> List[Tuple[Any, str]]:
+    shape = tuple(obj)
+    layout = _layouts.get(shape)
+    if layout is None:
+        named: List[Tuple[str, Union[str, int]]] = []
+        for key in shape:
+            if isinstance(key, str):
+                named.append((key, key))
+            elif isinstance(key, int) and not isinstance(key, bool):
+                named.append((str(key), key))
+            else:
+                raise TypeError(f"Keys must be str or int, not {type(key).__name__}")
+        named.sort(key=lambda pair: _key_order(pair[0]))
+        layout = [(key, _js_string(name) + ":") for name, key in named]
+        if len(_layouts) >= _LAYOUT_CACHE_SIZE:
+            _layouts.clear()
+        _layouts[shape] = layout
+    return layout
+
+
+def _write(value: Any, out: List[str]) -> None:
+    kind = type(value)
+    if kind is float or kind is int:
+        out.append(_js_number(_js_round(float(value))))
+    elif kind is str:
+        out.append(_js_string(value))
+    elif kind is dict:
+        out.append("{")
+        first = True
+        for key, prefix in _layout(value):
+            if first:
+                out.append(prefix)
+                first = False
+            else:
+                out.append("," + prefix)
+            _write(value[key], out)
+        out.append("}")
+    elif value is None:
+        out.append("null")
+    elif value is True:
+        out.append("true")
+    elif value is False:
+        out.append("false")
+    elif isinstance(value, (list, tuple)):
+        out.append("[")
+        for index, item in enumerate(value):
+            if index:
+                out.append(",")
+            _write(item, out)
+        out.append("]")
+    elif isinstance(value, dict):
+        _write(dict(value), out)
+    elif isinstance(value, str):
+        _write(str(value), out)
+    elif isinstance(value, (int, float)):
+        _write(float(value), out)
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def canonical_json(value: Any) -> str:
+    """
+    Serialize ``value`` byte-for-byte like the server's
+    ``JSON.stringify(canonicalize(value))``
+
+    Object keys are sorted (UTF-16 order, array-index keys first as JavaScript
+    enumerates them), numbers are rounded to 10 decimal places and formatted as
+    JavaScript does (``1`` not ``1.0``, ``1e-7``, ``1e+21``), and NaN/Infinity
+    become ``null``.
+
+    Args:
+        value: JSON-compatible value (dicts, lists, str, numbers, bools, None)
+
+    Returns:
+        Canonical JSON text
+    """
+    out: List[str] = []
+    _write(value, out)
+    return "".join(out)
+
+
+class PingSigner:
+    """
+    HMAC-SHA256 signer for health pings, matching ``verifyPingSignature``.
+
+    The HMAC key schedule is computed once; each signature copies the keyed
+    state instead of rehashing the API key.
+
+    Example:
+        >>> signer = PingSigner(api_key)
+        >>> ping = {"metrics": {"toxicity_score": 0.12}, "request_count": 150}
+        >>> ping["signature"] = signer.sign(ping)
+        >>> signatures = signer.sign_many(pings)
+    """
+
+    def __init__(self, api_key: str):
+        """
+        Initialize the signer
+
+        Args:
+            api_key: Agent API key (the HMAC key the server uses)
+        """
+        self._keyed = hmac.new(api_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def sign_canonical(self, canonical: Union[str, bytes]) -> str:
+        """Sign already-canonicalized JSON"""
+        mac = self._keyed.copy()
+        mac.update(canonical.encode("utf-8") if isinstance(canonical, str) else canonical)
+        return mac.hexdigest()
+
+    def sign(self, ping: Dict[str, Any]) -> str:
+        """
+        Sign a health ping body
+
+        Args:
+            ping: Request body; a ``signature`` key, if present, is excluded
+
+        Returns:
+            Hex HMAC-SHA256 signature
+        """
+        if "signature" in ping:
+            ping = {key: value for key, value in ping.items() if key != "signature"}
+        return self.sign_canonical(canonical_json(ping))
+
+    def sign_many(self, pings: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Sign a batch of health ping bodies
+
+        Args:
+            pings: Request bodies
+
+        Returns:
+            Hex signatures, one per ping
+        """
+        keyed = self._keyed
+        signatures: List[str] = []
+        append = signatures.append
+        for ping in pings:
+            if "signature" in ping:
+                ping = {key: value for key, value in ping.items() if key != "signature"}
+            out: List[str] = []
+            _write(ping, out)
+            mac = keyed.copy()
+            mac.update("".join(out).encode("utf-8"))
+            append(mac.hexdigest())
+        return signatures
+
+    def verify(self, ping: Dict[str, Any], signature: str) -> bool:
+        """Check a signature in constant time"""
+        return hmac.compare_digest(self.sign(ping), signature)
+
+
+def sign_persona(persona: Any, api_key: str) -> str:
+    """
+    Compute a persona hash exactly as the server's ``signPersona``
+
+    Args:
+        persona: Persona dict, as sent to the server
+        api_key: Agent API key
+
+    Returns:
+        Hex HMAC-SHA256 of the canonical persona JSON
+    """
+    return PingSigner(api_key).sign_canonical(canonical_json(persona))
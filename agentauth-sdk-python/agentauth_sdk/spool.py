@@ -0,0 +1,449 @@
+"""Durable health ping spool for AgentAuth SDK"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .types import SpoolFullError
+from .utils import is_retryable_failure
+
+if TYPE_CHECKING:
+    from .client import AgentAuthClient
+
+logger = logging.getLogger("agentauth_sdk")
+
+# Record header: payload length and CRC-32 of the payload
+_HEADER = struct.Struct("<II")
+_SEGMENT_SUFFIX = ".seg"
+_ACK_FILE = "ack.json"
+
+# Records read per replay batch
+REPLAY_BATCH_SIZE = 256
+
+# Position of a record: (segment number, byte offset in the segment)
+Position = Tuple[int, int]
+
+
+@dataclass
+class SpooledPing:
+    """A health ping body waiting in the spool"""
+
+    agent_id: str
+    body: Dict[str, Any]
+    position: Position
+    end: Position
+
+
+class PingSpool:
+    """
+    Append-only, file-backed queue of health pings.
+
+    Pings are appended to numbered segment files as length-prefixed, CRC-checked
+    JSON records and fsynced, so a ping accepted by the spool survives a crash.
+    Replay submits them in order (pings of one agent sequentially, different
+    agents concurrently) and records progress in an ack file; segments that are
+    fully acknowledged are deleted. On open, a record torn by a crash at the
+    tail of the last segment is truncated away.
+
+    Delivery is at-least-once: a crash between a submission and the next ack
+    write resends that ping. One process should own a spool directory.
+
+    Example:
+        >>> spool = PingSpool("/var/lib/myservice/pings")
+        >>> client = AgentAuthClient(base_url, api_key=api_key, ping_spool=spool)
+        >>> await client.submit_health_ping(agent_id, metrics)  # spooled if the API is down
+        >>> spool.start(client)  # replays in the background once the API recovers
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 4 * 1024 * 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+        overflow: str = "drop_oldest",
+        fsync: bool = True,
+    ):
+        """
+        Open (or create) a spool and recover its state
+
+        Args:
+            directory: Directory holding the segment files
+            max_segment_bytes: Size at which a new segment is started
+            max_bytes: Cap on the total size of all segments
+            overflow: At the cap, "drop_oldest" discards the oldest segment,
+                "reject" raises SpoolFullError
+            fsync: fsync each append (disable to trade durability for speed)
+        """
+        if overflow not in ("drop_oldest", "reject"):
+            raise ValueError("overflow must be 'drop_oldest' or 'reject'")
+        if max_segment_bytes > max_bytes:
+            raise ValueError("max_segment_bytes must not exceed max_bytes")
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_bytes = max_bytes
+        self.overflow = overflow
+        self.fsync = fsync
+        self.dropped = 0
+
+        self._sizes: Dict[int, int] = {}
+        self._counts: Dict[int, int] = {}
+        self._ack: Position = (0, 0)
+        self._done: Set[Position] = set()
+        self._file: Optional[Any] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    # ============================================
+    # Recovery
+    # ============================================
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{segment:020d}{_SEGMENT_SUFFIX}")
+
+    def _recover(self) -> None:
+        segments = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(_SEGMENT_SUFFIX) and name[: -len(_SEGMENT_SUFFIX)].isdigit()
+        )
+        ack = self._read_ack()
+
+        for segment in segments:
+            path = self._segment_path(segment)
+            if segment < ack[0]:
+                os.unlink(path)  # acknowledged before the last shutdown
+                continue
+            start = ack[1] if segment == ack[0] else 0
+            valid_end, count = self._scan(path, start)
+            if valid_end < os.path.getsize(path):
+                logger.warning(
+                    "Truncating torn ping spool record in %s at byte %d", path, valid_end
+                )
+                with open(path, "r+b") as f:
+                    f.truncate(valid_end)
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._sizes[segment] = valid_end
+            self._counts[segment] = count
+
+        if not self._sizes:
+            self._sizes[ack[0]] = 0
+            self._counts[ack[0]] = 0
+            open(self._segment_path(ack[0]), "ab").close()
+        first = min(self._sizes)
+        self._ack = ack if ack[0] >= first else (first, 0)
+        self._file = open(self._segment_path(max(self._sizes)), "ab", buffering=0)
+
+    def _scan(self, path: str, start: int) -> Tuple[int, int]:
+        """Validate records after ``start``; returns the end of the last good one and the count"""
+        count = 0
+        with open(path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for _, end in _read_records(f, offset):
+                offset = end
+                count += 1
+        return offset, count
+
+    def _read_ack(self) -> Position:
+        try:
+            with open(os.path.join(self.directory, _ACK_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return int(data["segment"]), int(data["offset"])
+        except FileNotFoundError:
+            return (0, 0)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable ping spool ack file in %s", self.directory)
+            return (0, 0)
+
+    def _write_ack(self) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".ack-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"segment": self._ack[0], "offset": self._ack[1]}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, os.path.join(self.directory, _ACK_FILE))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    # ============================================
+    # Appending
+    # ============================================
+
+    def __len__(self) -> int:
+        """Number of pings waiting to be replayed"""
+        return sum(self._counts.values()) - len(self._done)
+
+    @property
+    def size(self) -> int:
+        """Total bytes on disk across segments"""
+        return sum(self._sizes.values())
+
+    def append(self, agent_id: str, body: Dict[str, Any]) -> None:
+        """
+        Durably record a health ping body
+
+        Args:
+            agent_id: Agent ID
+            body: Request body as submitted (metrics, signature, ...)
+
+        Raises:
+            SpoolFullError: If the spool is at ``max_bytes`` and overflow is "reject"
+        """
+        record_json = json.dumps({"agent_id": agent_id, "body": body}, separators=(",", ":"))
+        payload = record_json.encode("utf-8")
+        record = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        if len(record) > self.max_segment_bytes:
+            raise ValueError("Health ping is larger than max_segment_bytes")
+
+        active = max(self._sizes)
+        if self._sizes[active] and self._sizes[active] + len(record) > self.max_segment_bytes:
+            active = self._rotate()
+        while self.size + len(record) > self.max_bytes:
+            if self.overflow == "reject" or len(self._sizes) == 1:
+                raise SpoolFullError(
+                    f"Ping spool {self.directory} is full ({self.size} bytes)",
+                    max_bytes=self.max_bytes,
+                )
+            self._drop_oldest()
+
+        assert self._file is not None
+        self._file.write(record)
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._sizes[active] += len(record)
+        self._counts[active] += 1
+
+    def _rotate(self) -> int:
+        assert self._file is not None
+        self._file.close()
+        segment = max(self._sizes) + 1
+        self._sizes[segment] = 0
+        self._counts[segment] = 0
+        self._file = open(self._segment_path(segment), "ab", buffering=0)
+        return segment
+
+    def _drop_oldest(self) -> None:
+        oldest = min(self._sizes)
+        dropped = self._counts.pop(oldest) - len({p for p in self._done if p[0] == oldest})
+        del self._sizes[oldest]
+        self._done = {p for p in self._done if p[0] != oldest}
+        os.unlink(self._segment_path(oldest))
+        self._ack = max(self._ack, (min(self._sizes), 0))
+        self._write_ack()
+        self.dropped += dropped
+        logger.warning("Ping spool %s is full; dropped %d oldest pings", self.directory, dropped)
+
+    # ============================================
+    # Replay
+    # ============================================
+
+    def pending(self, limit: Optional[int] = None) -> List[SpooledPing]:
+        """
+        Read unacknowledged pings in append order
+
+        Args:
+            limit: Maximum number of pings to return
+
+        Returns:
+            Spooled pings, oldest first
+        """
+        pings: List[SpooledPing] = []
+        for segment in sorted(self._sizes):
+            if segment < self._ack[0]:
+                continue
+            start = self._ack[1] if segment == self._ack[0] else 0
+            with open(self._segment_path(segment), "rb") as f:
+                f.seek(start)
+                offset = start
+                for payload, end in _read_records(f, offset, self._sizes[segment]):
+                    position = (segment, offset)
+                    offset = end
+                    if position in self._done:
+                        continue
+                    record = json.loads(payload)
+                    pings.append(
+                        SpooledPing(record["agent_id"], record["body"], position, (segment, end))
+                    )
+                    if limit is not None and len(pings) >= limit:
+                        return pings
+        return pings
+
+    async def replay(self, client: "AgentAuthClient", concurrency: int = 4) -> int:
+        """
+        Submit spooled pings until the spool is empty or the API fails again
+
+        Each agent's pings are sent one at a time in order; up to
+        ``concurrency`` agents are replayed at once. Pings the API rejects
+        outright (4xx other than 429) are dropped with a warning.
+
+        Args:
+            client: AgentAuth client used to submit the pings
+            concurrency: Maximum agents replayed concurrently
+
+        Returns:
+            Number of pings submitted or dropped
+        """
+        async with self._lock:
+            handled = 0
+            while True:
+                batch = self.pending(REPLAY_BATCH_SIZE)
+                if not batch:
+                    return handled
+                done, failed = await self._replay_batch(client, batch, concurrency)
+                handled += done
+                self._acknowledge(batch)
+                if failed:
+                    return handled
+
+    async def _replay_batch(
+        self, client: "AgentAuthClient", batch: List[SpooledPing], concurrency: int
+    ) -> Tuple[int, bool]:
+        by_agent: Dict[str, List[SpooledPing]] = {}
+        for ping in batch:
+            by_agent.setdefault(ping.agent_id, []).append(ping)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        failed = False
+
+        async def run(pings: List[SpooledPing]) -> int:
+            nonlocal failed
+            count = 0
+            async with semaphore:
+                for ping in pings:
+                    if failed:
+                        break
+                    try:
+                        await client.post_health_ping(ping.agent_id, ping.body)
+                    except Exception as e:
+                        if is_retryable_failure(e):
+                            failed = True
+                            break
+                        logger.warning("Dropping spooled health ping for %s: %s", ping.agent_id, e)
+                    # An append during the post may have dropped the ping's segment
+                    if ping.position[0] in self._sizes:
+                        self._done.add(ping.position)
+                    count += 1
+            return count
+
+        counts = await asyncio.gather(*(run(pings) for pings in by_agent.values()))
+        return sum(counts), failed
+
+    def _acknowledge(self, batch: List[SpooledPing]) -> None:
+        """Advance the ack past the leading run of submitted pings and compact"""
+        advanced = False
+        for ping in batch:
+            if ping.position[0] not in self._sizes:
+                continue  # dropped by an append at max_bytes while replaying
+            if ping.position not in self._done:
+                break
+            self._done.discard(ping.position)
+            self._counts[ping.position[0]] -= 1
+            self._ack = ping.end
+            advanced = True
+        if not advanced:
+            return
+
+        # Pings an agent submitted ahead of an earlier failure are now behind
+        # the ack too (they were skipped by ``pending``, so not in ``batch``)
+        behind = {position for position in self._done if position < self._ack}
+        for position in behind:
+            self._counts[position[0]] -= 1
+        self._done -= behind
+
+        active = max(self._sizes)
+        # Acknowledged segments other than the one being appended to can go
+        for segment in sorted(self._sizes):
+            if segment == active:
+                break
+            acked_segment, acked_offset = self._ack
+            if segment < acked_segment or (
+                segment == acked_segment and acked_offset >= self._sizes[segment]
+            ):
+                os.unlink(self._segment_path(segment))
+                del self._sizes[segment]
+                del self._counts[segment]
+        if self._ack[0] not in self._sizes:
+            self._ack = (min(self._sizes), 0)
+        elif self._ack == (active, self._sizes[active]) and self._sizes[active]:
+            # Everything is acknowledged; start a fresh segment and drop the old one
+            self._rotate()
+            os.unlink(self._segment_path(active))
+            del self._sizes[active]
+            del self._counts[active]
+            self._ack = (max(self._sizes), 0)
+        self._write_ack()
+
+    # ============================================
+    # Background replay
+    # ============================================
+
+    def start(self, client: "AgentAuthClient", interval: float = 5.0, concurrency: int = 4) -> None:
+        """
+        Replay in the background, checking every ``interval`` seconds
+
+        While the API keeps failing, checks back off up to 60 seconds.
+
+        Args:
+            client: AgentAuth client used to submit the pings
+            interval: Seconds between checks when healthy
+            concurrency: Maximum agents replayed concurrently
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._replay_loop(client, interval, concurrency))
+
+    async def stop(self) -> None:
+        """Stop background replay"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _replay_loop(
+        self, client: "AgentAuthClient", interval: float, concurrency: int
+    ) -> None:
+        delay = interval
+        while True:
+            await asyncio.sleep(delay)
+            if not len(self):
+                delay = interval
+                continue
+            try:
+                await self.replay(client, concurrency)
+            except Exception as e:
+                logger.warning("Ping spool replay failed: %s", e)
+            delay = interval if not len(self) else min(delay * 2, 60.0)
+
+    def close(self) -> None:
+        """Close the active segment file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _read_records(f: Any, offset: int, limit: Optional[int] = None) -> Iterator[Tuple[bytes, int]]:
+    """Yield (payload, end offset) for each intact record, stopping at the first bad one"""
+    while limit is None or offset < limit:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return
+        length, checksum = _HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+        offset += _HEADER.size + length
+        yield payload, offset
@@ -0,0 +1,235 @@
+"""Local access token verification for AgentAuth SDK"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+from .permission_bits import PermissionRegistry
+from .types import Agent, TokenVerificationError
+
+if TYPE_CHECKING:
+    from .client import AgentAuthClient
+    from .directory import AgentDirectory
+    from .shared_cache import SharedClaimsCache
+
+
+@dataclass
+class AuthenticatedAgent:
+    """Caller identified by a verified access token"""
+
+    agent_id: str
+    tier: Optional[str]
+    claims: Dict[str, Any]
+    permission_mask: int = 0
+    agent: Optional[Agent] = field(default=None, repr=False)
+
+    def has_all(self, required_mask: int) -> bool:
+        """Check a mask compiled with ``PermissionRegistry.required_mask``"""
+        return self.permission_mask & required_mask == required_mask
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class TokenVerifier:
+    """
+    Verifies AgentAuth access tokens locally, without calling the API.
+
+    Access tokens are HS256 JWTs signed with the server's ``JWT_SECRET``; a
+    service that shares the secret can check them itself. Verified claims are
+    cached per token until ``exp`` (optionally in a :class:`SharedClaimsCache`
+    shared by all workers), so a repeat token costs a dictionary lookup.
+    Permissions come from an :class:`AgentDirectory` replica (or, failing that,
+    ``client.get_agent``) and are compiled to a bitmask once per agent version,
+    so permission checks are a single AND.
+
+    Example:
+        >>> verifier = TokenVerifier(os.environ["AGENTAUTH_JWT_SECRET"], directory=directory)
+        >>> agent = await verifier.authenticate(token)
+        >>> agent.has_all(verifier.registry.required_mask(["zendesk:tickets:read"]))
+        True
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        directory: Optional["AgentDirectory"] = None,
+        client: Optional["AgentAuthClient"] = None,
+        claims_cache: Optional["SharedClaimsCache"] = None,
+        registry: Optional[PermissionRegistry] = None,
+        leeway: float = 0.0,
+        max_entries: int = 10000,
+        require_active: bool = True,
+    ):
+        """
+        Initialize the verifier
+
+        Args:
+            secret: The server's JWT signing secret
+            directory: Local agent replica used for permissions and status
+            client: Client used to fetch agents missing from ``directory``
+                (enable its ``agent_cache_ttl`` to keep this off the hot path)
+            claims_cache: Optional cross-process cache of verified claims
+            registry: Permission registry for compiled masks (default: all
+                ``Permission`` literals)
+            leeway: Seconds of clock skew tolerated on ``exp``/``nbf``
+            max_entries: Tokens kept in the in-process cache
+            require_active: Reject agents whose known status is not "active"
+        """
+        self._key = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self.directory = directory
+        self.client = client
+        self.claims_cache = claims_cache
+        self.registry = registry if registry is not None else PermissionRegistry()
+        self.leeway = leeway
+        self.max_entries = max_entries
+        self.require_active = require_active
+        self._tokens: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._masks: Dict[str, Tuple[Agent, int, int]] = {}
+
+    # ============================================
+    # Claims
+    # ============================================
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verify an access token's signature and lifetime
+
+        Args:
+            token: Encoded JWT (without the "Bearer " prefix)
+
+        Returns:
+            Verified claims
+
+        Raises:
+            TokenVerificationError: If the token is malformed, forged, expired,
+                not yet valid or a refresh token
+        """
+        now = time.time()
+        cached = self._tokens.get(token)
+        if cached is not None:
+            if now < cached[0]:
+                return cached[1]
+            del self._tokens[token]
+            raise TokenVerificationError("Token expired", "expired")
+
+        claims = self.claims_cache.get(token) if self.claims_cache is not None else None
+        if claims is None:
+            claims = self._decode(token, now)
+            if self.claims_cache is not None:
+                self.claims_cache.put(token, claims, expires_at=claims["exp"] + self.leeway)
+        elif now >= claims["exp"] + self.leeway:
+            raise TokenVerificationError("Token expired", "expired")
+
+        self._tokens[token] = (claims["exp"] + self.leeway, claims)
+        if len(self._tokens) > self.max_entries:
+            self._tokens.popitem(last=False)
+        return claims
+
+    def _decode(self, token: str, now: float) -> Dict[str, Any]:
+        try:
+            header_b64, payload_b64, signature_b64 = token.split(".")
+            # Raises UnicodeEncodeError (a ValueError) for non-ASCII tokens
+            signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+            header = json.loads(_b64decode(header_b64))
+            signature = _b64decode(signature_b64)
+        except (ValueError, TypeError):
+            raise TokenVerificationError("Malformed token", "malformed") from None
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            raise TokenVerificationError("Unsupported token algorithm", "algorithm")
+
+        mac = self._key.copy()
+        mac.update(signing_input)
+        if not hmac.compare_digest(mac.digest(), signature):
+            raise TokenVerificationError("Invalid token signature", "signature")
+
+        try:
+            claims = json.loads(_b64decode(payload_b64))
+        except ValueError:
+            raise TokenVerificationError("Malformed token", "malformed") from None
+        if not isinstance(claims, dict) or not isinstance(claims.get("exp"), (int, float)):
+            raise TokenVerificationError("Token has no expiry", "malformed")
+        if not claims.get("agent_id"):
+            raise TokenVerificationError("Token has no agent_id", "malformed")
+        if claims.get("type") == "refresh":
+            raise TokenVerificationError(
+                "Refresh tokens cannot be used for API access", "refresh_token"
+            )
+        if now >= claims["exp"] + self.leeway:
+            raise TokenVerificationError("Token expired", "expired")
+        nbf = claims.get("nbf")
+        if isinstance(nbf, (int, float)) and now + self.leeway < nbf:
+            raise TokenVerificationError("Token not yet valid", "not_before")
+        return claims
+
+    def invalidate(self, token: str) -> None:
+        """Forget a token's cached claims"""
+        self._tokens.pop(token, None)
+        if self.claims_cache is not None:
+            self.claims_cache.invalidate(token)
+
+    # ============================================
+    # Agents and permissions
+    # ============================================
+
+    async def authenticate(self, token: str) -> AuthenticatedAgent:
+        """
+        Verify a token and resolve the agent's compiled permissions
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            AuthenticatedAgent
+
+        Raises:
+            TokenVerificationError: If the token is invalid or the agent is not
+                active
+        """
+        claims = self.verify(token)
+        agent_id = claims["agent_id"]
+
+        agent = self.directory.get(agent_id) if self.directory is not None else None
+        if agent is None and self.client is not None:
+            try:
+                agent = await self.client.get_agent(agent_id)
+            except Exception:
+                raise TokenVerificationError("Agent not found", "unknown_agent") from None
+        if agent is None:
+            return AuthenticatedAgent(agent_id=agent_id, tier=claims.get("tier"), claims=claims)
+
+        if self.require_active and agent.status != "active":
+            raise TokenVerificationError(f"Agent is {agent.status}", "inactive")
+        return AuthenticatedAgent(
+            agent_id=agent_id,
+            tier=claims.get("tier"),
+            claims=claims,
+            permission_mask=self.mask_for(agent),
+            agent=agent,
+        )
+
+    def mask_for(self, agent: Agent) -> int:
+        """Compiled permission mask of an agent, recomputed when the agent changes"""
+        cached = self._masks.get(agent.agent_id)
+        # New registrations can extend what an agent's wildcards cover
+        registered = len(self.registry)
+        if (
+            cached is not None
+            and cached[1] == registered
+            and (cached[0] is agent or cached[0] == agent)
+        ):
+            return cached[2]
+        mask = self.registry.encode(agent.permissions or [])
+        # Encoding registers the agent's own grants; count those in
+        self._masks[agent.agent_id] = (agent, len(self.registry), mask)
+        return mask
+
+    def required_mask(self, permissions: Iterable[str]) -> int:
+        """Compile required permissions for ``AuthenticatedAgent.has_all``"""
+        return self.registry.required_mask(permissions)
@@ -1,17 +1,41 @@
 """Type definitions for AgentAuth SDK"""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, Union, cast
 from datetime import datetime
 
 from .permissions import Permission
 
+_T = TypeVar("_T")
+
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """
+    Rebuild a dataclass with ``__slots__`` (``@dataclass(slots=True)`` needs 3.10)
+
+    Instances then carry no per-instance ``__dict__``, which matters for types
+    returned by the hundred thousand (agents, history entries).
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))  # type: ignore[arg-type]
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    metaclass = cast(Callable[..., Type[_T]], type(cls))
+    slotted = metaclass(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
 
 # Agent types
 AgentStatus = Literal["active", "inactive", "suspended", "revoked"]
 AgentTier = Literal["free", "pro", "enterprise"]
 
 
+@_slotted
 @dataclass
 class Agent:
     """Agent model"""
@@ -151,6 +175,49 @@ class RegisterWebhookRequest:
     events: List[str]
 
 
+@dataclass
+class WebhookEvent:
+    """A webhook delivery as received: ``{event, agent_id, data, timestamp}``"""
+
+    event: str
+    agent_id: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: Optional[str] = None
+    signature: Optional[str] = None
+
+
+@dataclass
+class WebhookDelivery:
+    """A recorded webhook delivery attempt"""
+
+    id: str
+    webhook_id: str
+    event_type: str
+    delivered_at: str
+    payload: Optional[Dict[str, Any]] = None
+    response_status: Optional[int] = None
+    response_body: Optional[str] = None
+    error_message: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """Whether the delivery errored or got a non-2xx response"""
+        if self.error_message:
+            return True
+        return self.response_status is None or not 200 <= self.response_status < 300
+
+
+@dataclass
+class WebhookDeliveriesResponse:
+    """A page of webhook delivery history"""
+
+    deliveries: List[WebhookDelivery]
+    total: Optional[int] = None
+    limit: int = 50
+    offset: int = 0
+    since: Optional[str] = None
+
+
 @dataclass
 class HealthCheckResponse:
     """Health check response"""
@@ -238,6 +305,24 @@ class PersonaVerifyResponse:
     reason: str
 
 
+@dataclass
+class PersonaChange:
+    """
+    One structural change between two personas, in the server's deep-diff format.
+
+    ``kind`` is "N" (added), "D" (deleted), "E" (edited) or "A" (array element
+    added/removed at ``index``; ``item`` holds the nested N/D change).
+    """
+
+    kind: Literal["N", "D", "E", "A"]
+    path: Optional[List[Union[str, int]]] = None
+    lhs: Any = None
+    rhs: Any = None
+    index: Optional[int] = None
+    item: Optional["PersonaChange"] = None
+
+
+@_slotted
 @dataclass
 class PersonaHistoryEntry:
     """Single entry in persona version history"""
@@ -345,6 +430,7 @@ class HealthPingRequest:
     period_start: Optional[str] = None
     period_end: Optional[str] = None
     signature: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
 
 
 @dataclass
@@ -390,6 +476,7 @@ class DriftScoreResponse:
     message: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class DriftHistoryEntry:
     """Single entry in drift history"""
@@ -402,6 +489,9 @@ class DriftHistoryEntry:
     request_count: Optional[int] = None
     period_start: Optional[str] = None
     period_end: Optional[str] = None
+    # Set instead of ``metrics`` when the history is filtered to one metric
+    metric_name: Optional[str] = None
+    metric_value: Optional[float] = None
 
 
 @dataclass
@@ -414,6 +504,20 @@ class DriftHistoryResponse:
     offset: int
 
 
+DriftStatus = Literal["unknown", "ok", "warning", "critical", "revoked"]
+
+
+@dataclass
+class DriftStatusChange:
+    """Drift status transition emitted by DriftMonitor"""
+
+    agent_id: str
+    previous: DriftStatus
+    current: DriftStatus
+    drift_score: Optional[float]
+    spike_warnings: Optional[List[AnomalyNote]] = None
+
+
 @dataclass
 class DriftConfig:
     """
@@ -437,6 +541,31 @@ class DriftConfig:
     spike_sensitivity: float = 2.0
 
 
+# ============================================
+# Session Types
+# ============================================
+
+
+@dataclass
+class AgentSession:
+    """
+    Reads a service needs before serving an agent, fetched concurrently by
+    ``AgentAuthClient.warm``.
+
+    Parts that failed are None and their exceptions are kept in ``errors``
+    (only when ``warm`` is called with ``return_exceptions=True``).
+    """
+
+    agent_id: str
+    agent: Optional[Agent] = None
+    persona: Optional[PersonaResponse] = None
+    drift_config: Optional[DriftConfig] = None
+    permissions: Optional[Dict[str, Any]] = None
+    token: Optional[Token] = None
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
 # ============================================
 # Custom Errors
 # ============================================
@@ -470,6 +599,34 @@ class ZKPVerificationError(Exception):
         self.reason = reason
 
 
+class TokenVerificationError(Exception):
+    """Raised when an access token fails local verification"""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.status_code = 401
+        self.reason = reason
+
+
+class BundleSignatureError(Exception):
+    """Raised when a persona bundle does not match its signature"""
+
+    def __init__(self, message: str, expected: Optional[str] = None, actual: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = 400
+        self.expected = expected
+        self.actual = actual
+
+
+class SpoolFullError(Exception):
+    """Raised when the health ping spool has reached its size cap"""
+
+    def __init__(self, message: str, max_bytes: int):
+        super().__init__(message)
+        self.status_code = 507
+        self.max_bytes = max_bytes
+
+
 # Configuration
 @dataclass
 class AgentAuthConfig:
@@ -1,8 +1,11 @@
 """Utility functions for AgentAuth SDK"""
 
 import asyncio
+import dataclasses
 import random
-from typing import TypeVar, Callable, Awaitable
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Type, TypeVar, Callable, Awaitable
 from httpx import HTTPStatusError, RequestError
 
 T = TypeVar("T")
@@ -40,6 +43,26 @@ def is_retryable_error(error: Exception) -> bool:
     return False
 
 
+def is_retryable_failure(error: Exception) -> bool:
+    """
+    Check if a failed API call is worth repeating
+
+    Unlike :func:`is_retryable_error`, this also covers the
+    :class:`AgentAuthError` the client raises for HTTP error responses.
+
+    Args:
+        error: The exception to check
+
+    Returns:
+        True for network errors and 5xx or 429 responses
+    """
+    if isinstance(error, RequestError):
+        return True
+    if isinstance(error, AgentAuthError):
+        return error.status_code >= 500 or error.status_code == 429
+    return False
+
+
 async def retry_with_backoff(
     func: Callable[[], Awaitable[T]],
     max_retries: int = 3,
@@ -86,6 +109,46 @@ async def retry_with_backoff(
     raise AgentAuthError("Retry failed with no exception")
 
 
+def dataclass_from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+    """
+    Build a dataclass from an API payload, ignoring fields it does not declare
+
+    The API returns more columns than the SDK models (e.g. ``description`` or
+    ``last_verified_at`` on agents), which would make ``cls(**data)`` fail.
+
+    Args:
+        cls: Dataclass type to build
+        data: Response payload
+
+    Returns:
+        Dataclass instance
+    """
+    names = {f.name for f in dataclasses.fields(cls)}  # type: ignore[arg-type]
+    return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an API ISO-8601 timestamp into epoch seconds
+
+    Args:
+        value: Timestamp such as ``2026-02-01T12:00:00.000Z``, or None
+
+    Returns:
+        Epoch seconds, or None if ``value`` is empty
+    """
+    if not value:
+        return None
+    # Postgres trims trailing zeros from fractions; fromisoformat wants 3 or 6 digits
+    normalized = re.sub(
+        r"\.(\d+)", lambda m: "." + m.group(1)[:6].ljust(6, "0"), value.replace("Z", "+00:00")
+    )
+    parsed = datetime.fromisoformat(normalized)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
 def validate_base_url(url: str) -> None:
     """
     Validate base URL format
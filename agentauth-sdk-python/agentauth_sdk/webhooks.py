@@ -0,0 +1,531 @@
+"""Webhook receiving and delivery sync for AgentAuth SDK"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .types import WebhookDeliveriesResponse, WebhookDelivery, WebhookEvent
+from .utils import parse_timestamp
+
+if TYPE_CHECKING:
+    from .client import AgentAuthClient
+
+logger = logging.getLogger("agentauth_sdk")
+
+# Header set by the server's webhook delivery; the documented alias is also accepted
+SIGNATURE_HEADERS = (b"x-agentauth-signature", b"x-webhook-signature")
+
+WebhookHandler = Callable[[WebhookEvent], Union[None, Awaitable[None]]]
+
+
+def webhook_event_from_dict(
+    payload: Dict[str, Any], signature: Optional[str] = None
+) -> WebhookEvent:
+    """
+    Build a WebhookEvent from a delivery body
+
+    Args:
+        payload: Decoded body ``{event, agent_id, data, timestamp}``
+        signature: Signature the delivery was verified with
+
+    Returns:
+        WebhookEvent
+    """
+    data = payload.get("data") or {}
+    return WebhookEvent(
+        event=payload["event"],
+        agent_id=payload.get("agent_id") or data.get("agent_id"),
+        data=data,
+        timestamp=payload.get("timestamp"),
+        signature=signature,
+    )
+
+
+class WebhookVerifier:
+    """
+    Verifies webhook signatures (hex HMAC-SHA256 of the raw body).
+
+    Keyed HMAC state is computed once per secret. Several secrets can be given
+    so deliveries keep verifying while a secret is being rotated.
+
+    Example:
+        >>> verifier = WebhookVerifier(["whsec_new...", "whsec_old..."])
+        >>> verifier.verify(body, request.headers["X-AgentAuth-Signature"])
+        True
+    """
+
+    def __init__(self, secrets: Union[str, Sequence[str]]):
+        """
+        Initialize the verifier
+
+        Args:
+            secrets: Webhook secret, or secrets to accept during rotation
+        """
+        if isinstance(secrets, str):
+            secrets = [secrets]
+        if not secrets:
+            raise ValueError("At least one webhook secret is required")
+        self._keyed = [
+            hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256) for secret in secrets
+        ]
+
+    def sign(self, body: bytes) -> str:
+        """Signature of ``body`` under the first secret"""
+        mac = self._keyed[0].copy()
+        mac.update(body)
+        return mac.hexdigest()
+
+    def verify(self, body: bytes, signature: Optional[str]) -> bool:
+        """
+        Check a signature in constant time
+
+        Args:
+            body: Raw request body
+            signature: Header value (hex, optionally prefixed with ``sha256=``)
+
+        Returns:
+            True if any secret produces the signature
+        """
+        if not signature:
+            return False
+        if signature.startswith("sha256="):
+            signature = signature[7:]
+        provided = signature.strip().lower().encode("ascii", "replace")
+        valid = False
+        for keyed in self._keyed:
+            mac = keyed.copy()
+            mac.update(body)
+            # No early exit, so timing doesn't reveal which secret matched
+            valid |= hmac.compare_digest(mac.hexdigest().encode("ascii"), provided)
+        return valid
+
+
+class WebhookReceiver:
+    """
+    ASGI app that receives AgentAuth webhook deliveries.
+
+    Each delivery is verified, deduplicated and put on a bounded queue, and the
+    HTTP response is sent straight away; handlers run on separate worker tasks.
+    When the queue is full the receiver answers 503 with ``Retry-After`` instead
+    of buffering without limit.
+
+    Deliveries carry no ID, so the signature (an HMAC of the body, which
+    includes its timestamp) identifies a delivery for deduplication within
+    ``dedupe_window`` seconds.
+
+    Example:
+        >>> receiver = WebhookReceiver(secret="whsec_...", max_queue=10_000)
+        >>> @receiver.on("agent.drift.revoked")
+        ... async def on_revoked(event):
+        ...     await quarantine(event.agent_id)
+        >>> app.mount("/webhooks/agentauth", receiver)  # any ASGI framework
+    """
+
+    def __init__(
+        self,
+        secret: Union[str, Sequence[str]],
+        max_queue: int = 1000,
+        workers: int = 4,
+        dedupe_window: float = 600.0,
+        dedupe_max: int = 100000,
+        max_body_size: int = 1024 * 1024,
+        retry_after: int = 5,
+    ):
+        """
+        Initialize the receiver
+
+        Args:
+            secret: Webhook secret, or secrets to accept during rotation
+            max_queue: Events buffered before deliveries are refused with 503
+            workers: Handler tasks started by :meth:`start` (or ASGI lifespan)
+            dedupe_window: Seconds a delivery is remembered for deduplication
+            dedupe_max: Deliveries remembered at most
+            max_body_size: Largest accepted request body in bytes
+            retry_after: ``Retry-After`` seconds sent with 503
+        """
+        self.verifier = WebhookVerifier(secret)
+        self.max_queue = max_queue
+        self.workers = workers
+        self.dedupe_window = dedupe_window
+        self.dedupe_max = dedupe_max
+        self.max_body_size = max_body_size
+        self.retry_after = retry_after
+
+        self._handlers: Dict[str, List[WebhookHandler]] = {}
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._queue: Optional["asyncio.Queue[WebhookEvent]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    @property
+    def queue(self) -> "asyncio.Queue[WebhookEvent]":
+        """Queue of verified events (created on first use, in the running loop)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        return self._queue
+
+    # ============================================
+    # Handlers
+    # ============================================
+
+    def on(self, event_type: str = "*") -> Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Register a handler (sync or async) for an event type ("*" for all events)
+
+        Args:
+            event_type: Event name, e.g. "persona.updated"
+
+        Returns:
+            Decorator registering the handler
+        """
+
+        def register(handler: WebhookHandler) -> WebhookHandler:
+            self._handlers.setdefault(event_type, []).append(handler)
+            return handler
+
+        return register
+
+    async def dispatch(self, event: WebhookEvent) -> None:
+        """Run the handlers for one event, logging their failures"""
+        for handler in self._handlers.get(event.event, []) + self._handlers.get("*", []):
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("Webhook handler failed for %s", event.event)
+
+    async def start(self) -> None:
+        """Start worker tasks that dispatch queued events to handlers"""
+        queue = self.queue
+        while len(self._tasks) < self.workers:
+            self._tasks.append(asyncio.ensure_future(self._work(queue)))
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers
+
+        Args:
+            drain: Wait until queued events have been handled first
+        """
+        if drain and self._queue is not None:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self, queue: "asyncio.Queue[WebhookEvent]") -> None:
+        while True:
+            event = await queue.get()
+            try:
+                await self.dispatch(event)
+            finally:
+                queue.task_done()
+
+    # ============================================
+    # Ingestion
+    # ============================================
+
+    def _is_duplicate(self, key: str) -> bool:
+        now = time.monotonic()
+        seen = self._seen
+        while seen:
+            oldest, expires_at = next(iter(seen.items()))
+            if expires_at > now and len(seen) < self.dedupe_max:
+                break
+            del seen[oldest]
+        expiry = seen.get(key)
+        return expiry is not None and expiry > now
+
+    def _remember(self, key: str) -> None:
+        self._seen[key] = time.monotonic() + self.dedupe_window
+
+    def ingest(self, body: bytes, signature: Optional[str]) -> int:
+        """
+        Verify, deduplicate and enqueue one delivery
+
+        Framework-agnostic core of the ASGI app, for servers that already have
+        the raw body and headers.
+
+        Args:
+            body: Raw request body
+            signature: Signature header value
+
+        Returns:
+            HTTP status: 202 queued, 200 duplicate, 400 malformed, 401 bad
+            signature, 503 queue full
+        """
+        if signature is None or not self.verifier.verify(body, signature):
+            return 401
+        key = signature[7:] if signature.startswith("sha256=") else signature
+        key = key.strip().lower()
+        if self._is_duplicate(key):
+            return 200
+
+        try:
+            event = webhook_event_from_dict(json.loads(body), signature=key)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 400
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return 503
+        # Only remembered once queued, so a refused delivery can be retried
+        self._remember(key)
+        return 202
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            await self._respond(send, 405, {"error": "Method not allowed"}, [(b"allow", b"POST")])
+            return
+
+        signature = None
+        for name, value in scope.get("headers", []):
+            if name.lower() in SIGNATURE_HEADERS:
+                signature = value.decode("latin-1")
+                break
+
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                await self._respond(send, 413, {"error": "Payload too large"})
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        status = self.ingest(b"".join(chunks), signature)
+        if status == 503:
+            await self._respond(
+                send,
+                503,
+                {"error": "Receiver busy"},
+                [(b"retry-after", str(self.retry_after).encode("ascii"))],
+            )
+        elif status == 401:
+            await self._respond(send, 401, {"error": "Invalid signature"})
+        elif status == 400:
+            await self._respond(send, 400, {"error": "Malformed webhook payload"})
+        else:
+            await self._respond(send, status, {"received": True, "duplicate": status == 200})
+
+    async def _lifespan(self, receive: Any, send: Any) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if self._handlers:
+                    await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _respond(
+        send: Any,
+        status: int,
+        body: Dict[str, Any],
+        headers: Optional[List[Any]] = None,
+    ) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(payload)).encode("ascii")),
+                ]
+                + (headers or []),
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def _format_timestamp(epoch: float) -> str:
+    """Epoch seconds as an ISO timestamp with microseconds"""
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class WebhookDeliverySync:
+    """
+    Incremental reader of a webhook's delivery log.
+
+    Remembers a ``delivered_at`` watermark and fetches only deliveries recorded
+    after it, oldest first. After the first page, up to ``prefetch`` pages are
+    fetched concurrently ahead of the consumer. Failed deliveries are kept in
+    :attr:`failed` until resolved, so they can be replayed without rescanning
+    history.
+
+    Each pass re-reads the last ``overlap`` seconds and skips deliveries it has
+    already returned, so rows recorded in the same millisecond as the watermark
+    are not lost. To skip them across restarts as well, persist
+    :attr:`seen_ids` with the watermark and pass both back; with the watermark
+    alone, deliveries inside the overlap may be returned again (at-least-once).
+
+    Example:
+        >>> sync = WebhookDeliverySync(client, webhook_id, since=saved_watermark, seen=saved_ids)
+        >>> new = await sync.sync()
+        >>> for delivery in sync.failed.values():
+        ...     await replay(delivery)
+        ...     sync.resolve(delivery.id)
+        >>> saved_watermark, saved_ids = sync.watermark, sync.seen_ids
+    """
+
+    def __init__(
+        self,
+        client: "AgentAuthClient",
+        webhook_id: str,
+        since: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 4,
+        overlap: float = 1.0,
+        seen: Iterable[str] = (),
+    ):
+        """
+        Initialize the sync
+
+        Args:
+            client: AgentAuth client
+            webhook_id: Webhook ID
+            since: Watermark to resume from (ISO timestamp; default: full history)
+            page_size: Deliveries per request
+            prefetch: Pages fetched ahead of the consumer, concurrently
+            overlap: Seconds re-read before the watermark on each pass
+            seen: :attr:`seen_ids` saved with ``since``, so deliveries already
+                returned inside the overlap are not returned again
+        """
+        self.client = client
+        self.webhook_id = webhook_id
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.overlap = overlap
+        self.failed: "OrderedDict[str, WebhookDelivery]" = OrderedDict()
+
+        self._watermark = parse_timestamp(since)
+        self._recent: Dict[str, float] = {}
+        if self._watermark is not None:
+            # Their exact times are unknown; all fall within the overlap
+            self._recent = {str(delivery_id): self._watermark for delivery_id in seen}
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """``delivered_at`` of the newest delivery returned so far"""
+        return None if self._watermark is None else _format_timestamp(self._watermark)
+
+    @property
+    def seen_ids(self) -> List[str]:
+        """IDs of deliveries returned within ``overlap`` of the watermark"""
+        return list(self._recent)
+
+    def resolve(self, delivery_id: str) -> None:
+        """Remove a failed delivery once it has been replayed"""
+        self.failed.pop(delivery_id, None)
+
+    async def sync(self) -> List[WebhookDelivery]:
+        """
+        Fetch all deliveries recorded after the watermark
+
+        Returns:
+            New deliveries, oldest first
+        """
+        return [delivery async for delivery in self.deliveries()]
+
+    async def deliveries(self) -> AsyncIterator[WebhookDelivery]:
+        """
+        Iterate over deliveries recorded after the watermark, oldest first
+
+        The watermark advances as deliveries are yielded, so a pass interrupted
+        part-way resumes after the last delivery consumed.
+        """
+        since = None
+        if self._watermark is not None:
+            since = _format_timestamp(self._watermark - self.overlap)
+
+        first = await self._page(since, 0)
+        total = first.total if first.total is not None else len(first.deliveries)
+        offsets = iter(range(self.page_size, total, self.page_size))
+        pending: Deque["asyncio.Future[WebhookDeliveriesResponse]"] = deque()
+
+        def schedule() -> None:
+            # At most ``prefetch`` pages fetched ahead of the consumer, so a slow
+            # consumer doesn't buffer the whole delivery log
+            while len(pending) < max(1, self.prefetch):
+                offset = next(offsets, None)
+                if offset is None:
+                    return
+                pending.append(asyncio.ensure_future(self._page(since, offset)))
+
+        try:
+            schedule()
+            for delivery in self._accept(first.deliveries):
+                yield delivery
+            while pending:
+                page = await pending.popleft()
+                schedule()
+                for delivery in self._accept(page.deliveries):
+                    yield delivery
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _page(self, since: Optional[str], offset: int) -> WebhookDeliveriesResponse:
+        return await self.client.get_webhook_deliveries(
+            self.webhook_id,
+            limit=self.page_size,
+            offset=offset,
+            since=since,
+            order="asc",
+        )
+
+    def _accept(self, deliveries: List[WebhookDelivery]) -> List[WebhookDelivery]:
+        """Drop deliveries already returned and advance the watermark"""
+        accepted = []
+        for delivery in deliveries:
+            delivered_at = parse_timestamp(delivery.delivered_at)
+            if delivered_at is None or str(delivery.id) in self._recent:
+                continue
+            self._recent[str(delivery.id)] = delivered_at
+            if self._watermark is None or delivered_at > self._watermark:
+                self._watermark = delivered_at
+            if delivery.failed:
+                self.failed[str(delivery.id)] = delivery
+            accepted.append(delivery)
+
+        if self._watermark is not None:
+            cutoff = self._watermark - self.overlap
+            self._recent = {key: ts for key, ts in self._recent.items() if ts >= cutoff}
+        return accepted
@@ -0,0 +1,196 @@
+"""Client-side ZKP helpers for AgentAuth SDK"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .types import VerifyAnonymousResponse
+from .utils import parse_timestamp
+
+# Server limits for POST /zkp/verify-anonymous/batch
+MAX_BATCH_VERIFICATIONS = 100
+MAX_BATCH_ZKP_VERIFICATIONS = 10
+
+
+def compute_preimage_hash(agent_id: str, api_key: str, salt: str) -> str:
+    """
+    Compute the hash-mode ``preimage_hash`` exactly as the server's ``generateCommitment``
+
+    For valid credentials this equals the commitment returned by ``register_commitment``.
+
+    Args:
+        agent_id: Agent ID
+        api_key: API key
+        salt: Salt returned once by ``register_commitment``
+
+    Returns:
+        Hex SHA-256 of ``"agent_id:api_key:salt"``
+    """
+    return hashlib.sha256(f"{agent_id}:{api_key}:{salt}".encode("utf-8")).hexdigest()
+
+
+def verification_digest(
+    mode: str,
+    proof: Optional[Dict[str, Any]] = None,
+    public_signals: Optional[List[str]] = None,
+    preimage_hash: Optional[str] = None,
+) -> str:
+    """
+    Digest of the evidence presented for a commitment
+
+    Two verifications of the same commitment share a cache entry only if they
+    present the same proof and public signals (ZKP mode) or preimage hash (hash mode).
+
+    Args:
+        mode: Verification mode ('zkp' or 'hash')
+        proof: Groth16 proof object
+        public_signals: Public signals array
+        preimage_hash: Preimage hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        [mode, proof, public_signals, preimage_hash],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class VerificationCache:
+    """
+    Cache of ``verify_anonymous`` results keyed by commitment and evidence digest.
+
+    Valid results live until the commitment's ``expires_at`` or ``ttl``, whichever
+    comes first; invalid results are kept for ``negative_ttl`` only. Revoking a
+    commitment drops every entry for it.
+
+    Example:
+        >>> cache = VerificationCache(ttl=300, negative_ttl=5)
+        >>> client = AgentAuthClient(base_url="...", verification_cache=cache)
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 5.0, max_entries: int = 10000):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Maximum lifetime of a valid result in seconds
+            negative_ttl: Lifetime of an invalid result in seconds
+            max_entries: Entries kept before the least recently used is evicted
+                (commitment expiries are bounded the same way)
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, VerifyAnonymousResponse]]" = (
+            OrderedDict()
+        )
+        self._by_commitment: Dict[str, Set[str]] = {}
+        # Bounded like the entries: commitments seen once must not accumulate
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_expiry(self, commitment: str, expires_at: Union[str, float, None]) -> None:
+        """
+        Record a commitment's ``expires_at`` so valid results never outlive it
+
+        Args:
+            commitment: Commitment hash
+            expires_at: ISO timestamp from ``register_commitment``, epoch
+                seconds, or None
+        """
+        expiry = expires_at if isinstance(expires_at, (int, float)) else parse_timestamp(expires_at)
+        if expiry is None:
+            self._expiry.pop(commitment, None)
+            return
+        self._expiry[commitment] = expiry
+        self._expiry.move_to_end(commitment)
+        while len(self._expiry) > self.max_entries:
+            self._expiry.popitem(last=False)
+
+    def get(self, commitment: str, digest: str) -> Optional[VerifyAnonymousResponse]:
+        """
+        Get a cached result
+
+        Args:
+            commitment: Commitment hash
+            digest: Evidence digest from :func:`verification_digest`
+
+        Returns:
+            Cached response, or None on miss or expiry
+        """
+        key = (commitment, digest)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if time.time() >= expires_at:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, commitment: str, digest: str, response: VerifyAnonymousResponse) -> None:
+        """
+        Store a result
+
+        Args:
+            commitment: Commitment hash
+            digest: Evidence digest
+            response: Verification result
+        """
+        now = time.time()
+        if response.valid:
+            expires_at = now + self.ttl
+            commitment_expiry = self._expiry.get(commitment)
+            if commitment_expiry is not None:
+                expires_at = min(expires_at, commitment_expiry)
+        else:
+            expires_at = now + self.negative_ttl
+        if expires_at <= now:
+            return
+
+        key = (commitment, digest)
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        self._by_commitment.setdefault(commitment, set()).add(digest)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+
+    def invalidate(self, commitment: str) -> int:
+        """
+        Drop all results for a commitment (e.g. after revocation)
+
+        Args:
+            commitment: Commitment hash
+
+        Returns:
+            Number of entries removed
+        """
+        digests = self._by_commitment.pop(commitment, set())
+        for digest in digests:
+            self._entries.pop((commitment, digest), None)
+        self._expiry.pop(commitment, None)
+        return len(digests)
+
+    def clear(self) -> None:
+        """Drop all results"""
+        self._entries.clear()
+        self._by_commitment.clear()
+        self._expiry.clear()
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        commitment, digest = key
+        digests = self._by_commitment.get(commitment)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_commitment[commitment]
@@ -0,0 +1,149 @@
+"""
+Per-request overhead of AgentAuth FastAPI authentication
+
+Drives a FastAPI app directly through its ASGI interface (no network, no HTTP
+client) and reports the added latency of AgentAuthMiddleware plus a
+require_permissions dependency over an identical unauthenticated route, along
+with the cost of TokenVerifier cache hits and misses.
+
+Run:
+    pip install umytbaynazarow-agentauth-sdk[fastapi]
+    python benchmarks/bench_fastapi_auth.py
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, List
+
+from fastapi import Depends, FastAPI
+
+from agentauth_sdk import AgentAuthClient, AgentDirectory, TokenVerifier
+from agentauth_sdk.integrations.fastapi import AgentAuthMiddleware, require_permissions
+from agentauth_sdk.types import Agent
+
+SECRET = "benchmark-secret"
+ITERATIONS = 20000
+
+
+def make_token(agent_id: str, secret: str = SECRET, ttl: int = 3600) -> str:
+    """Sign an access token the way the AgentAuth API does (HS256)"""
+
+    def encode(obj: Dict[str, Any]) -> str:
+        raw = json.dumps(obj, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    now = int(time.time())
+    signing_input = (
+        encode({"alg": "HS256", "typ": "JWT"})
+        + "."
+        + encode({"agent_id": agent_id, "tier": "pro", "iat": now, "exp": now + ttl})
+    )
+    signature = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return signing_input + "." + base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
+
+
+def build_app(verifier: TokenVerifier) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/open")
+    async def open_route() -> Dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/tickets")
+    async def tickets(
+        _agent: Any = Depends(require_permissions("zendesk:tickets:read")),
+    ) -> Dict[str, bool]:
+        return {"ok": True}
+
+    app.add_middleware(AgentAuthMiddleware, verifier=verifier)
+    return app
+
+
+async def call(app: FastAPI, path: str, headers: List[Any]) -> int:
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 8000),
+    }
+    await app(scope, receive, send)
+    return status
+
+
+async def per_request_us(app: FastAPI, path: str, headers: List[Any]) -> float:
+    for _ in range(1000):
+        await call(app, path, headers)
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await call(app, path, headers)
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    # Populated by hand here; a service would load() it and keep it current with start()
+    directory = AgentDirectory(AgentAuthClient(base_url="http://localhost:3000"))
+    directory.upsert(
+        Agent(
+            agent_id="agt_bench",
+            name="Benchmark Agent",
+            owner_email="bench@example.com",
+            status="active",
+            tier="pro",
+            permissions=["zendesk:*:*"],
+            created_at="2026-01-01T00:00:00Z",
+            updated_at="2026-01-01T00:00:00Z",
+        )
+    )
+    verifier = TokenVerifier(SECRET, directory=directory)
+    token = make_token("agt_bench")
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    app = build_app(verifier)
+
+    assert await call(app, "/tickets", headers) == 200
+    assert await call(app, "/tickets", []) == 401
+
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        verifier.verify(token)
+    hit_us = (time.perf_counter() - started) / ITERATIONS * 1e6
+
+    cold = [make_token("agt_bench", ttl=3600 + i) for i in range(2000)]
+    started = time.perf_counter()
+    for t in cold:
+        verifier.verify(t)
+    miss_us = (time.perf_counter() - started) / len(cold) * 1e6
+
+    baseline = await per_request_us(app, "/open", [])
+    authed = await per_request_us(app, "/tickets", headers)
+
+    print(f"verify (cached token):         {hit_us:8.2f} us")
+    print(f"verify (new token, HS256):     {miss_us:8.2f} us")
+    print(f"request, no auth:              {baseline:8.2f} us")
+    print(f"request, middleware + perms:   {authed:8.2f} us")
+    print(f"auth overhead per request:     {authed - baseline:8.2f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+"""
+Retained memory of large AgentAuth result sets
+
+Builds agents, drift history entries and persona history entries from
+synthetic API pages, first the way the SDK used to (agents as dataclasses with
+a per-instance ``__dict__``, history entries as the decoded JSON dicts) and
+then with the compact records the client now returns, and reports the memory
+each set keeps alive as measured by tracemalloc.
+
+Run:
+    python benchmarks/bench_record_memory.py [records]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List
+
+from agentauth_sdk.records import agent_record, drift_history_records, persona_history_records
+
+PAGE_SIZE = 100
+PERMISSIONS = [
+    "zendesk:tickets:read",
+    "zendesk:tickets:write",
+    "slack:messages:write",
+    "github:repos:read",
+]
+METRICS = ["response_time", "error_rate", "tone_score", "token_usage", "refusal_rate"]
+
+
+# Agent representation before compact records
+@dataclass
+class LegacyAgent:
+    agent_id: str
+    name: str
+    owner_email: str
+    permissions: List[str]
+    status: str
+    tier: str
+    created_at: str
+    updated_at: str
+
+
+def agent_pages(count: int) -> Iterator[bytes]:
+    for start in range(0, count, PAGE_SIZE):
+        agents = [
+            {
+                "agent_id": f"agt_{i:012d}",
+                "name": f"Support Agent {i}",
+                "owner_email": f"owner{i % 500}@example.com",
+                "permissions": PERMISSIONS[: 1 + i % len(PERMISSIONS)],
+                "status": "active" if i % 10 else "revoked",
+                "tier": ("free", "pro", "enterprise")[i % 3],
+                "created_at": "2026-01-01T00:00:00.000Z",
+                "updated_at": "2026-02-01T00:00:00.000Z",
+            }
+            for i in range(start, min(start + PAGE_SIZE, count))
+        ]
+        yield json.dumps({"agents": agents}).encode()
+
+
+def drift_pages(count: int) -> Iterator[bytes]:
+    for start in range(0, count, PAGE_SIZE):
+        history = [
+            {
+                "id": str(i),
+                "agent_id": "agt_000000000001",
+                "drift_score": round((i % 100) / 400, 4),
+                "created_at": "2026-02-01T00:00:00.000Z",
+                "metrics": {name: (i * 7 + n) % 97 / 97 for n, name in enumerate(METRICS)},
+                "request_count": 100 + i % 50,
+                "period_start": "2026-02-01T00:00:00.000Z",
+                "period_end": "2026-02-01T00:05:00.000Z",
+            }
+            for i in range(start, min(start + PAGE_SIZE, count))
+        ]
+        page = {"history": history, "total": count, "limit": PAGE_SIZE, "offset": start}
+        yield json.dumps(page).encode()
+
+
+def persona_pages(count: int) -> Iterator[bytes]:
+    for start in range(0, count, PAGE_SIZE):
+        history = [
+            {
+                "id": str(i),
+                "agent_id": "agt_000000000001",
+                "persona": {
+                    "version": f"1.{i // 100}.{i % 100}",
+                    "personality": {
+                        "traits": {"formality": 0.7, "empathy": 0.9, "verbosity": (i % 10) / 10},
+                        "tone": "friendly",
+                        "style_notes": "Keep answers short and cite ticket numbers. " * 20,
+                    },
+                    "constraints": {
+                        "forbidden_topics": ["pricing", "legal", "medical", f"topic-{i}"],
+                        "max_response_length": 500 + i % 100,
+                    },
+                    "guardrails": {"toxicity_threshold": 0.3, "hallucination_tolerance": "low"},
+                },
+                "persona_hash": f"{i:064x}",
+                "persona_version": f"1.{i // 100}.{i % 100}",
+                "changed_at": "2026-02-01T00:00:00.000Z",
+            }
+            for i in range(start, min(start + PAGE_SIZE, count))
+        ]
+        page = {"history": history, "total": count, "limit": PAGE_SIZE, "offset": start}
+        yield json.dumps(page).encode()
+
+
+def retained(pages: Iterator[bytes], build: Callable[[Dict[str, Any]], List[Any]]) -> int:
+    """Bytes still allocated after building records from every page"""
+    pages = list(pages)
+    gc.collect()
+    tracemalloc.start()
+    records: List[Any] = []
+    for page in pages:
+        records.extend(build(json.loads(page)))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def report(label: str, count: int, legacy: int, compact: int) -> None:
+    print(
+        f"{label:16} {legacy / 2**20:9.1f} MiB {compact / 2**20:9.1f} MiB"
+        f" {legacy / count:8.0f} B {compact / count:8.0f} B {legacy / compact:6.1f}x"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    personas = max(1, count // 10)
+    print(
+        f"{'records':16} {'before':>13} {'after':>13} "
+        f"{'per rec':>10} {'per rec':>10} {'saved':>7}"
+    )
+
+    legacy = retained(agent_pages(count), lambda d: [LegacyAgent(**a) for a in d["agents"]])
+    compact = retained(agent_pages(count), lambda d: [agent_record(a) for a in d["agents"]])
+    report(f"agents x{count}", count, legacy, compact)
+
+    legacy = retained(drift_pages(count), lambda d: list(d["history"]))
+    compact = retained(drift_pages(count), lambda d: drift_history_records(d["history"]))
+    report(f"drift x{count}", count, legacy, compact)
+
+    legacy = retained(persona_pages(personas), lambda d: list(d["history"]))
+    compact = retained(persona_pages(personas), lambda d: persona_history_records(d["history"]))
+    report(f"persona x{personas}", personas, legacy, compact)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,48 @@
 """
 FastAPI integration example for AgentAuth SDK
+
+Incoming agent tokens are verified locally by AgentAuthMiddleware, so
+authenticated routes make no call to the AgentAuth API; the service talks to
+the API with its own admin token.
 """
 
-from fastapi import FastAPI, Depends, HTTPException, Header
-from agentauth_sdk import AgentAuthClient, Permissions, Permission
-from typing import List, Optional
+import os
+from typing import List
+
+from fastapi import FastAPI, Depends
+from agentauth_sdk import (
+    AgentAuthClient,
+    AgentDirectory,
+    AuthenticatedAgent,
+    Permission,
+    Permissions,
+    TokenVerifier,
+)
+from agentauth_sdk.integrations.fastapi import (
+    AgentAuthMiddleware,
+    current_agent,
+    require_permissions,
+)
 
 app = FastAPI(title="AgentAuth FastAPI Example")
 
-# Initialize client
-auth_client = AgentAuthClient(base_url="https://auth.yourcompany.com")
+# Initialize client (service credentials, not the caller's)
+auth_client = AgentAuthClient(
+    base_url="https://auth.yourcompany.com",
+    access_token=os.environ.get("AGENTAUTH_ADMIN_TOKEN"),
+)
 
+# Local replica of the agent registry for permission and status checks
+directory = AgentDirectory(auth_client)
+verifier = TokenVerifier(os.environ["AGENTAUTH_JWT_SECRET"], directory=directory)
+app.add_middleware(AgentAuthMiddleware, verifier=verifier, exclude_paths=["/health"])
 
-# Dependency to verify JWT token
-async def verify_token(authorization: Optional[str] = Header(None)):
-    """Verify JWT token from Authorization header"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="No token provided")
 
-    token = authorization.split(" ")[1]
-    auth_client.set_access_token(token)
-    return token
+@app.on_event("startup")
+async def startup():
+    """Load the agent directory and keep it current"""
+    await directory.load()
+    directory.start(interval=30.0)
 
 
 @app.post("/agents/register")
@@ -45,10 +67,12 @@ async def register_agent(
 @app.post("/agents/verify")
 async def verify_agent(agent_id: str, api_key: str):
     """Verify agent credentials"""
-    result = await auth_client.verify_agent(
-        agent_id=agent_id,
-        api_key=api_key,
-    )
+    # verify_agent stores the new token on the client; keep it off the shared one
+    async with AgentAuthClient(base_url=auth_client.base_url) as client:
+        result = await client.verify_agent(
+            agent_id=agent_id,
+            api_key=api_key,
+        )
     return {
         "access_token": result.token.access_token,
         "refresh_token": result.token.refresh_token,
@@ -56,10 +80,24 @@ async def verify_agent(agent_id: str, api_key: str):
     }
 
 
+@app.get("/me")
+async def me(agent: AuthenticatedAgent = Depends(current_agent)):
+    """Identify the calling agent (authenticated)"""
+    return {"agent_id": agent.agent_id, "tier": agent.tier}
+
+
+@app.get("/tickets")
+async def list_tickets(
+    agent: AuthenticatedAgent = Depends(require_permissions(Permissions.Zendesk.Tickets.Read)),
+):
+    """List tickets (requires zendesk:tickets:read)"""
+    return {"agent_id": agent.agent_id, "tickets": []}
+
+
 @app.get("/agents/{agent_id}")
-async def get_agent(agent_id: str, _token: str = Depends(verify_token)):
+async def get_agent(agent_id: str, _agent: AuthenticatedAgent = Depends(current_agent)):
     """Get agent details (authenticated)"""
-    agent = await auth_client.get_agent(agent_id)
+    agent = directory.get(agent_id) or await auth_client.get_agent(agent_id)
     return agent
 
 
@@ -68,7 +106,7 @@ async def get_activity(
     agent_id: str,
     limit: int = 50,
     offset: int = 0,
-    _token: str = Depends(verify_token),
+    _agent: AuthenticatedAgent = Depends(current_agent),
 ):
     """Get agent activity logs"""
     result = await auth_client.get_activity(
@@ -82,6 +120,7 @@ async def get_activity(
 @app.on_event("shutdown")
 async def shutdown():
     """Clean up on shutdown"""
+    await directory.stop()
     await auth_client.close()
 
 
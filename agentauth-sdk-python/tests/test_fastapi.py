@@ -0,0 +1,113 @@
+"""Tests for the FastAPI authentication middleware and dependencies"""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import Depends, FastAPI
+from test_tokens import SECRET, FakeAgents, agent, make_token
+
+from agentauth_sdk.integrations.fastapi import (
+    AgentAuthMiddleware,
+    optional_agent,
+    require_permissions,
+)
+from agentauth_sdk.tokens import AuthenticatedAgent, TokenVerifier
+
+
+def build_app(verifier: TokenVerifier) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/tickets")
+    async def tickets(
+        caller: AuthenticatedAgent = Depends(require_permissions("zendesk:tickets:read")),
+    ) -> Dict[str, str]:
+        return {"agent_id": caller.agent_id}
+
+    @app.get("/public")
+    async def public(
+        caller: Optional[AuthenticatedAgent] = Depends(optional_agent),
+    ) -> Dict[str, Optional[str]]:
+        return {"agent_id": caller.agent_id if caller else None}
+
+    app.add_middleware(AgentAuthMiddleware, verifier=verifier)
+    return app
+
+
+async def call(app: FastAPI, path: str, token: Optional[bytes] = None) -> int:
+    """Run one GET request through the ASGI app and return its status"""
+    headers: List[Any] = [] if token is None else [(b"authorization", b"Bearer " + token)]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 8000),
+    }
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def app_for(permissions: List[str]) -> FastAPI:
+    client = FakeAgents(agent(permissions))
+    return build_app(TokenVerifier(SECRET, client=client))  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_valid_token_with_wildcard_grant_is_allowed() -> None:
+    app = app_for(["zendesk:*:*"])
+
+    assert await call(app, "/tickets", make_token().encode()) == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "token",
+    [
+        None,
+        make_token("other-secret").encode(),
+        make_token(exp=0).encode(),
+        make_token(type="refresh").encode(),
+        "eyJhbGciOiJIUzI1NiJ9.é.AAAA".encode(),
+        b"not-a-token",
+    ],
+)
+async def test_missing_or_invalid_tokens_get_401(token: Optional[bytes]) -> None:
+    app = app_for(["*:*:*"])
+
+    assert await call(app, "/tickets", token) == 401
+
+
+@pytest.mark.asyncio
+async def test_missing_permission_gets_403() -> None:
+    app = app_for(["zendesk:users:read", "slack:*:*"])
+
+    assert await call(app, "/tickets", make_token().encode()) == 403
+
+
+@pytest.mark.asyncio
+async def test_optional_agent_allows_anonymous_but_not_invalid_tokens() -> None:
+    app = app_for([])
+
+    assert await call(app, "/public") == 200
+    assert await call(app, "/public", make_token().encode()) == 200
+    assert await call(app, "/public", "é.e30.AAAA".encode()) == 401
@@ -0,0 +1,51 @@
+"""Tests for permission bitsets"""
+
+from typing import List
+
+import pytest
+
+from agentauth_sdk.permission_bits import PermissionMatrix, PermissionRegistry
+from agentauth_sdk.types import Agent
+
+
+def agent(agent_id: str, permissions: List[str]) -> Agent:
+    return Agent(
+        agent_id=agent_id,
+        name=agent_id,
+        owner_email=f"{agent_id}@example.com",
+        permissions=permissions,  # type: ignore[arg-type]
+        status="active",
+        tier="pro",
+        created_at="2026-01-01T00:00:00Z",
+        updated_at="2026-01-01T00:00:00Z",
+    )
+
+
+def test_wildcard_covers_permissions_registered_later() -> None:
+    registry = PermissionRegistry()
+    mask = registry.encode(["slack:*:*"])
+
+    assert registry.has(mask, "slack:files:delete")
+    registry.register("slack:files:delete")
+    assert registry.has(mask, "slack:messages:write")
+    assert not registry.has(mask, "zendesk:tickets:read")
+
+
+def test_matrix_covers_permissions_registered_after_it_was_built() -> None:
+    pytest.importorskip("numpy")
+    registry = PermissionRegistry()
+    matrix = PermissionMatrix.from_agents(
+        registry,
+        [agent("agt_1", ["slack:*:*"]), agent("agt_2", ["zendesk:tickets:read"])],
+    )
+    assert matrix.agents_with("slack:files:delete") == ["agt_1"]
+
+    # e.g. TokenVerifier.required_mask registers what routes require
+    for i in range(100):
+        registry.register(f"custom:scope:{i}")
+    registry.register("slack:files:delete")
+
+    assert matrix.agents_with("slack:files:delete") == ["agt_1"]
+    assert matrix.agents_with("zendesk:tickets:read") == ["agt_2"]
+    assert matrix.agents_with("custom:scope:7") == []
+    assert matrix.count("slack:messages:write") == 1
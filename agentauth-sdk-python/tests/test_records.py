@@ -0,0 +1,36 @@
+"""Tests for compact record construction"""
+
+import dataclasses
+from typing import Any, Dict
+
+from agentauth_sdk.records import persona_history_records
+
+PERSONA: Dict[str, Any] = {"version": "1.0.0", "personality": {"tone": "friendly"}}
+
+
+def entry(i: int, persona_hash: str = "abc") -> Dict[str, Any]:
+    return {
+        "id": str(i),
+        "agent_id": "agt_1",
+        "persona": {**PERSONA, "personality": dict(PERSONA["personality"])},
+        "persona_hash": persona_hash,
+        "persona_version": "1.0.0",
+        "changed_at": "2026-01-01T00:00:00.000Z",
+    }
+
+
+def test_persona_history_entries_keep_the_decoded_persona() -> None:
+    history = [entry(0), entry(1)]
+    records = persona_history_records(history)
+
+    assert records[0].persona is history[0]["persona"]
+    assert dataclasses.asdict(records[0]) == history[0]
+
+
+def test_persona_mutations_persist_and_stay_per_entry() -> None:
+    first, second = persona_history_records([entry(0), entry(1)])
+
+    first.persona["personality"]["tone"] = "formal"
+
+    assert first.persona["personality"]["tone"] == "formal"
+    assert second.persona["personality"]["tone"] == "friendly"
@@ -0,0 +1,78 @@
+"""Tests for canonical JSON and ping signing
+
+Expected values were produced by the server's ``JSON.stringify(canonicalize(x))``
+and ``verifyPingSignature`` HMAC.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from agentauth_sdk.signing import PingSigner, canonical_json, sign_persona
+
+API_KEY = "sk_test"
+PING: Dict[str, Any] = {"metrics": {"toxicity_score": 0.12}, "request_count": 150}
+PING_SIGNATURE = "0b9af8f74dad6b947c3d59ce3141b9a5e857a59182b0be9aca84024f955e6bcc"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            {"b": 1, "a": [1.0, 0.1, 1e21, 1e-7, -0.0], "10": "x", "2": None, "é": "ü", "Z": True},
+            '{"2":null,"10":"x","Z":true,"a":[1,0.1,1e+21,1e-7,0],"b":1,"é":"ü"}',
+        ),
+        (
+            {"metrics": {"error_rate": 0.123456789012345, "latency": 250}, "request_count": 150},
+            '{"metrics":{"error_rate":0.123456789,"latency":250},"request_count":150}',
+        ),
+        (
+            {
+                "s": 'quote" back\\ nl\n tab\t  ',
+                "n": 123456789.987654321,
+                "big": 2**53,
+                "tiny": 5e-11,
+            },
+            '{"big":9007199254740992,"n":123456789.98765433,'
+            '"s":"quote\\" back\\\\ nl\\n tab\\t  ","tiny":1e-10}',
+        ),
+    ],
+)
+def test_canonical_json_matches_server(value: object, expected: str) -> None:
+    assert canonical_json(value) == expected
+
+
+def test_canonical_json_non_finite_numbers_become_null() -> None:
+    assert canonical_json([float("nan"), float("inf")]) == "[null,null]"
+
+
+def test_canonical_json_rejects_unserializable_values() -> None:
+    with pytest.raises(TypeError):
+        canonical_json({"when": object()})
+
+
+def test_sign_matches_server_and_ignores_signature_key() -> None:
+    signer = PingSigner(API_KEY)
+
+    assert signer.sign(PING) == PING_SIGNATURE
+    assert signer.sign({**PING, "signature": "ignored"}) == PING_SIGNATURE
+    assert sign_persona(PING, API_KEY) == PING_SIGNATURE
+
+
+def test_sign_many_matches_sign() -> None:
+    signer = PingSigner(API_KEY)
+    pings: List[Dict[str, Any]] = [
+        PING,
+        {"metrics": {"error_rate": 0.5}},
+        {**PING, "signature": "x"},
+    ]
+
+    assert signer.sign_many(pings) == [signer.sign(ping) for ping in pings]
+
+
+def test_verify() -> None:
+    signer = PingSigner(API_KEY)
+
+    assert signer.verify(PING, PING_SIGNATURE)
+    assert not signer.verify({**PING, "request_count": 151}, PING_SIGNATURE)
+    assert not PingSigner("sk_other").verify(PING, PING_SIGNATURE)
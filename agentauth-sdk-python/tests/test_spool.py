@@ -0,0 +1,104 @@
+"""Tests for the health ping spool"""
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import pytest
+
+from agentauth_sdk.spool import PingSpool
+
+
+class FakeClient:
+    """Records posted pings; fails the ``fail_on``-th post with a connection error"""
+
+    def __init__(self, fail_on: int = 0):
+        self.fail_on = fail_on
+        self.calls = 0
+        self.posted: List[Tuple[str, int]] = []
+
+    async def post_health_ping(self, agent_id: str, body: Dict[str, Any]) -> None:
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise httpx.ConnectError("connection refused")
+        self.posted.append((agent_id, body["seq"]))
+
+
+class SpoolingClient(FakeClient):
+    """Spools new pings while the first post is in flight, as the client does"""
+
+    def __init__(self, spool: PingSpool, fail_on: int = 0):
+        super().__init__(fail_on)
+        self.spool = spool
+        self.spooled = False
+
+    async def post_health_ping(self, agent_id: str, body: Dict[str, Any]) -> None:
+        first, self.spooled = not self.spooled, True
+        await asyncio.sleep(0)
+        if first:
+            fill(self.spool, pings=30, agents=1, start=1000)
+        await super().post_health_ping(agent_id, body)
+
+
+def fill(spool: PingSpool, pings: int = 12, agents: int = 3, start: int = 0) -> None:
+    for seq in range(start, start + pings):
+        spool.append(f"agt_{seq % agents}", {"metrics": {"error_rate": 0.1}, "seq": seq})
+
+
+@pytest.mark.asyncio
+async def test_replay_delivers_every_ping_in_order(tmp_path: Any) -> None:
+    spool = PingSpool(str(tmp_path))
+    fill(spool)
+    client = FakeClient()
+
+    assert await spool.replay(client) == 12  # type: ignore[arg-type]
+
+    assert len(spool) == 0
+    assert sorted(seq for _, seq in client.posted) == list(range(12))
+    for agent in ("agt_0", "agt_1", "agt_2"):
+        sent = [seq for agent_id, seq in client.posted if agent_id == agent]
+        assert sent == sorted(sent)
+    spool.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_after_partial_failure(tmp_path: Any) -> None:
+    spool = PingSpool(str(tmp_path))
+    fill(spool)
+
+    # agt_0 sends all four pings before agt_1's second ping (the 6th post) fails,
+    # so agt_0 gets ahead of the acknowledged prefix
+    first = FakeClient(fail_on=6)
+    assert await spool.replay(first) == 5  # type: ignore[arg-type]
+    assert len(spool) == 7
+
+    second = FakeClient()
+    assert await spool.replay(second) == 7  # type: ignore[arg-type]
+    assert len(spool) == 0
+    assert sorted(first.posted + second.posted) == sorted(
+        (f"agt_{seq % 3}", seq) for seq in range(12)
+    )
+    spool.close()
+
+    reopened = PingSpool(str(tmp_path))
+    assert len(reopened) == 0
+    assert reopened.pending() == []
+    reopened.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fail_on", [0, 20])
+async def test_replay_while_appends_drop_the_replayed_segment(tmp_path: Any, fail_on: int) -> None:
+    # Three 1 KiB segments under a 3 KB cap: the appends drop the oldest ones
+    spool = PingSpool(str(tmp_path), max_segment_bytes=1024, max_bytes=3072, fsync=False)
+    fill(spool, pings=30)
+    client = SpoolingClient(spool, fail_on=fail_on)
+
+    await spool.replay(client)  # type: ignore[arg-type]
+
+    assert spool.dropped > 0
+    assert len(spool) == len(spool.pending())
+    await spool.replay(FakeClient())  # type: ignore[arg-type]
+    assert len(spool) == 0
+    assert spool.pending() == []
+    spool.close()
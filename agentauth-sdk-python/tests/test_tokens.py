@@ -0,0 +1,161 @@
+"""Tests for local access token verification"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from agentauth_sdk.tokens import TokenVerifier
+from agentauth_sdk.types import Agent, TokenVerificationError
+
+SECRET = "test-secret"
+
+
+def encode(obj: Dict[str, Any]) -> str:
+    raw = json.dumps(obj, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def make_token(secret: str = SECRET, header: Any = None, **claims: Any) -> str:
+    """Sign a token the way the AgentAuth API does (HS256)"""
+    now = int(time.time())
+    payload = {"agent_id": "agt_1", "tier": "pro", "iat": now, "exp": now + 3600, **claims}
+    signing_input = encode(header or {"alg": "HS256", "typ": "JWT"}) + "." + encode(payload)
+    signature = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return signing_input + "." + base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
+
+
+def agent(permissions: List[str], status: str = "active") -> Agent:
+    return Agent(
+        agent_id="agt_1",
+        name="agt_1",
+        owner_email="agt_1@example.com",
+        permissions=permissions,  # type: ignore[arg-type]
+        status=status,  # type: ignore[arg-type]
+        tier="pro",
+        created_at="2026-01-01T00:00:00Z",
+        updated_at="2026-01-01T00:00:00Z",
+    )
+
+
+class FakeAgents:
+    """Client serving one agent from ``get_agent``"""
+
+    def __init__(self, agent: Agent):
+        self.agent = agent
+        self.calls = 0
+
+    async def get_agent(self, agent_id: str) -> Agent:
+        self.calls += 1
+        if agent_id != self.agent.agent_id:
+            raise LookupError(agent_id)
+        return self.agent
+
+
+def reason(verifier: TokenVerifier, token: str) -> str:
+    with pytest.raises(TokenVerificationError) as info:
+        verifier.verify(token)
+    assert info.value.status_code == 401
+    return info.value.reason
+
+
+def test_verify_returns_claims_and_caches_them() -> None:
+    verifier = TokenVerifier(SECRET)
+    token = make_token()
+
+    claims = verifier.verify(token)
+    assert claims["agent_id"] == "agt_1"
+    assert verifier.verify(token) is claims
+
+
+def test_forged_and_tampered_tokens_are_rejected() -> None:
+    verifier = TokenVerifier(SECRET)
+    header, _payload, signature = make_token().split(".")
+    forged_payload = encode({"agent_id": "agt_admin", "exp": time.time() + 3600})
+
+    assert reason(verifier, make_token("other-secret")) == "signature"
+    assert reason(verifier, f"{header}.{forged_payload}.{signature}") == "signature"
+    assert reason(verifier, make_token(header={"alg": "none"})) == "algorithm"
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["", "abc", "a.b", "a.b.c.d", "!!!.e30.AAAA", "eyJhbGciOiJIUzI1NiJ9.é.AAAA", "é.e30.AAAA"],
+)
+def test_malformed_tokens_are_rejected(token: str) -> None:
+    assert reason(TokenVerifier(SECRET), token) == "malformed"
+
+
+def test_claims_without_expiry_or_agent_are_rejected() -> None:
+    verifier = TokenVerifier(SECRET)
+
+    assert reason(verifier, make_token(exp=None)) == "malformed"
+    assert reason(verifier, make_token(agent_id="")) == "malformed"
+
+
+def test_refresh_tokens_are_rejected() -> None:
+    assert reason(TokenVerifier(SECRET), make_token(type="refresh")) == "refresh_token"
+
+
+def test_expiry_and_leeway() -> None:
+    expired = make_token(exp=int(time.time()) - 10)
+
+    assert reason(TokenVerifier(SECRET), expired) == "expired"
+    assert TokenVerifier(SECRET, leeway=60).verify(expired)["agent_id"] == "agt_1"
+
+
+def test_cached_claims_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    verifier = TokenVerifier(SECRET)
+    token = make_token(exp=int(time.time()) + 5)
+    verifier.verify(token)
+
+    monkeypatch.setattr(time, "time", lambda: 1e12)
+    assert reason(verifier, token) == "expired"
+
+
+def test_not_before() -> None:
+    early = make_token(nbf=int(time.time()) + 30)
+
+    assert reason(TokenVerifier(SECRET), early) == "not_before"
+    assert TokenVerifier(SECRET, leeway=60).verify(early)["agent_id"] == "agt_1"
+
+
+@pytest.mark.asyncio
+async def test_wildcard_grants_satisfy_required_masks() -> None:
+    verifier = TokenVerifier(SECRET, client=FakeAgents(agent(["zendesk:*:*"])))  # type: ignore[arg-type]
+    caller = await verifier.authenticate(make_token())
+
+    assert caller.has_all(verifier.required_mask(["zendesk:tickets:read"]))
+    assert caller.has_all(verifier.required_mask(["zendesk:tickets:read", "zendesk:users:write"]))
+    assert not caller.has_all(verifier.required_mask(["slack:messages:write"]))
+    assert not caller.has_all(
+        verifier.required_mask(["zendesk:tickets:read", "slack:messages:write"])
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_wildcard_covers_custom_permissions() -> None:
+    verifier = TokenVerifier(SECRET, client=FakeAgents(agent(["*:*:*"])))  # type: ignore[arg-type]
+    caller = await verifier.authenticate(make_token())
+    required = verifier.required_mask(["custom:reports:export"])
+
+    assert verifier.mask_for(caller.agent) & required == required  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rejects_inactive_and_unknown_agents() -> None:
+    suspended = TokenVerifier(
+        SECRET, client=FakeAgents(agent(["*:*:*"], status="suspended"))  # type: ignore[arg-type]
+    )
+    with pytest.raises(TokenVerificationError) as info:
+        await suspended.authenticate(make_token())
+    assert info.value.reason == "inactive"
+
+    unknown = TokenVerifier(SECRET, client=FakeAgents(agent([])))  # type: ignore[arg-type]
+    with pytest.raises(TokenVerificationError) as info:
+        await unknown.authenticate(make_token(agent_id="agt_2"))
+    assert info.value.reason == "unknown_agent"
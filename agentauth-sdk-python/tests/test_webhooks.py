@@ -0,0 +1,186 @@
+"""Tests for webhook verification and receiving"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agentauth_sdk.types import WebhookDeliveriesResponse, WebhookDelivery, WebhookEvent
+from agentauth_sdk.webhooks import WebhookDeliverySync, WebhookReceiver, WebhookVerifier
+
+SECRET = "whsec_test"
+BODY = json.dumps(
+    {
+        "event": "agent.updated",
+        "agent_id": "agt_1",
+        "data": {"status": "suspended"},
+        "timestamp": "2026-01-01T00:00:00.000Z",
+    }
+).encode()
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+async def call(
+    app: WebhookReceiver, body: bytes, signature: Optional[str], method: str = "POST"
+) -> Dict[str, Any]:
+    """Run one HTTP request through the ASGI app"""
+    headers = [] if signature is None else [(b"x-agentauth-signature", signature.encode())]
+    scope = {"type": "http", "method": method, "headers": headers}
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return {"status": sent[0]["status"], "body": json.loads(sent[1]["body"])}
+
+
+def test_verifier_accepts_server_signatures() -> None:
+    verifier = WebhookVerifier(SECRET)
+
+    assert verifier.sign(BODY) == sign(BODY)
+    assert verifier.verify(BODY, sign(BODY))
+    assert verifier.verify(BODY, "sha256=" + sign(BODY))
+    assert verifier.verify(BODY, sign(BODY).upper())
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [None, "", "0" * 64, "not-hex", "é" * 64, sign(BODY + b" "), sign(BODY, "whsec_other")],
+)
+def test_verifier_rejects_bad_signatures(signature: Optional[str]) -> None:
+    assert not WebhookVerifier(SECRET).verify(BODY, signature)
+
+
+def test_verifier_accepts_any_secret_during_rotation() -> None:
+    verifier = WebhookVerifier(["whsec_new", SECRET])
+
+    assert verifier.verify(BODY, sign(BODY))
+    assert verifier.verify(BODY, sign(BODY, "whsec_new"))
+    assert verifier.sign(BODY) == sign(BODY, "whsec_new")
+
+
+def test_verifier_requires_a_secret() -> None:
+    with pytest.raises(ValueError):
+        WebhookVerifier([])
+
+
+@pytest.mark.asyncio
+async def test_ingest_queues_once_and_deduplicates() -> None:
+    receiver = WebhookReceiver(SECRET)
+
+    assert receiver.ingest(BODY, sign(BODY)) == 202
+    assert receiver.ingest(BODY, "sha256=" + sign(BODY).upper()) == 200
+    assert receiver.queue.qsize() == 1
+
+    event = receiver.queue.get_nowait()
+    assert event.event == "agent.updated"
+    assert event.agent_id == "agt_1"
+    assert event.data == {"status": "suspended"}
+
+
+@pytest.mark.asyncio
+async def test_ingest_rejects_unsigned_forged_and_malformed_bodies() -> None:
+    receiver = WebhookReceiver(SECRET)
+    malformed = b'{"agent_id": "agt_1"}'
+
+    assert receiver.ingest(BODY, None) == 401
+    assert receiver.ingest(BODY, sign(BODY, "whsec_other")) == 401
+    assert receiver.ingest(malformed, sign(malformed)) == 400
+    assert receiver.ingest(b"not json", sign(b"not json")) == 400
+    assert receiver.queue.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_refuses_when_full_and_accepts_the_retry() -> None:
+    receiver = WebhookReceiver(SECRET, max_queue=1)
+    other = BODY.replace(b"suspended", b"active")
+
+    assert receiver.ingest(BODY, sign(BODY)) == 202
+    assert receiver.ingest(other, sign(other)) == 503
+    receiver.queue.get_nowait()
+    # A refused delivery isn't remembered, so the server's retry goes through
+    assert receiver.ingest(other, sign(other)) == 202
+
+
+@pytest.mark.asyncio
+async def test_asgi_app_dispatches_to_handlers() -> None:
+    receiver = WebhookReceiver(SECRET)
+    handled: List[WebhookEvent] = []
+
+    @receiver.on("agent.updated")
+    async def on_updated(event: WebhookEvent) -> None:
+        handled.append(event)
+
+    await receiver.start()
+    assert await call(receiver, BODY, sign(BODY)) == {
+        "status": 202,
+        "body": {"received": True, "duplicate": False},
+    }
+    assert (await call(receiver, BODY, sign(BODY)))["status"] == 200
+    assert (await call(receiver, BODY, None))["status"] == 401
+    assert (await call(receiver, BODY, sign(BODY), method="GET"))["status"] == 405
+    await receiver.stop()
+
+    assert [event.agent_id for event in handled] == ["agt_1"]
+
+
+@pytest.mark.asyncio
+async def test_asgi_app_rejects_oversized_bodies() -> None:
+    receiver = WebhookReceiver(SECRET, max_body_size=16)
+
+    assert (await call(receiver, BODY, sign(BODY)))["status"] == 413
+
+
+class FakeDeliveryLog:
+    """Serves ``total`` deliveries in pages, counting page requests"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.fetched = 0
+
+    async def get_webhook_deliveries(
+        self, webhook_id: str, limit: int, offset: int, since: Optional[str], order: str
+    ) -> WebhookDeliveriesResponse:
+        await asyncio.sleep(0)
+        self.fetched += 1
+        deliveries = [
+            WebhookDelivery(
+                id=str(i),
+                webhook_id=webhook_id,
+                event_type="agent.updated",
+                delivered_at=f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}.000Z",
+                response_status=500 if i == 7 else 200,
+            )
+            for i in range(offset, min(offset + limit, self.total))
+        ]
+        return WebhookDeliveriesResponse(deliveries=deliveries, total=self.total, offset=offset)
+
+
+@pytest.mark.asyncio
+async def test_delivery_sync_prefetches_a_bounded_window() -> None:
+    log = FakeDeliveryLog(total=1000)
+    sync = WebhookDeliverySync(log, "wh_1", page_size=10, prefetch=3)  # type: ignore[arg-type]
+
+    consumed = 0
+    async for delivery in sync.deliveries():
+        consumed += 1
+        if consumed % 10 == 0:
+            await asyncio.sleep(0.001)  # slow consumer
+        # First page, the pages consumed, and at most ``prefetch`` ahead
+        assert log.fetched <= (consumed + 9) // 10 + 1 + 3
+
+    assert consumed == 1000
+    assert log.fetched == 100
+    assert list(sync.failed) == ["7"]
+    assert sync.watermark == "2026-01-01T00:16:39Z"
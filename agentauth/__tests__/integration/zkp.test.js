@@ -16,6 +16,7 @@ jest.mock('@supabase/supabase-js', () => ({
         select: () => ({
           eq: () => ({
             single: () => Promise.resolve({ data: tableData.selectSingle || null, error: tableData.selectSingleError || null }),
+            in: () => Promise.resolve({ data: tableData.selectIn || [], error: tableData.selectInError || null }),
             eq: () => ({
               single: () => Promise.resolve({ data: tableData.selectSingle || null, error: tableData.selectSingleError || null }),
             }),
@@ -469,6 +470,121 @@ describe('ZKP API Integration Tests', () => {
     });
   });
 
+  // ─── Batch Anonymous Verification ────────────────────────────────────────
+
+  describe('POST /v1/zkp/verify-anonymous/batch', () => {
+    it('should verify mixed hash and zkp items with per-item results', async () => {
+      const hashCommitment = generateTestCommitment(TEST_AGENT_ID, VALID_API_KEY).commitment;
+      const zkpCommitment = generateTestCommitment(TEST_AGENT_ID, VALID_API_KEY).commitment;
+
+      mockSupabaseData.zkp_commitments = {
+        selectIn: [
+          { commitment: hashCommitment, status: 'active', permissions: ['read'], tier: 'pro', expires_at: null },
+          { commitment: zkpCommitment, status: 'active', permissions: ['write'], tier: 'pro', expires_at: null },
+        ],
+      };
+
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch')
+        .send({
+          items: [
+            { commitment: hashCommitment, mode: 'hash', preimage_hash: hashCommitment },
+            {
+              commitment: zkpCommitment,
+              mode: 'zkp',
+              proof: { pi_a: ['1', '2', '1'], pi_b: [['1', '2'], ['3', '4']], pi_c: ['1', '2', '1'], protocol: 'groth16' },
+              publicSignals: [zkpCommitment],
+            },
+            { commitment: hashCommitment, mode: 'hash', preimage_hash: 'b'.repeat(64) },
+          ],
+        });
+
+      expect(res.status).toBe(200);
+      expect(res.headers['cache-control']).toBe('no-store');
+      expect(res.body.total).toBe(3);
+      expect(res.body.valid_count).toBe(2);
+      expect(res.body.results[0]).toMatchObject({ commitment: hashCommitment, valid: true });
+      expect(res.body.results[1]).toMatchObject({ commitment: zkpCommitment, valid: true });
+      expect(res.body.results[2].valid).toBe(false);
+      expect(res.body.results[2].reason).toContain('Hash mismatch');
+    });
+
+    it('should apply the default mode to items without one', async () => {
+      const { commitment } = generateTestCommitment(TEST_AGENT_ID, VALID_API_KEY);
+
+      mockSupabaseData.zkp_commitments = {
+        selectIn: [{ commitment, status: 'active', permissions: [], tier: 'free', expires_at: null }],
+      };
+
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch?mode=hash')
+        .send({ items: [{ commitment, preimage_hash: commitment }] });
+
+      expect(res.status).toBe(200);
+      expect(res.body.results[0].valid).toBe(true);
+    });
+
+    it('should report unknown commitments without failing the batch', async () => {
+      mockSupabaseData.zkp_commitments = { selectIn: [] };
+
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch')
+        .send({ items: [{ commitment: 'f'.repeat(64), mode: 'hash', preimage_hash: 'f'.repeat(64) }] });
+
+      expect(res.status).toBe(200);
+      expect(res.body.valid_count).toBe(0);
+      expect(res.body.results[0].reason).toContain('not found or revoked');
+    });
+
+    it('should reject an empty batch', async () => {
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch')
+        .send({ items: [] });
+
+      expect(res.status).toBe(400);
+    });
+
+    it('should reject more than 100 items', async () => {
+      const item = { commitment: 'a'.repeat(64), mode: 'hash', preimage_hash: 'a'.repeat(64) };
+
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch')
+        .send({ items: Array(101).fill(item) });
+
+      expect(res.status).toBe(400);
+    });
+
+    it('should reject more than 10 ZKP-mode items', async () => {
+      const commitment = 'a'.repeat(64);
+      const item = {
+        commitment,
+        proof: { pi_a: ['1', '2', '1'], pi_b: [['1', '2'], ['3', '4']], pi_c: ['1', '2', '1'], protocol: 'groth16' },
+        publicSignals: [commitment],
+      };
+
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch')
+        .send({ items: Array(11).fill(item) });
+
+      expect(res.status).toBe(400);
+      expect(JSON.stringify(res.body)).toContain('10 ZKP-mode verifications');
+    });
+
+    it('should report the index of an invalid item', async () => {
+      const res = await request(app)
+        .post('/v1/zkp/verify-anonymous/batch')
+        .send({
+          items: [
+            { commitment: 'a'.repeat(64), mode: 'hash', preimage_hash: 'a'.repeat(64) },
+            { commitment: 'abc123', mode: 'hash', preimage_hash: 'abc123' },
+          ],
+        });
+
+      expect(res.status).toBe(400);
+      expect(JSON.stringify(res.body)).toContain('items[1].commitment');
+    });
+  });
+
   // ─── Commitment Revocation ───────────────────────────────────────────────
 
   describe('DELETE /v1/zkp/commitment/:commitment', () => {
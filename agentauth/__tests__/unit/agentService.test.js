@@ -0,0 +1,91 @@
+// ─────────────────────────────────────────────────────────────────────────────
+// Supabase mock — records the query chain so filters can be asserted
+// ─────────────────────────────────────────────────────────────────────────────
+
+let mockQueryLog = [];
+let mockAgents = [];
+
+jest.mock('@supabase/supabase-js', () => ({
+  createClient: () => ({
+    from: (table) => {
+      const query = {
+        select: (...args) => { mockQueryLog.push(['select', table, ...args]); return query; },
+        eq: (...args) => { mockQueryLog.push(['eq', ...args]); return query; },
+        gt: (...args) => { mockQueryLog.push(['gt', ...args]); return query; },
+        order: (...args) => { mockQueryLog.push(['order', ...args]); return query; },
+        range: (...args) => {
+          mockQueryLog.push(['range', ...args]);
+          return Promise.resolve({ data: mockAgents, error: null, count: mockAgents.length });
+        },
+      };
+      return query;
+    },
+  }),
+}));
+
+const agentService = require('../../src/services/agentService');
+const agentValidator = require('../../src/validators/agentValidator');
+
+describe('agentService.listAgents', () => {
+  beforeEach(() => {
+    mockQueryLog = [];
+    mockAgents = [
+      { agent_id: 'agt_1', status: 'active', permissions: ['zendesk:tickets:read'], updated_at: '2026-02-01T12:00:01.000Z' },
+      { agent_id: 'agt_2', status: 'active', permissions: [], updated_at: '2026-02-01T12:00:02.000Z' },
+    ];
+  });
+
+  it('returns newest agents first without a watermark', async () => {
+    const result = await agentService.listAgents({ limit: 10, offset: 0 });
+
+    expect(result.agents).toHaveLength(2);
+    expect(result.total).toBe(2);
+    expect(mockQueryLog).toContainEqual(['order', 'created_at', { ascending: false }]);
+    expect(mockQueryLog).toContainEqual(['range', 0, 9]);
+    expect(mockQueryLog.find(call => call[0] === 'gt')).toBeUndefined();
+  });
+
+  it('selects permissions and updated_at for directory replicas', async () => {
+    await agentService.listAgents({ limit: 10, offset: 0 });
+
+    const select = mockQueryLog.find(call => call[0] === 'select');
+    expect(select[1]).toBe('agents');
+    expect(select[2]).toContain('permissions');
+    expect(select[2]).toContain('updated_at');
+  });
+
+  it('filters on updated_at after the watermark, oldest change first', async () => {
+    const updatedSince = '2026-02-01T12:00:00.000Z';
+    await agentService.listAgents({ limit: 100, offset: 100, status: 'active', updated_since: updatedSince });
+
+    expect(mockQueryLog).toContainEqual(['eq', 'status', 'active']);
+    expect(mockQueryLog).toContainEqual(['gt', 'updated_at', updatedSince]);
+    expect(mockQueryLog).toContainEqual(['order', 'updated_at', { ascending: true }]);
+    expect(mockQueryLog.find(call => call[0] === 'order' && call[1] === 'created_at')).toBeUndefined();
+    expect(mockQueryLog).toContainEqual(['range', 100, 199]);
+  });
+});
+
+describe('agentValidator.validateUpdatedSince', () => {
+  it.each([
+    '2026-02-01T12:00:00.000Z',
+    '2026-02-01T12:00:00Z',
+    '2026-02-01T12:00:00+02:00',
+  ])('accepts ISO 8601 timestamp %s', (value) => {
+    expect(agentValidator.validateUpdatedSince(value).valid).toBe(true);
+  });
+
+  it.each([
+    '',
+    '1',
+    '2026',
+    'yesterday',
+    '2026-13-45T99:00:00Z',
+    ['2026-02-01T12:00:00Z'],
+  ])('rejects %p', (value) => {
+    const result = agentValidator.validateUpdatedSince(value);
+
+    expect(result.valid).toBe(false);
+    expect(result.errors[0].field).toBe('updated_since');
+  });
+});
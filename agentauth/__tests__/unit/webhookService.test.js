@@ -0,0 +1,63 @@
+// ─────────────────────────────────────────────────────────────────────────────
+// Supabase mock — records the query chain so filters can be asserted
+// ─────────────────────────────────────────────────────────────────────────────
+
+let mockQueryLog = [];
+let mockDeliveries = [];
+
+jest.mock('@supabase/supabase-js', () => ({
+  createClient: () => ({
+    from: (table) => {
+      const query = {
+        select: (...args) => { mockQueryLog.push(['select', table, ...args]); return query; },
+        eq: (...args) => { mockQueryLog.push(['eq', ...args]); return query; },
+        gt: (...args) => { mockQueryLog.push(['gt', ...args]); return query; },
+        order: (...args) => { mockQueryLog.push(['order', ...args]); return query; },
+        range: (...args) => {
+          mockQueryLog.push(['range', ...args]);
+          return Promise.resolve({ data: mockDeliveries, error: null, count: mockDeliveries.length });
+        },
+      };
+      return query;
+    },
+  }),
+}));
+
+const webhookService = require('../../src/services/webhookService');
+
+describe('webhookService.getWebhookDeliveries', () => {
+  beforeEach(() => {
+    mockQueryLog = [];
+    mockDeliveries = [
+      { id: 'd1', event_type: 'persona.updated', response_status: 200, delivered_at: '2026-02-01T12:00:01.000Z' },
+      { id: 'd2', event_type: 'agent.drift.warning', response_status: 500, delivered_at: '2026-02-01T12:00:02.000Z' },
+    ];
+  });
+
+  it('returns newest deliveries first without a watermark', async () => {
+    const result = await webhookService.getWebhookDeliveries('wh-1', { limit: 10, offset: 0 });
+
+    expect(result.deliveries).toHaveLength(2);
+    expect(result.total).toBe(2);
+    expect(result.since).toBeNull();
+    expect(mockQueryLog).toContainEqual(['eq', 'webhook_id', 'wh-1']);
+    expect(mockQueryLog).toContainEqual(['order', 'delivered_at', { ascending: false }]);
+    expect(mockQueryLog).toContainEqual(['range', 0, 9]);
+    expect(mockQueryLog.find(call => call[0] === 'gt')).toBeUndefined();
+  });
+
+  it('filters on delivered_at after the since watermark', async () => {
+    const since = '2026-02-01T12:00:00.000Z';
+    const result = await webhookService.getWebhookDeliveries('wh-1', {
+      limit: 50,
+      offset: 50,
+      since,
+      order: 'asc',
+    });
+
+    expect(result.since).toBe(since);
+    expect(mockQueryLog).toContainEqual(['gt', 'delivered_at', since]);
+    expect(mockQueryLog).toContainEqual(['order', 'delivered_at', { ascending: true }]);
+    expect(mockQueryLog).toContainEqual(['range', 50, 99]);
+  });
+});
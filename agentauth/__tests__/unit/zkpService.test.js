@@ -34,6 +34,10 @@ jest.mock('@supabase/supabase-js', () => ({
             data: mockCommitmentStore.expired || [],
             error: null,
           }),
+          in: () => Promise.resolve({
+            data: mockCommitmentStore.records || [],
+            error: mockCommitmentStore.selectError || null,
+          }),
         }),
       }),
       insert: () => ({
@@ -101,6 +105,7 @@ const {
   getVerificationKey,
   registerCommitment,
   verifyAnonymous,
+  verifyAnonymousBatch,
   revokeCommitment,
   cleanupExpiredCommitments,
 } = require('../../src/services/zkpService');
@@ -333,6 +338,75 @@ describe('verifyAnonymous() — zkp mode', () => {
   });
 });
 
+// ─────────────────────────────────────────────────────────────────────────────
+// verifyAnonymousBatch()
+// ─────────────────────────────────────────────────────────────────────────────
+
+describe('verifyAnonymousBatch()', () => {
+  const hashCommitment = 'a'.repeat(64);
+  const zkpCommitment = 'e'.repeat(64);
+
+  beforeEach(() => {
+    snarkjs.groth16 = {
+      verify: jest.fn().mockResolvedValue(true),
+    };
+
+    mockCommitmentStore.records = [
+      { commitment: hashCommitment, status: 'active', permissions: ['read'], tier: 'pro', expires_at: null },
+      { commitment: zkpCommitment, status: 'active', permissions: ['write'], tier: 'enterprise', expires_at: null },
+    ];
+    mockCommitmentStore.selectError = null;
+  });
+
+  it('should verify mixed hash and zkp items in order', async () => {
+    const results = await verifyAnonymousBatch([
+      { commitment: hashCommitment, mode: 'hash', proofData: { preimage_hash: hashCommitment } },
+      {
+        commitment: zkpCommitment,
+        mode: 'zkp',
+        proofData: { proof: { pi_a: [], pi_b: [], pi_c: [] }, publicSignals: [zkpCommitment] },
+      },
+      { commitment: hashCommitment, mode: 'hash', proofData: { preimage_hash: 'b'.repeat(64) } },
+    ]);
+
+    expect(results).toHaveLength(3);
+    expect(results[0]).toMatchObject({ commitment: hashCommitment, valid: true, tier: 'pro' });
+    expect(results[1]).toMatchObject({ commitment: zkpCommitment, valid: true, tier: 'enterprise' });
+    expect(results[2]).toMatchObject({ commitment: hashCommitment, valid: false });
+    expect(results[2].reason).toContain('Hash mismatch');
+  });
+
+  it('should reject unknown commitments per item', async () => {
+    const unknown = 'c'.repeat(64);
+
+    const results = await verifyAnonymousBatch([
+      { commitment: unknown, mode: 'hash', proofData: { preimage_hash: unknown } },
+    ]);
+
+    expect(results[0].valid).toBe(false);
+    expect(results[0].reason).toContain('not found or revoked');
+  });
+
+  it('should reject expired commitments per item', async () => {
+    mockCommitmentStore.records[0].expires_at = '2020-01-01T00:00:00Z';
+
+    const results = await verifyAnonymousBatch([
+      { commitment: hashCommitment, mode: 'hash', proofData: { preimage_hash: hashCommitment } },
+    ]);
+
+    expect(results[0].valid).toBe(false);
+    expect(results[0].reason).toContain('expired');
+  });
+
+  it('should throw when the lookup fails', async () => {
+    mockCommitmentStore.selectError = { message: 'connection refused' };
+
+    await expect(verifyAnonymousBatch([
+      { commitment: hashCommitment, mode: 'hash', proofData: { preimage_hash: hashCommitment } },
+    ])).rejects.toEqual({ message: 'connection refused' });
+  });
+});
+
 // ─────────────────────────────────────────────────────────────────────────────
 // TTL handling
 // ─────────────────────────────────────────────────────────────────────────────
@@ -171,8 +171,16 @@ router.get('/', authenticateJWT, asyncHandler(async (req, res) => {
   const limit = parseInt(req.query.limit) || 50;
   const offset = parseInt(req.query.offset) || 0;
   const status = req.query.status;
+  const updated_since = req.query.updated_since;
 
-  const result = await agentService.listAgents({ limit, offset, status });
+  if (updated_since !== undefined) {
+    const validation = agentValidator.validateUpdatedSince(updated_since);
+    if (!validation.valid) {
+      throw new APIError(validation.errors[0].message, 400);
+    }
+  }
+
+  const result = await agentService.listAgents({ limit, offset, status, updated_since });
 
   res.json(result);
 }));
@@ -158,14 +158,24 @@ router.post('/:webhook_id/toggle', authenticateJWT, asyncHandler(async (req, res
 
 /**
  * GET /webhooks/:webhook_id/deliveries
- * Get webhook delivery history
+ * Get webhook delivery history (?since=<ISO timestamp>&order=asc for incremental sync)
  */
 router.get('/:webhook_id/deliveries', authenticateJWT, asyncHandler(async (req, res) => {
   const { webhook_id } = req.params;
   const limit = parseInt(req.query.limit) || 50;
   const offset = parseInt(req.query.offset) || 0;
+  const order = req.query.order === 'asc' ? 'asc' : 'desc';
+
+  let since;
+  if (req.query.since) {
+    const sinceMs = Date.parse(req.query.since);
+    if (Number.isNaN(sinceMs)) {
+      throw new APIError('since must be an ISO 8601 timestamp', 400);
+    }
+    since = new Date(sinceMs).toISOString();
+  }
 
-  const result = await webhookService.getWebhookDeliveries(webhook_id, { limit, offset });
+  const result = await webhookService.getWebhookDeliveries(webhook_id, { limit, offset, since, order });
 
   res.json(result);
 }));
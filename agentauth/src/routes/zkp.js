@@ -90,6 +90,48 @@ router.post('/verify-anonymous', authLimiter, asyncHandler(async (req, res) => {
   res.json(result);
 }));
 
+/**
+ * POST /v1/zkp/verify-anonymous/batch
+ * Verify up to 100 commitments in one request, at most 10 of them in ZKP mode.
+ * Each item carries its own mode (default: body/query mode, then 'zkp').
+ * Always 200 with per-item results.
+ */
+router.post('/verify-anonymous/batch', authLimiter, asyncHandler(async (req, res) => {
+  // Validate input (may throw ZKPModeError)
+  const defaultMode = req.body.mode || req.query.mode || 'zkp';
+  const validation = zkpValidator.validateBatchVerification(req.body, defaultMode);
+
+  if (!validation.valid) {
+    throw new APIError('Validation failed', 400, validation.errors);
+  }
+
+  const items = req.body.items.map(({ commitment, mode, proof, publicSignals, preimage_hash }) => {
+    const itemMode = mode || defaultMode;
+    return {
+      commitment,
+      mode: itemMode,
+      proofData: itemMode === 'zkp' ? { proof, publicSignals } : { preimage_hash },
+    };
+  });
+
+  const results = await zkpService.verifyAnonymousBatch(items);
+  const validCount = results.filter(r => r.valid).length;
+
+  logger.info('ZKP batch anonymous verification', {
+    total: results.length,
+    valid: validCount,
+  });
+
+  // Prevent caching of verification responses
+  res.set('Cache-Control', 'no-store');
+
+  res.json({
+    results,
+    total: results.length,
+    valid_count: validCount,
+  });
+}));
+
 /**
  * DELETE /v1/zkp/commitment/:commitment
  * Revoke a commitment.
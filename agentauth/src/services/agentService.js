@@ -157,19 +157,28 @@ async function verifyAgent(agent_id, api_key) {
 }
 
 /**
- * List all agents with pagination
+ * List all agents with pagination.
+ * When updated_since is given, only agents changed after that timestamp are
+ * returned, oldest change first, so callers can advance an updated_at watermark.
  */
-async function listAgents({ limit = 50, offset = 0, status = null }) {
+async function listAgents({ limit = 50, offset = 0, status = null, updated_since = null }) {
   let query = supabase
     .from('agents')
-    .select('agent_id, name, description, owner_email, status, tier, created_at, last_verified_at', { count: 'exact' });
+    .select('agent_id, name, description, owner_email, permissions, status, tier, created_at, updated_at, last_verified_at', { count: 'exact' });
 
   if (status) {
     query = query.eq('status', status);
   }
 
+  if (updated_since) {
+    query = query
+      .gt('updated_at', updated_since)
+      .order('updated_at', { ascending: true });
+  } else {
+    query = query.order('created_at', { ascending: false });
+  }
+
   const { data, error, count } = await query
-    .order('created_at', { ascending: false })
     .range(offset, offset + limit - 1);
 
   if (error) {
@@ -192,14 +192,22 @@ async function recordWebhookDelivery({
 }
 
 /**
- * Get webhook delivery history
+ * Get webhook delivery history.
+ * With `since`, only deliveries recorded after that timestamp are returned,
+ * so callers can sync incrementally from a delivered_at watermark.
  */
-async function getWebhookDeliveries(webhook_id, { limit = 50, offset = 0 }) {
-  const { data, error, count } = await supabase
+async function getWebhookDeliveries(webhook_id, { limit = 50, offset = 0, since, order = 'desc' }) {
+  let query = supabase
     .from('webhook_deliveries')
     .select('*', { count: 'exact' })
-    .eq('webhook_id', webhook_id)
-    .order('delivered_at', { ascending: false })
+    .eq('webhook_id', webhook_id);
+
+  if (since) {
+    query = query.gt('delivered_at', since);
+  }
+
+  const { data, error, count } = await query
+    .order('delivered_at', { ascending: order === 'asc' })
     .range(offset, offset + limit - 1);
 
   if (error) {
@@ -211,6 +219,7 @@ async function getWebhookDeliveries(webhook_id, { limit = 50, offset = 0 }) {
     total: count,
     limit,
     offset,
+    since: since || null,
   };
 }
 
@@ -113,6 +113,13 @@ async function verifyAnonymous(commitment, proof, mode) {
     return { valid: false, reason: 'Commitment not found or revoked' };
   }
 
+  return verifyAgainstRecord(commitment, proof, mode, record);
+}
+
+/**
+ * Check TTL, then verify the proof against an active commitment record.
+ */
+function verifyAgainstRecord(commitment, proof, mode, record) {
   // Check TTL
   if (record.expires_at && new Date(record.expires_at) < new Date()) {
     return { valid: false, reason: 'Commitment has expired' };
@@ -126,6 +133,33 @@ async function verifyAnonymous(commitment, proof, mode) {
   return verifyHashMode(commitment, proof, record);
 }
 
+/**
+ * Verify many commitments in one call.
+ * Items are { commitment, mode, proofData } (proofData as for verifyAnonymous).
+ * All commitment records are fetched with a single query; results keep item order.
+ */
+async function verifyAnonymousBatch(items) {
+  const commitments = [...new Set(items.map(item => item.commitment))];
+
+  const { data: records, error } = await supabase
+    .from('zkp_commitments')
+    .select('*')
+    .eq('status', 'active')
+    .in('commitment', commitments);
+
+  if (error) throw error;
+
+  const recordsByCommitment = new Map((records || []).map(r => [r.commitment, r]));
+
+  return Promise.all(items.map(async ({ commitment, mode, proofData }) => {
+    const record = recordsByCommitment.get(commitment);
+    const result = record
+      ? await verifyAgainstRecord(commitment, proofData, mode, record)
+      : { valid: false, reason: 'Commitment not found or revoked' };
+    return { commitment, ...result };
+  }));
+}
+
 /**
  * Groth16 proof verification via snarkjs.
  */
@@ -286,6 +320,7 @@ module.exports = {
   registerCommitment,
   verifyAnonymous,
   verifyAnonymousSimple,
+  verifyAnonymousBatch,
   revokeCommitment,
   getVerificationKey,
   cleanupExpiredCommitments,
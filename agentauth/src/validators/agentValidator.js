@@ -178,10 +178,27 @@ function validatePermissions(permissions) {
   };
 }
 
+/**
+ * Validate the updated_since watermark of GET /agents (ISO 8601 timestamp)
+ */
+function validateUpdatedSince(updatedSince) {
+  const isoPattern = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$/;
+
+  if (typeof updatedSince !== 'string' || !isoPattern.test(updatedSince) || isNaN(new Date(updatedSince))) {
+    return {
+      valid: false,
+      errors: [{ field: 'updated_since', message: 'updated_since must be a valid ISO 8601 timestamp' }],
+    };
+  }
+
+  return { valid: true, errors: [] };
+}
+
 module.exports = {
   validateRegistration,
   validateVerification,
   validateTierUpdate,
   validateStatusUpdate,
   validatePermissions,
+  validateUpdatedSince,
 };
@@ -109,8 +109,50 @@ function validateAnonymousVerification(data) {
   };
 }
 
+const MAX_BATCH_VERIFICATIONS = 100;
+// A batch costs one rate-limit hit; Groth16 checks are far more expensive
+// than hash comparisons, so far fewer of them fit in one request.
+const MAX_BATCH_ZKP_VERIFICATIONS = 10;
+
+/**
+ * Validate batch anonymous verification input.
+ * Each item is validated like a single verification; `defaultMode` applies
+ * to items without their own mode. At most MAX_BATCH_ZKP_VERIFICATIONS items
+ * may use ZKP mode.
+ */
+function validateBatchVerification(data, defaultMode = 'zkp') {
+  const errors = [];
+
+  if (!Array.isArray(data.items) || data.items.length === 0) {
+    errors.push({ field: 'items', message: 'items must be a non-empty array' });
+  } else if (data.items.length > MAX_BATCH_VERIFICATIONS) {
+    errors.push({ field: 'items', message: `items cannot exceed ${MAX_BATCH_VERIFICATIONS} verifications` });
+  } else if (data.items.filter(item => ((item && item.mode) || defaultMode) === 'zkp').length > MAX_BATCH_ZKP_VERIFICATIONS) {
+    errors.push({ field: 'items', message: `items cannot exceed ${MAX_BATCH_ZKP_VERIFICATIONS} ZKP-mode verifications` });
+  } else {
+    data.items.forEach((item, index) => {
+      if (!item || typeof item !== 'object' || Array.isArray(item)) {
+        errors.push({ field: `items[${index}]`, message: 'Item must be an object' });
+        return;
+      }
+      const result = validateAnonymousVerification({ ...item, mode: item.mode || defaultMode });
+      result.errors.forEach(err => {
+        errors.push({ field: `items[${index}].${err.field}`, message: err.message });
+      });
+    });
+  }
+
+  return {
+    valid: errors.length === 0,
+    errors,
+  };
+}
+
 module.exports = {
   ZKPModeError,
+  MAX_BATCH_VERIFICATIONS,
+  MAX_BATCH_ZKP_VERIFICATIONS,
   validateCommitmentRegistration,
   validateAnonymousVerification,
+  validateBatchVerification,
 };